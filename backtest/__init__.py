@@ -8,7 +8,7 @@ RS 动量回测引擎 — 横截面动量选股回测框架
 from backtest.config import BacktestConfig, us_preset, crypto_preset
 from backtest.engine import BacktestEngine
 from backtest.portfolio import PortfolioState
-from backtest.metrics import compute_metrics
+from backtest.metrics import compute_metrics, compute_metrics_from_navs
 from backtest.rebalancer import Rebalancer
 from backtest.sweep import ParameterSweep
 
@@ -19,6 +19,7 @@ __all__ = [
     "BacktestEngine",
     "PortfolioState",
     "compute_metrics",
+    "compute_metrics_from_navs",
     "Rebalancer",
     "ParameterSweep",
 ]
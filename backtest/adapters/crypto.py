@@ -16,6 +16,9 @@ import numpy as np
 import pandas as pd
 from src.path_utils import resolve_shared_repo_root
 
+from backtest.adapters.crypto_rs import compute_crypto_rs_b, compute_crypto_rs_c
+from backtest.adapters.price_calendar import PriceCalendarMixin
+
 logger = logging.getLogger(__name__)
 
 # Finance 本地 crypto 缓存
@@ -31,6 +34,18 @@ _CACHE_DIRS = {
     "4h": _FINANCE_ROOT / "data" / "crypto" / "binance_4h_cache",
 }
 
+# 只读取回测/因子研究/择时用到的列 (跳过 close_time, trades, taker_* 等)
+_CSV_COLUMNS = frozenset({
+    "open_time", "timestamp", "date",
+    "open", "high", "low", "close", "volume", "quote_volume",
+})
+
+# RS 方法 → 计算函数 (模块级解析一次，引擎/参数扫描每个配置直接查表)
+_RS_FUNCTIONS: Dict[str, Callable] = {
+    "B": compute_crypto_rs_b,
+    "C": compute_crypto_rs_c,
+}
+
 
 def _normalize_interval(interval: str) -> str:
     value = interval.strip().lower()
@@ -41,7 +56,7 @@ def _normalize_interval(interval: str) -> str:
     raise ValueError(f"Unsupported crypto interval: {interval}")
 
 
-class CryptoAdapter:
+class CryptoAdapter(PriceCalendarMixin):
     """
     币安合约数据适配器
 
@@ -51,6 +66,8 @@ class CryptoAdapter:
     - 交易日期序列
     """
 
+    _MIN_ROWS = 15  # 币圈最小数据要求
+
     def __init__(
         self,
         symbols: Optional[List[str]] = None,
@@ -68,6 +85,9 @@ class CryptoAdapter:
         self._symbols = symbols
         self.interval = _normalize_interval(interval)
         self._cache_dir = cache_dir or _CACHE_DIRS[self.interval]
+        self._date_fmt = "%Y-%m-%d" if self.interval == "1d" else "%Y-%m-%d %H:%M:%S"
+
+        self._init_arrays()
 
     def load_all(self) -> Dict[str, pd.DataFrame]:
         """
@@ -86,25 +106,26 @@ class CryptoAdapter:
 
         for sym in symbols:
             df = self._load_csv(sym)
-            if df is not None and len(df) >= 15:  # 币圈最小数据要求
+            if df is not None and len(df) >= self._MIN_ROWS:
                 self._price_cache[sym] = df
 
         logger.info(f"币安适配器: 加载 {len(self._price_cache)} 只标的")
         return self._price_cache
 
-    def get_trading_dates(self) -> List[str]:
-        """获取全部交易日期序列"""
-        if not self._price_cache:
-            self.load_all()
-
-        all_dates = set()
-        for df in self._price_cache.values():
-            all_dates.update(df["date"].astype(str).tolist())
-
-        return sorted(all_dates)
-
     def get_benchmark_nav(self, symbol: str = "BTCUSDT") -> List[Tuple[str, float]]:
         """获取基准 NAV 序列"""
+        dates, navs = self.get_benchmark_arrays(symbol)
+        return list(zip(dates.tolist(), navs.tolist()))
+
+    def get_benchmark_arrays(
+        self, symbol: str = "BTCUSDT"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        获取基准 NAV 序列 (数组形式)
+
+        Returns:
+            (dates, navs) — 升序日期字符串数组 + float64 数组；不可用时为两个空数组
+        """
         if not self._price_cache:
             self.load_all()
 
@@ -113,29 +134,25 @@ class CryptoAdapter:
             df = self._load_csv(symbol)
         if df is None or df.empty:
             logger.warning(f"基准 {symbol} 数据不可用")
-            return []
+            return np.array([], dtype=str), np.array([], dtype=np.float64)
 
-        return list(zip(df["date"].astype(str), df["close"].astype(float)))
+        return (
+            df["date"].astype(str).to_numpy(dtype=str),
+            df["close"].to_numpy(dtype=np.float64),
+        )
 
     def slice_to_date(self, date: str) -> Dict[str, np.ndarray]:
         """
         防前视：对所有币种截取到指定日期
 
         Returns:
-            {symbol: close_prices_array} — 适配 crypto_rs 输入格式
+            {symbol: close_prices_array} — 适配 crypto_rs 输入格式；
+            数组是缓存的只读视图，调用方需要修改时自行 copy
         """
-        if not self._price_cache:
-            self.load_all()
-
-        sliced = {}
-        cutoff = pd.to_datetime(date)
-        for sym, df in self._price_cache.items():
-            mask = pd.to_datetime(df["date"]) <= cutoff
-            cut = df[mask]
-            if len(cut) >= 15:  # 币圈最小数据要求
-                sliced[sym] = cut["close"].values.astype(np.float64)
-
-        return sliced
+        return {
+            sym: self._close_arr[sym][:end]  # 只读视图, 零拷贝
+            for sym, end in self.slice_indices(date).items()
+        }
 
     def slice_to_date_df(self, date: str) -> Dict[str, pd.DataFrame]:
         """
@@ -144,31 +161,11 @@ class CryptoAdapter:
         Returns:
             {symbol: DataFrame[date, close, volume, ...]}
         """
-        if not self._price_cache:
-            self.load_all()
-
-        sliced = {}
-        cutoff = pd.to_datetime(date)
-        for sym, df in self._price_cache.items():
-            mask = pd.to_datetime(df["date"]) <= cutoff
-            cut = df[mask]
-            if len(cut) >= 15:
-                sliced[sym] = cut.reset_index(drop=True)
-
-        return sliced
-
-    def get_prices_at(self, date: str) -> Dict[str, float]:
-        """获取指定日期的收盘价"""
-        if not self._price_cache:
-            self.load_all()
-
-        prices = {}
-        for sym, df in self._price_cache.items():
-            row = df[df["date"].astype(str) == date]
-            if not row.empty:
-                prices[sym] = float(row.iloc[-1]["close"])
-
-        return prices
+        # 缓存 df 已是 RangeIndex，前缀 iloc 无需 reset_index
+        return {
+            sym: self._price_cache[sym].iloc[:end]
+            for sym, end in self.slice_indices(date).items()
+        }
 
     def get_rs_function(self, method: str) -> Callable:
         """
@@ -177,23 +174,14 @@ class CryptoAdapter:
         Args:
             method: "B" 或 "C"
         """
-        from backtest.adapters.crypto_rs import (
-            compute_crypto_rs_b,
-            compute_crypto_rs_c,
-        )
-        if method == "C":
-            return compute_crypto_rs_c
-        return compute_crypto_rs_b
-
-    def get_date_range(self) -> Tuple[str, str]:
-        """返回数据的起止日期"""
-        dates = self.get_trading_dates()
-        if not dates:
-            return ("", "")
-        return (dates[0], dates[-1])
+        return _RS_FUNCTIONS.get(method, compute_crypto_rs_b)
 
     # ── 内部方法 ──────────────────────────────────────
 
+    def _normalize_cutoff(self, date: str) -> str:
+        """把截止日期规范成与 date 列相同的字符串格式 (4h 下 "YYYY-MM-DD" → 当日 00:00:00)"""
+        return pd.Timestamp(date).strftime(self._date_fmt)
+
     def _discover_symbols(self) -> List[str]:
         """自动发现 cache 目录下所有 CSV"""
         if not self._cache_dir.exists():
@@ -208,7 +196,9 @@ class CryptoAdapter:
             return None
 
         try:
-            df = pd.read_csv(csv_path)
+            df = pd.read_csv(
+                csv_path, usecols=lambda c: c in _CSV_COLUMNS, engine="c",
+            )
 
             # 兼容不同格式的列名
             dt_series = None
@@ -224,8 +214,7 @@ class CryptoAdapter:
                 dt_series = pd.to_datetime(df["date"], utc=False)
 
             if dt_series is not None:
-                fmt = "%Y-%m-%d" if self.interval == "1d" else "%Y-%m-%d %H:%M:%S"
-                df["date"] = dt_series.dt.strftime(fmt)
+                df["date"] = dt_series.dt.strftime(self._date_fmt)
 
             if "date" not in df.columns or "close" not in df.columns:
                 logger.warning(f"{symbol}: CSV 缺少 date/close 列")
@@ -235,8 +224,9 @@ class CryptoAdapter:
                 if col in df.columns:
                     df[col] = df[col].astype(float)
 
-            df["_sort_dt"] = pd.to_datetime(df["date"])
-            df = df.sort_values("_sort_dt", ascending=True).drop(columns="_sort_dt")
+            # date 已规范为 ISO 字符串，字典序即时间序；Binance 缓存通常已升序，只做 O(n) 检查
+            if not df["date"].is_monotonic_increasing:
+                df = df.sort_values("date", ascending=True, kind="stable")
             df = df.reset_index(drop=True)
             return df
         except Exception as e:
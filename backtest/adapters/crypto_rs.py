@@ -11,7 +11,7 @@
 
 import numpy as np
 import pandas as pd
-from scipy.stats import rankdata, zscore as scipy_zscore, linregress
+from scipy.stats import rankdata
 from typing import Dict
 
 
@@ -26,6 +26,23 @@ CRYPTO_RS_CONFIG = {
 }
 
 
+def _fast_rank(x: np.ndarray) -> np.ndarray:
+    """
+    平均秩 (1..n)，等价于 rankdata(x, method="average")
+
+    无并列且无 NaN 时直接用一次 argsort 回填秩；否则回退 rankdata 处理并列/NaN。
+    """
+    x = np.asarray(x, dtype=np.float64)
+    order = np.argsort(x, kind="stable")
+    sx = x[order]
+    if np.isnan(sx[-1]) or np.any(sx[1:] == sx[:-1]):
+        return rankdata(x, method="average")
+
+    ranks = np.empty(len(x), dtype=np.float64)
+    ranks[order] = np.arange(1, len(x) + 1)
+    return ranks
+
+
 def compute_crypto_rs_b(price_dict: Dict[str, np.ndarray]) -> pd.DataFrame:
     """
     Method B — 风险调整 Z-Score (7d/3d/1d)
@@ -45,8 +62,11 @@ def compute_crypto_rs_b(price_dict: Dict[str, np.ndarray]) -> pd.DataFrame:
     min_days = cfg["min_data_days"]
     ann = np.sqrt(cfg["annual_factor"])
 
-    records = []
-
+    # 每个标的只需 [end_idx - w_long, end_idx] 共 w_long+1 个收盘价，
+    # 逐行写入预分配的 (n_symbols, w_long+1) 矩阵后一次性向量化计算
+    symbols = np.empty(len(price_dict), dtype=object)
+    tile = np.empty((len(price_dict), w_long + 1), dtype=np.float64)
+    n_valid = 0
     for symbol, close in price_dict.items():
         n = len(close)
         if n < min_days:
@@ -56,46 +76,51 @@ def compute_crypto_rs_b(price_dict: Dict[str, np.ndarray]) -> pd.DataFrame:
         if end_idx < 0 or (end_idx - w_long) < 0:
             continue
 
-        # 收益率
-        ret_7d = close[end_idx] / close[end_idx - w_long] - 1
-        ret_3d = close[end_idx] / close[end_idx - w_mid] - 1
-        ret_1d = close[end_idx] / close[end_idx - w_short] - 1
-
-        # 风险调整 (仅 7d)
-        daily_returns = np.diff(close) / close[:-1]
-        vol_start = max(0, end_idx - w_long)
-        vol_7d = np.std(daily_returns[vol_start:end_idx], ddof=1) * ann
-
-        ra_7d = ret_7d / vol_7d if vol_7d > 1e-10 else 0.0
-        ra_3d = ret_3d
-        ra_1d = ret_1d
-
-        records.append({
-            "symbol": symbol,
-            "ret_7d": ret_7d,
-            "ret_3d": ret_3d,
-            "ret_1d": ret_1d,
-            "_ra_7d": ra_7d,
-            "_ra_3d": ra_3d,
-            "_ra_1d": ra_1d,
-        })
-
-    if not records:
+        symbols[n_valid] = symbol
+        tile[n_valid] = close[end_idx - w_long:end_idx + 1]
+        n_valid += 1
+
+    if n_valid == 0:
         return pd.DataFrame(columns=[
             "symbol", "ret_7d", "ret_3d", "ret_1d",
             "z_7d", "z_3d", "z_1d", "composite", "rs_rank",
         ])
 
-    df = pd.DataFrame(records)
-
-    if len(df) <= 1:
-        df["z_7d"] = 0.0
-        df["z_3d"] = 0.0
-        df["z_1d"] = 0.0
+    symbols = symbols[:n_valid]
+    tile = tile[:n_valid]
+    last = tile[:, -1]
+
+    # 收益率
+    ret_7d = last / tile[:, 0] - 1
+    ret_3d = last / tile[:, -1 - w_mid] - 1
+    ret_1d = last / tile[:, -1 - w_short] - 1
+
+    # 风险调整 (仅 7d): 日收益只在 w_long 窗口内计算，原地减 1 省一次临时数组
+    daily_returns = tile[:, 1:] / tile[:, :-1]
+    daily_returns -= 1
+    vol_7d = np.std(daily_returns, axis=1, ddof=1) * ann
+    safe_vol = np.where(vol_7d > 1e-10, vol_7d, 1.0)
+    ra_7d = np.where(vol_7d > 1e-10, ret_7d / safe_vol, 0.0)
+
+    df = pd.DataFrame({
+        "symbol": symbols,
+        "ret_7d": ret_7d,
+        "ret_3d": ret_3d,
+        "ret_1d": ret_1d,
+    })
+
+    # 三列风险调整收益一次性标准化: (n, 3) 矩阵按列 z-score
+    if n_valid <= 1:
+        z = np.zeros((n_valid, 3))
     else:
-        df["z_7d"] = np.clip(scipy_zscore(df["_ra_7d"], ddof=1), -3, 3)
-        df["z_3d"] = np.clip(scipy_zscore(df["_ra_3d"], ddof=1), -3, 3)
-        df["z_1d"] = np.clip(scipy_zscore(df["_ra_1d"], ddof=1), -3, 3)
+        ra = np.column_stack((ra_7d, ret_3d, ret_1d))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = np.clip(
+                (ra - ra.mean(axis=0)) / ra.std(axis=0, ddof=1), -3, 3,
+            )
+    df["z_7d"] = z[:, 0]
+    df["z_3d"] = z[:, 1]
+    df["z_1d"] = z[:, 2]
 
     df["composite"] = (
         0.40 * df["z_7d"]
@@ -106,38 +131,50 @@ def compute_crypto_rs_b(price_dict: Dict[str, np.ndarray]) -> pd.DataFrame:
     if len(df) <= 1:
         df["rs_rank"] = 50
     else:
-        pct = rankdata(df["composite"], method="average") / len(df)
+        pct = _fast_rank(df["composite"].to_numpy()) / len(df)
         df["rs_rank"] = np.clip(np.floor(pct * 100).astype(int), 0, 99)
 
-    df = df[[
-        "symbol", "ret_7d", "ret_3d", "ret_1d",
-        "z_7d", "z_3d", "z_1d", "composite", "rs_rank",
-    ]].reset_index(drop=True)
-
     return df
 
 
-def _clenow_momentum_crypto(prices: np.ndarray, window: int) -> float:
-    """Clenow 动量 (币圈版, 年化365天)"""
-    if window < 2 or len(prices) < window:
-        return 0.0
+def _clenow_batch(tile: np.ndarray, window: int) -> np.ndarray:
+    """
+    Clenow 动量 (币圈版, 年化365天) — 批量闭式 OLS
 
-    tail = prices[-window:]
-    if np.any(tail <= 0):
-        return 0.0
+    对 x = arange(window) 的一元回归，斜率与 R² 有闭式解，
+    一次 NumPy 归约即可覆盖全部标的，无需逐个调用 linregress。
 
-    log_prices = np.log(tail)
-    x = np.arange(window)
+    Args:
+        tile: (n_symbols, window) 尾部收盘价矩阵
+        window: 回归窗口
 
-    try:
-        slope, _, r_value, _, _ = linregress(x, log_prices)
-    except Exception:
-        return 0.0
+    Returns:
+        (n_symbols,) annualized * R²；窗口 < 2 或含非正价格的行为 0
+    """
+    n = tile.shape[0]
+    if window < 2 or n == 0:
+        return np.zeros(n)
 
-    r_squared = r_value ** 2
-    annualized = (np.exp(slope) ** 365) - 1
-    annualized = np.clip(annualized, -10, 100)
-    return annualized * r_squared
+    valid = np.all(tile > 0, axis=1)
+    lp = np.log(np.where(valid[:, None], tile, 1.0))
+
+    xc = np.arange(window, dtype=np.float64)
+    xc -= xc.mean()
+    ss_x = (xc ** 2).sum()
+
+    yc = lp - lp.mean(axis=1, keepdims=True)
+    sxy = yc @ xc
+    ss_y = (yc ** 2).sum(axis=1)
+
+    slope = sxy / ss_x
+    denom = ss_x * ss_y
+    r_squared = np.divide(
+        sxy ** 2, denom, out=np.zeros(n), where=denom > 0,
+    )
+
+    # exp(slope) ** 365 == exp(365 * slope)，单次超越函数
+    annualized = np.clip(np.expm1(365 * slope), -10, 100)
+    return np.where(valid, annualized * r_squared, 0.0)
 
 
 def compute_crypto_rs_c(price_dict: Dict[str, np.ndarray]) -> pd.DataFrame:
@@ -156,30 +193,31 @@ def compute_crypto_rs_c(price_dict: Dict[str, np.ndarray]) -> pd.DataFrame:
     w_short = cfg["window_short"]
     min_days = cfg["min_data_days"]
 
-    records = []
-
+    symbols = np.empty(len(price_dict), dtype=object)
+    tile = np.empty((len(price_dict), w_long), dtype=np.float64)
+    n_valid = 0
     for symbol, close in price_dict.items():
         if len(close) < min_days:
             continue
+        symbols[n_valid] = symbol
+        tile[n_valid] = close[-w_long:]
+        n_valid += 1
 
-        c7 = _clenow_momentum_crypto(close, w_long)
-        c3 = _clenow_momentum_crypto(close, w_mid)
-        c1 = _clenow_momentum_crypto(close, w_short)
-
-        records.append({
-            "symbol": symbol,
-            "clenow_7d": c7,
-            "clenow_3d": c3,
-            "clenow_1d": c1,
-        })
-
-    if not records:
+    if n_valid == 0:
         return pd.DataFrame(columns=[
             "symbol", "clenow_7d", "clenow_3d", "clenow_1d",
             "composite", "rs_rank",
         ])
 
-    df = pd.DataFrame(records)
+    symbols = symbols[:n_valid]
+    tile = tile[:n_valid]
+
+    df = pd.DataFrame({
+        "symbol": symbols,
+        "clenow_7d": _clenow_batch(tile, w_long),
+        "clenow_3d": _clenow_batch(tile[:, -w_mid:], w_mid),
+        "clenow_1d": _clenow_batch(tile[:, -w_short:], w_short),
+    })
 
     df["composite"] = (
         0.50 * df["clenow_7d"]
@@ -190,7 +228,7 @@ def compute_crypto_rs_c(price_dict: Dict[str, np.ndarray]) -> pd.DataFrame:
     if len(df) <= 1:
         df["rs_rank"] = 50
     else:
-        pct = rankdata(df["composite"], method="average") / len(df)
+        pct = _fast_rank(df["composite"].to_numpy()) / len(df)
         df["rs_rank"] = np.clip(np.floor(pct * 100).astype(int), 0, 99)
 
     df = df[[
@@ -0,0 +1,196 @@
+"""
+价格日历混入 — 美股 / 币圈适配器共用的日期数组侧表与防前视切片
+
+子类需提供:
+- _price_cache: {symbol: DataFrame[date, close, ...]}，按日期升序
+- load_all(): 填充 _price_cache
+- _MIN_ROWS: 切片时每个标的的最小行数
+- _normalize_cutoff(date): 可选，把截止日期规范成 date 列的字符串格式
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class PriceCalendarMixin:
+    """
+    基于 _price_cache 懒构建 date/close 数组侧表，提供:
+    - 交易日期序列 (并集) 与回测主日历
+    - 按日期切片的行数 (每个共享日历只 searchsorted 一次)
+    - 指定日期的收盘价
+    """
+
+    _MIN_ROWS = 1
+
+    _price_cache: Dict[str, pd.DataFrame]
+
+    def _init_arrays(self) -> None:
+        """初始化数组侧表 (由 _ensure_arrays 懒构建)"""
+        self._arrays_source: Optional[Dict[str, pd.DataFrame]] = None
+        self._date_arr: Dict[str, np.ndarray] = {}
+        self._close_arr: Dict[str, np.ndarray] = {}
+        self._calendars: List[np.ndarray] = []
+        self._calendar_of: Dict[str, int] = {}
+        self._trading_dates: Optional[List[str]] = None
+
+    def prepare(self) -> None:
+        """
+        预构建数组侧表与交易日并集
+
+        并行扫描 / Walk-Forward 在创建进程池前于父进程调用，
+        fork 出的 worker 写时复制继承，不在每个进程各建一份。
+        """
+        self._ensure_arrays()
+        self.get_trading_dates()
+
+    def get_trading_dates(self) -> List[str]:
+        """
+        获取全部交易日期序列 (所有标的的日期并集，排序；首次计算后缓存)
+
+        Returns:
+            ["2021-01-04", "2021-01-05", ...]
+        """
+        self._ensure_arrays()
+
+        if self._trading_dates is None:
+            if self._date_arr:
+                self._trading_dates = np.unique(
+                    np.concatenate(self._calendars)
+                ).tolist()
+            else:
+                self._trading_dates = []
+
+        return list(self._trading_dates)
+
+    def master_calendar(self, prefer: Optional[str] = None) -> np.ndarray:
+        """
+        回测主日历：直接取基准标的 (prefer) 的日期数组，不在数据中时取行数最多的日历，
+        省去对全部标的求并集
+
+        候选日历未覆盖全体数据的首尾日期 (如基准晚上市) 时回退到 get_trading_dates() 并集。
+
+        Returns:
+            升序日期字符串数组
+        """
+        self._ensure_arrays()
+
+        calendars = [c for c in self._calendars if len(c)]
+        if not calendars:
+            return np.array([], dtype=str)
+
+        if prefer in self._calendar_of:
+            calendar = self._calendars[self._calendar_of[prefer]]
+        else:
+            calendar = max(calendars, key=len)
+
+        first = min(c[0] for c in calendars)
+        last = max(c[-1] for c in calendars)
+        if len(calendar) and calendar[0] <= first and calendar[-1] >= last:
+            return calendar
+        return np.asarray(self.get_trading_dates(), dtype=str)
+
+    def slice_indices(self, date: str) -> Dict[str, int]:
+        """
+        防前视：每个标的截止到指定日期 (含) 的行数
+
+        Returns:
+            {symbol: end} — 前 end 行 (<= date)，只含 end >= _MIN_ROWS 的标的
+        """
+        self._ensure_arrays()
+
+        cutoff = self._normalize_cutoff(date)
+        calendar_ends = [
+            int(np.searchsorted(dates, cutoff, side="right"))
+            for dates in self._calendars
+        ]
+
+        ends = {}
+        for sym, bucket in self._calendar_of.items():
+            end = calendar_ends[bucket]
+            if end >= self._MIN_ROWS:
+                ends[sym] = end
+
+        return ends
+
+    def get_prices_at(self, date: str) -> Dict[str, float]:
+        """
+        获取指定日期的收盘价
+
+        Args:
+            date: 日期字符串 (与 date 列格式一致)
+
+        Returns:
+            {symbol: close_price}
+        """
+        self._ensure_arrays()
+
+        # 每个日历 searchsorted 一次，精确命中才取价 (重复日期取最后一行)
+        rows = []
+        for dates in self._calendars:
+            idx = int(np.searchsorted(dates, date, side="right")) - 1
+            rows.append(idx if idx >= 0 and dates[idx] == date else -1)
+
+        return {
+            sym: float(self._close_arr[sym][rows[bucket]])
+            for sym, bucket in self._calendar_of.items()
+            if rows[bucket] >= 0
+        }
+
+    def get_date_range(self) -> Tuple[str, str]:
+        """返回数据的起止日期"""
+        dates = self.get_trading_dates()
+        if not dates:
+            return ("", "")
+        return (dates[0], dates[-1])
+
+    # ── 内部方法 ──────────────────────────────────────
+
+    def _normalize_cutoff(self, date: str) -> str:
+        """把截止日期规范成与 date 列相同的字符串格式 (默认原样)"""
+        return date
+
+    def _ensure_arrays(self) -> None:
+        """
+        为 _price_cache 构建 date/close 数组侧表
+
+        - _date_arr[sym]: 升序日期字符串数组 (供 searchsorted 切片)
+        - _close_arr[sym]: 连续 float64 收盘价数组 (只读)
+        - _calendars / _calendar_of[sym]: 日期完全相同的标的共享同一日历，
+          切片时每个日历只 searchsorted 一次
+
+        _price_cache 被替换或增删标的时自动重建 (连带清空交易日缓存)。
+        """
+        if not self._price_cache:
+            self.load_all()
+        if (
+            self._arrays_source is self._price_cache
+            and len(self._date_arr) == len(self._price_cache)
+        ):
+            return
+
+        self._date_arr = {}
+        self._close_arr = {}
+        self._calendars = []
+        self._calendar_of = {}
+        self._trading_dates = None
+        # (长度, 首日, 末日) → 候选日历下标，命中后再逐元素确认
+        calendar_index: Dict[Tuple[int, str, str], List[int]] = defaultdict(list)
+        for sym, df in self._price_cache.items():
+            dates = df["date"].astype(str).to_numpy(dtype=str)
+            key = (len(dates), dates[0], dates[-1]) if len(dates) else (0, "", "")
+            for bucket in calendar_index[key]:
+                if np.array_equal(self._calendars[bucket], dates):
+                    break
+            else:
+                bucket = len(self._calendars)
+                self._calendars.append(dates)
+                calendar_index[key].append(bucket)
+            self._calendar_of[sym] = bucket
+            self._date_arr[sym] = self._calendars[bucket]
+            close = np.ascontiguousarray(df["close"].to_numpy(dtype=np.float64))
+            close.flags.writeable = False  # 切片直接返回其视图
+            self._close_arr[sym] = close
+        self._arrays_source = self._price_cache
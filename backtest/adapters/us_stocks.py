@@ -8,10 +8,18 @@ from typing import Callable, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from backtest.adapters.price_calendar import PriceCalendarMixin
 from backtest.pipeline.paths import resolve_shared_data_root
+from src.indicators.rs_rating import compute_rs_rating_b, compute_rs_rating_c
 
 logger = logging.getLogger(__name__)
 
+# RS 方法 → 计算函数 (模块级解析一次，引擎/参数扫描每个配置直接查表)
+_RS_FUNCTIONS: Dict[str, Callable] = {
+    "B": compute_rs_rating_b,
+    "C": compute_rs_rating_c,
+}
+
 
 def _get_market_store():
     from src.data.market_store import get_store
@@ -25,7 +33,7 @@ def _get_bulk_mcaps(date: str) -> Dict[str, float]:
     return _get_market_store().get_bulk_market_caps_at(date)
 
 
-class USStocksAdapter:
+class USStocksAdapter(PriceCalendarMixin):
     """
     美股数据适配器
 
@@ -35,6 +43,8 @@ class USStocksAdapter:
     - 交易日期序列
     """
 
+    _MIN_ROWS = 70  # RS 最小数据要求
+
     def __init__(
         self,
         symbols: Optional[List[str]] = None,
@@ -56,6 +66,8 @@ class USStocksAdapter:
         self._universe = universe
         self._mcap_threshold = mcap_threshold
 
+        self._init_arrays()
+
     def load_all(self) -> Dict[str, pd.DataFrame]:
         """
         加载全部价格数据
@@ -73,47 +85,56 @@ class USStocksAdapter:
 
         for sym in symbols:
             df = self._load_prices(sym)
-            if df is not None and len(df) >= 70:
+            if df is not None and len(df) >= self._MIN_ROWS:
                 self._price_cache[sym] = df
 
         logger.info(f"美股适配器: 加载 {len(self._price_cache)} 只股票")
         return self._price_cache
 
-    def get_trading_dates(self) -> List[str]:
+    def get_benchmark_nav(self, symbol: str = "SPY") -> List[Tuple[str, float]]:
         """
-        获取全部交易日期序列 (所有股票的日期并集，排序)
+        获取基准的 NAV 序列
+
+        Args:
+            symbol: 基准代码。"POOL_AVG" 为哨兵值，合成池内等权 NAV。
 
         Returns:
-            ["2021-01-04", "2021-01-05", ...]
+            [(date_str, nav_float), ...]
         """
-        if not self._price_cache:
-            self.load_all()
-
-        all_dates = set()
-        for df in self._price_cache.values():
-            all_dates.update(df["date"].astype(str).tolist())
+        if symbol == "POOL_AVG":
+            return self._compute_pool_avg_nav()
 
-        return sorted(all_dates)
+        dates, navs = self.get_benchmark_arrays(symbol)
+        return list(zip(dates.tolist(), navs.tolist()))
 
-    def get_benchmark_nav(self, symbol: str = "SPY") -> List[Tuple[str, float]]:
+    def get_benchmark_arrays(
+        self, symbol: str = "SPY"
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        获取基准的 NAV 序列
+        获取基准的 NAV 序列 (数组形式)
 
         Args:
             symbol: 基准代码。"POOL_AVG" 为哨兵值，合成池内等权 NAV。
 
         Returns:
-            [(date_str, nav_float), ...]
+            (dates, navs) — 升序日期字符串数组 + float64 数组；不可用时为两个空数组
         """
         if symbol == "POOL_AVG":
-            return self._compute_pool_avg_nav()
+            nav = self._compute_pool_avg_nav()
+            return (
+                np.array([d for d, _ in nav], dtype=str),
+                np.array([v for _, v in nav], dtype=np.float64),
+            )
 
         df = self._load_prices(symbol)
         if df is None or df.empty:
             logger.warning(f"基准 {symbol} 数据不可用")
-            return []
+            return np.array([], dtype=str), np.array([], dtype=np.float64)
 
-        return list(zip(df["date"].astype(str), df["close"].astype(float)))
+        return (
+            df["date"].astype(str).to_numpy(dtype=str),
+            df["close"].to_numpy(dtype=np.float64),
+        )
 
     def get_index_prices(self, symbol: str = "SPY") -> pd.Series:
         """
@@ -183,15 +204,11 @@ class USStocksAdapter:
         Returns:
             {symbol: sliced_df}
         """
-        if not self._price_cache:
-            self.load_all()
-
-        sliced = {}
-        for sym, df in self._price_cache.items():
-            mask = df["date"].astype(str) <= date
-            cut = df[mask]
-            if len(cut) >= 70:  # RS 最小数据要求
-                sliced[sym] = cut.reset_index(drop=True)
+        # 缓存 df 已是 RangeIndex，前缀 iloc 无需 reset_index
+        sliced = {
+            sym: self._price_cache[sym].iloc[:end]
+            for sym, end in self.slice_indices(date).items()
+        }
 
         # ── universe reconstitution ──
         if self._mcap_threshold and sliced:
@@ -226,27 +243,6 @@ class USStocksAdapter:
 
         return sliced
 
-    def get_prices_at(self, date: str) -> Dict[str, float]:
-        """
-        获取指定日期的收盘价
-
-        Args:
-            date: 日期字符串
-
-        Returns:
-            {symbol: close_price}
-        """
-        if not self._price_cache:
-            self.load_all()
-
-        prices = {}
-        for sym, df in self._price_cache.items():
-            row = df[df["date"].astype(str) == date]
-            if not row.empty:
-                prices[sym] = float(row.iloc[-1]["close"])
-
-        return prices
-
     def get_rs_function(self, method: str) -> Callable:
         """
         获取 RS 计算函数
@@ -257,20 +253,7 @@ class USStocksAdapter:
         Returns:
             compute_rs_rating_b 或 compute_rs_rating_c
         """
-        from src.indicators.rs_rating import (
-            compute_rs_rating_b,
-            compute_rs_rating_c,
-        )
-        if method == "C":
-            return compute_rs_rating_c
-        return compute_rs_rating_b
-
-    def get_date_range(self) -> Tuple[str, str]:
-        """返回数据的起止日期"""
-        dates = self.get_trading_dates()
-        if not dates:
-            return ("", "")
-        return (dates[0], dates[-1])
+        return _RS_FUNCTIONS.get(method, compute_rs_rating_b)
 
     # ── 内部方法 ──────────────────────────────────────
 
@@ -305,8 +288,13 @@ class USStocksAdapter:
             if df is None or df.empty:
                 return None
             # Ensure ascending order for backtest
-            df = df.sort_values("date", ascending=True).reset_index(drop=True)
-            return df
+            # market_store 按日期降序返回 → 直接反转，避免 O(n log n) 排序
+            dates = df["date"]
+            if dates.is_monotonic_decreasing:
+                df = df.iloc[::-1]
+            elif not dates.is_monotonic_increasing:
+                df = df.sort_values("date", ascending=True, kind="stable")
+            return df.reset_index(drop=True)
         except Exception as e:
             logger.warning("%s: 加载失败: %s", symbol, e)
             return None
@@ -137,6 +137,7 @@ class FactorStudyConfig:
     oos_start_date: Optional[str] = None         # 显式 OOS 起点 (YYYY-MM-DD), 优先于 oos_fraction
     oos_fraction: float = 0.3                    # 若未显式指定 OOS 起点，则最后 30% 的日期作为 OOS
     min_oos_dates: int = 50         # OOS 最少计算日数，不够则跳过 OOS
+    n_jobs: Optional[int] = 1       # 因子分析并行进程数: 1=串行, None/-1=全部 CPU 核
 
     def __post_init__(self):
         if not self.forward_horizons:
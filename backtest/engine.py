@@ -2,8 +2,8 @@
 BacktestEngine — 核心回测循环（市场无关）
 
 流程:
-  for date in trading_dates:
-      if date in rebalance_set:
+  for i, date in enumerate(trading_dates):
+      if i % freq_days == 0:
           sliced = adapter.slice_to_date(date)    # ← 防前视
           rs_df = rs_func(sliced)
           action = rebalancer.compute(rs_df, holdings)
@@ -13,13 +13,21 @@ BacktestEngine — 核心回测循环（市场无关）
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from backtest.adapters.crypto import CryptoAdapter
+from backtest.adapters.us_stocks import USStocksAdapter
 from backtest.config import BacktestConfig, FREQ_DAYS
-from backtest.metrics import BacktestMetrics, compute_metrics, TRADING_DAYS_PER_YEAR, CALENDAR_DAYS_PER_YEAR
+from backtest.metrics import (
+    BacktestMetrics,
+    compute_metrics,
+    compute_metrics_from_navs,
+    TRADING_DAYS_PER_YEAR,
+    CALENDAR_DAYS_PER_YEAR,
+)
 from backtest.portfolio import PortfolioState
 from backtest.rebalancer import Rebalancer
 
@@ -33,14 +41,23 @@ class BacktestEngine:
     通过 adapter 抽象层支持美股和币安合约两个市场。
     """
 
-    def __init__(self, config: BacktestConfig, adapter=None):
+    def __init__(
+        self,
+        config: BacktestConfig,
+        adapter=None,
+        rs_cache: Optional[Dict[Tuple[str, str], pd.DataFrame]] = None,
+    ):
         """
         Args:
             config: BacktestConfig 回测配置
             adapter: USStocksAdapter 或 CryptoAdapter 实例
                      如果为 None，根据 config.market 自动创建
+            rs_cache: 跨引擎共享的 RS 结果缓存 {(rs_method, date): rs_df}。
+                     RS 只取决于 adapter 数据 + 方法 + 日期，参数扫描中
+                     共享同一 adapter 的引擎可复用。None = 不缓存
         """
         self.config = config
+        self._rs_cache = rs_cache
 
         if adapter is None:
             adapter = self._create_adapter()
@@ -67,6 +84,16 @@ class BacktestEngine:
                 logger.warning(f"Regime index {config.regime_symbol} 无数据, regime filter 禁用")
                 self._regime_index = None
 
+        # Regime index 拆成升序日期数组 + float64 收盘价数组，_check_regime 用 searchsorted 定位
+        self._regime_dates: Optional[np.ndarray] = None
+        self._regime_closes: Optional[np.ndarray] = None
+        if self._regime_index is not None:
+            idx = self._regime_index
+            if not idx.index.is_monotonic_increasing:
+                idx = idx.sort_index()
+            self._regime_dates = idx.index.astype(str).to_numpy(dtype=str)
+            self._regime_closes = idx.to_numpy(dtype=np.float64)
+
         # Regime 统计
         self._regime_on_count = 0
         self._regime_off_count = 0
@@ -80,38 +107,45 @@ class BacktestEngine:
         Returns:
             BacktestMetrics — 完整绩效指标
         """
-        # 加载数据
+        # 加载数据: 主日历优先取基准标的日期 (免去全体标的求并集)
         self.adapter.load_all()
-        trading_dates = self.adapter.get_trading_dates()
+        if hasattr(self.adapter, "master_calendar"):
+            calendar = self.adapter.master_calendar(self.config.benchmark_symbol)
+        else:
+            calendar = np.asarray(self.adapter.get_trading_dates(), dtype=str)
 
-        if not trading_dates:
+        if len(calendar) == 0:
             logger.error("无交易日期数据")
             return compute_metrics([], n_trades=0)
 
-        # 应用日期过滤
+        # 应用日期过滤 (日历升序，searchsorted 截取区间)
+        lo, hi = 0, len(calendar)
         if self.config.start_date:
-            trading_dates = [d for d in trading_dates if d >= self.config.start_date]
+            lo = int(np.searchsorted(calendar, self.config.start_date, side="left"))
         if self.config.end_date:
-            trading_dates = [d for d in trading_dates if d <= self.config.end_date]
+            hi = int(np.searchsorted(calendar, self.config.end_date, side="right"))
+        trading_dates = calendar[lo:hi].tolist()
 
         if not trading_dates:
             logger.error("过滤后无交易日期")
             return compute_metrics([], n_trades=0)
 
-        # 生成 rebalance 日期集合
-        rebalance_set = self._build_rebalance_set(trading_dates)
+        # 换仓日 = trading_dates[::freq_days]，主循环按下标取模判断；
+        # 日频 (freq_days == 1) 每天都换仓，直接短路跳过取模
+        freq_days = self._rebalance_interval()
+        rebalance_daily = freq_days == 1
 
         logger.info(
             f"回测开始: {trading_dates[0]} → {trading_dates[-1]}, "
             f"{len(trading_dates)} 个交易日, "
-            f"{len(rebalance_set)} 次换仓"
+            f"{-(-len(trading_dates) // freq_days)} 次换仓"
         )
 
         # ── 主循环 ────────────────────────────────────
         # Forward-fill: 维护最后已知价格，防止缺失日将持仓市值归零
         last_known_prices: Dict[str, float] = {}
 
-        for date in trading_dates:
+        for i, date in enumerate(trading_dates):
             current_prices = self.adapter.get_prices_at(date)
 
             if not current_prices:
@@ -120,30 +154,40 @@ class BacktestEngine:
             # 合并今日价格到 last_known，缺失的股票保留上次价格
             last_known_prices.update(current_prices)
 
-            if date in rebalance_set:
+            if rebalance_daily or i % freq_days == 0:
                 self._rebalance(date, last_known_prices)
 
             self.portfolio.take_snapshot(date, last_known_prices)
 
         # ── 计算指标 ──────────────────────────────────
-        nav_series = self.portfolio.nav_series()
-        if not nav_series:
+        snapshots = self.portfolio.snapshots
+        if not snapshots:
             return compute_metrics([], n_trades=0)
+        navs = self.portfolio.nav_array()
 
         # 基准
         benchmark_nav = None
         if self.config.benchmark_symbol:
-            benchmark_nav = self.adapter.get_benchmark_nav(
-                self.config.benchmark_symbol
-            )
-            if benchmark_nav:
-                # 按回测日期范围过滤基准数据
-                start = nav_series[0][0]
-                end = nav_series[-1][0]
-                benchmark_nav = [
-                    (d, v) for d, v in benchmark_nav
-                    if start <= d <= end
-                ]
+            start = snapshots[0].date
+            end = snapshots[-1].date
+            if hasattr(self.adapter, "get_benchmark_arrays"):
+                # 数组形式: searchsorted 截取回测日期范围 (零拷贝切片)
+                bm_dates, bm_navs = self.adapter.get_benchmark_arrays(
+                    self.config.benchmark_symbol
+                )
+                lo = int(np.searchsorted(bm_dates, start, side="left"))
+                hi = int(np.searchsorted(bm_dates, end, side="right"))
+                benchmark_nav = (bm_dates[lo:hi], bm_navs[lo:hi])
+            else:
+                benchmark_nav = self.adapter.get_benchmark_nav(
+                    self.config.benchmark_symbol
+                )
+                if benchmark_nav:
+                    # 按回测日期范围过滤基准数据
+                    benchmark_nav = [
+                        (d, v) for d, v in benchmark_nav
+                        if start <= d <= end
+                    ]
 
         # 年化换手率
         days_per_year = (
@@ -151,13 +195,13 @@ class BacktestEngine:
             if self.config.market == "crypto"
             else TRADING_DAYS_PER_YEAR
         )
-        n_days = len(nav_series)
+        n_days = len(navs)
         years = n_days / days_per_year if days_per_year > 0 else 1
-        avg_nav = sum(v for _, v in nav_series) / len(nav_series) if nav_series else 1
+        avg_nav = float(navs.mean())
         annual_turnover = (self._turnover_notional / avg_nav / years) if years > 0 and avg_nav > 0 else 0.0
 
-        return compute_metrics(
-            nav_series=nav_series,
+        return compute_metrics_from_navs(
+            navs,
             benchmark_nav=benchmark_nav,
             total_costs=self.portfolio.total_costs,
             n_trades=self.portfolio.total_trades,
@@ -201,11 +245,16 @@ class BacktestEngine:
                         self.portfolio.sell_all(sym, price, date)
             return
 
-        # 防前视: 只截取到当日
-        sliced = self.adapter.slice_to_date(date)
-
-        # 计算 RS 排名
-        rs_df = self._rs_func(sliced)
+        # 计算 RS 排名 (命中共享缓存时跳过切片 + 计算)
+        rs_key = (self.config.rs_method, date)
+        rs_df = self._rs_cache.get(rs_key) if self._rs_cache is not None else None
+        sliced = None
+        if rs_df is None:
+            # 防前视: 只截取到当日
+            sliced = self.adapter.slice_to_date(date)
+            rs_df = self._rs_func(sliced)
+            if self._rs_cache is not None:
+                self._rs_cache[rs_key] = rs_df
 
         if rs_df.empty:
             logger.debug(f"{date}: RS 计算无结果, 跳过换仓")
@@ -218,6 +267,8 @@ class BacktestEngine:
         # 计算目标权重
         volatilities = None
         if self.config.weighting == "inv_vol":
+            if sliced is None:
+                sliced = self.adapter.slice_to_date(date)
             volatilities = self._compute_volatilities(sliced, self.config.vol_lookback)
 
         weights = self.rebalancer.compute_weights(
@@ -304,18 +355,18 @@ class BacktestEngine:
         Returns:
             True = regime on (做多), False = regime off
         """
-        if self._regime_index is None:
+        if self._regime_dates is None:
             return True
 
-        mask = self._regime_index.index <= date
-        sliced = self._regime_index[mask]
+        period = self.config.regime_ma_period
+        end = int(np.searchsorted(self._regime_dates, date, side="right"))
 
-        if len(sliced) < self.config.regime_ma_period:
+        if end < period:
             return True  # 数据不足，默认 regime on
 
-        ma = sliced.iloc[-self.config.regime_ma_period:].mean()
-        current = sliced.iloc[-1]
-        return current > ma
+        ma = self._regime_closes[end - period:end].mean()
+        current = self._regime_closes[end - 1]
+        return bool(current > ma)
 
     def _compute_volatilities(
         self, sliced: Dict[str, pd.DataFrame], lookback: int
@@ -351,25 +402,17 @@ class BacktestEngine:
 
     # ── 辅助方法 ──────────────────────────────────────
 
-    def _build_rebalance_set(self, trading_dates: List[str]) -> set:
+    def _rebalance_interval(self) -> int:
         """
-        从交易日期列表生成 rebalance 日期集合
+        换仓间隔 (交易日数)
 
-        根据 config.rebalance_freq 间隔采样
+        根据 config.rebalance_freq 查 FREQ_DAYS；第 i 个交易日在 i % interval == 0 时换仓
         """
-        freq_days = FREQ_DAYS.get(self.config.rebalance_freq, 21)
-        rebalance_dates = set()
-
-        for i in range(0, len(trading_dates), freq_days):
-            rebalance_dates.add(trading_dates[i])
-
-        return rebalance_dates
+        return FREQ_DAYS.get(self.config.rebalance_freq, 21)
 
     def _create_adapter(self):
         """根据 market 自动创建适配器"""
         if self.config.market == "crypto":
-            from backtest.adapters.crypto import CryptoAdapter
             return CryptoAdapter()
         else:
-            from backtest.adapters.us_stocks import USStocksAdapter
             return USStocksAdapter()
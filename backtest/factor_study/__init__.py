@@ -19,7 +19,12 @@
 
 from backtest.factor_study.protocol import Factor, FactorMeta
 from backtest.factor_study.factors import get_factor, list_factors, ALL_FACTORS
-from backtest.factor_study.signals import SignalType, SignalDefinition, detect_signals
+from backtest.factor_study.signals import (
+    SignalType,
+    SignalDefinition,
+    detect_signals,
+    detect_signals_batch,
+)
 from backtest.factor_study.forward_returns import build_return_matrix
 from backtest.factor_study.ic_analysis import ICResult, ICDecayCurve, analyze_ic
 from backtest.factor_study.event_study import EventStudyResult, run_event_study
@@ -44,6 +49,7 @@ __all__ = [
     "SignalType",
     "SignalDefinition",
     "detect_signals",
+    "detect_signals_batch",
     # Forward Returns
     "build_return_matrix",
     # IC Analysis
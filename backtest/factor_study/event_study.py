@@ -7,18 +7,17 @@ Track 2: 事件研究 — 离散信号有效性检验
 - EventStudyResult: 含 n_events, mean_return, hit_rate, t_stat, p_value
 """
 
-from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.stats import ttest_1samp
+from scipy.stats import t as t_dist
 
 from backtest.factor_study.signals import SignalDefinition
 
 
-@dataclass
+@dataclass(slots=True)
 class EventStudyResult:
     """单个信号 × 单个 horizon 的事件研究结果"""
     factor_name: str
@@ -53,22 +52,46 @@ def run_event_study(
     """
     signal_label = signal_def.label()
     results: List[EventStudyResult] = []
+    symbols_flat, dates_flat = _flatten_events(events)
 
     for horizon, ret_df in sorted(return_matrices.items()):
         result = _study_for_horizon(
             factor_name, signal_label, horizon,
-            events, ret_df,
+            symbols_flat, dates_flat, ret_df,
         )
         results.append(result)
 
     return results
 
 
+def _flatten_events(
+    events: Dict[str, List[str]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    {symbol: [event_date, ...]} → (symbols, dates) 两条平行数组
+
+    按总事件数预分配后逐段填充，所有 horizon 共用一份。
+    """
+    total = sum(len(dates) for dates in events.values())
+    symbols_flat = np.empty(total, dtype=object)
+    dates_flat = np.empty(total, dtype=object)
+
+    k = 0
+    for sym, dates in events.items():
+        n = len(dates)
+        symbols_flat[k:k + n] = sym
+        dates_flat[k:k + n] = dates
+        k += n
+
+    return symbols_flat, dates_flat
+
+
 def _study_for_horizon(
     factor_name: str,
     signal_label: str,
     horizon: int,
-    events: Dict[str, List[str]],
+    symbols_flat: np.ndarray,
+    dates_flat: np.ndarray,
     ret_df: pd.DataFrame,
 ) -> EventStudyResult:
     """单个 horizon 的事件研究 (日期聚类版)
@@ -76,23 +99,19 @@ def _study_for_horizon(
     按日期聚类: 同一天触发的多个事件取均值作为一个独立观测，
     然后在聚类均值上做 t-test。这消除了重叠窗口导致的样本膨胀。
     """
-    # 1. 按日期桶收集事件收益
-    date_bucket: Dict[str, List[float]] = defaultdict(list)
-    n_raw = 0
-
-    for symbol, event_dates in events.items():
-        if symbol not in ret_df.columns:
-            continue
-
-        for date in event_dates:
-            if date not in ret_df.index:
-                continue
-
-            fwd_ret = ret_df.loc[date, symbol]
-            if not np.isnan(fwd_ret):
-                date_bucket[date].append(float(fwd_ret))
-                n_raw += 1
-
+    # 1. 展平的 (symbol, date) 序列各做一次 get_indexer 批量定位，
+    #    一次 NumPy 花式索引取出全部前向收益
+    col_pos = ret_df.columns.get_indexer(symbols_flat)
+    row_pos = ret_df.index.get_indexer(dates_flat)
+    found = (row_pos >= 0) & (col_pos >= 0)
+
+    rows = row_pos[found]
+    fwd_rets = ret_df.to_numpy(dtype=np.float64)[rows, col_pos[found]]
+    valid = ~np.isnan(fwd_rets)
+    rows = rows[valid]
+    fwd_rets = fwd_rets[valid]
+
+    n_raw = len(fwd_rets)
     if n_raw == 0:
         return EventStudyResult(
             factor_name=factor_name,
@@ -102,19 +121,22 @@ def _study_for_horizon(
             n_effective=0,
         )
 
-    # 2. 每个日期取均值 → 一个独立观测
-    cluster_means = np.array([np.mean(rets) for rets in date_bucket.values()])
+    # 2. 按日期 (行下标) 聚类，每个日期取均值 → 一个独立观测
+    _, cluster = np.unique(rows, return_inverse=True)
+    cluster_means = (
+        np.bincount(cluster, weights=fwd_rets) / np.bincount(cluster)
+    )
     n_effective = len(cluster_means)
 
     mean_ret = float(np.mean(cluster_means))
     median_ret = float(np.median(cluster_means))
     hit_rate = float(np.mean(cluster_means > 0))
 
-    # 3. t-test on cluster means (正确的有效 N)
-    if n_effective >= 2:
-        t_stat, p_value = ttest_1samp(cluster_means, 0.0)
-        t_stat = float(t_stat)
-        p_value = float(p_value)
+    # 3. t-test on cluster means (正确的有效 N)，单样本 H0: mean = 0 直接按公式算
+    std_ret = float(np.std(cluster_means, ddof=1)) if n_effective >= 2 else 0.0
+    if std_ret > 1e-10:
+        t_stat = float(mean_ret * np.sqrt(n_effective) / std_ret)
+        p_value = float(t_dist.sf(abs(t_stat), n_effective - 1) * 2)
     else:
         t_stat = 0.0
         p_value = 1.0
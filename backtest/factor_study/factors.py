@@ -2,15 +2,17 @@
 Factor 适配器 — 将现有指标包装为统一 Factor 接口
 
 每个适配器调用 src/indicators/ 中的计算函数，
-返回 {symbol: score} 字典。
+返回 {symbol: score} 字典。指标模块在 compute() 内按需导入，
+加载本模块 / 注册表不会拉起任何指标实现。
 
 注册表 ALL_FACTORS 提供 name → class 映射，
-get_factor(name) 工厂函数创建实例。
+get_factor(name) 工厂函数返回 (缓存的) 实例。
 """
 
 import logging
 from typing import Dict, Optional, Type
 
+import numpy as np
 import pandas as pd
 
 from backtest.factor_study.protocol import Factor, FactorMeta
@@ -23,15 +25,13 @@ logger = logging.getLogger(__name__)
 class RSRatingBFactor(Factor):
     """RS Rating Method B — 风险调整 Z-Score 横截面动量排名"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="RS_Rating_B",
-            score_name="rs_rank",
-            score_range=(0, 99),
-            higher_is_stronger=True,
-            min_data_days=70,
-        )
+    meta = FactorMeta(
+        name="RS_Rating_B",
+        score_name="rs_rank",
+        score_range=(0, 99),
+        higher_is_stronger=True,
+        min_data_days=70,
+    )
 
     def compute(
         self,
@@ -51,15 +51,13 @@ class RSRatingBFactor(Factor):
 class RSRatingCFactor(Factor):
     """RS Rating Method C — Clenow 回归动量排名"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="RS_Rating_C",
-            score_name="rs_rank",
-            score_range=(0, 99),
-            higher_is_stronger=True,
-            min_data_days=70,
-        )
+    meta = FactorMeta(
+        name="RS_Rating_C",
+        score_name="rs_rank",
+        score_range=(0, 99),
+        higher_is_stronger=True,
+        min_data_days=70,
+    )
 
     def compute(
         self,
@@ -79,15 +77,13 @@ class RSRatingCFactor(Factor):
 class PMARPFactor(Factor):
     """PMARP — Price Moving Average Ratio Percentile"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="PMARP",
-            score_name="current",
-            score_range=(0, 100),
-            higher_is_stronger=True,
-            min_data_days=170,
-        )
+    meta = FactorMeta(
+        name="PMARP",
+        score_name="current",
+        score_range=(0, 100),
+        higher_is_stronger=True,
+        min_data_days=170,
+    )
 
     def compute(
         self,
@@ -109,15 +105,13 @@ class PMARPFactor(Factor):
 class RVOLFactor(Factor):
     """RVOL — Relative Volume (σ 标准差)"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="RVOL",
-            score_name="sigma",
-            score_range=(-5, 10),
-            higher_is_stronger=True,
-            min_data_days=121,
-        )
+    meta = FactorMeta(
+        name="RVOL",
+        score_name="sigma",
+        score_range=(-5, 10),
+        higher_is_stronger=True,
+        min_data_days=121,
+    )
 
     def compute(
         self,
@@ -139,15 +133,13 @@ class RVOLFactor(Factor):
 class DVAccelerationFactor(Factor):
     """DV Acceleration — Dollar Volume 5d/20d 加速比"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="DV_Acceleration",
-            score_name="ratio",
-            score_range=(0, 5),
-            higher_is_stronger=True,
-            min_data_days=20,
-        )
+    meta = FactorMeta(
+        name="DV_Acceleration",
+        score_name="ratio",
+        score_range=(0, 5),
+        higher_is_stronger=True,
+        min_data_days=20,
+    )
 
     def compute(
         self,
@@ -167,15 +159,13 @@ class DVAccelerationFactor(Factor):
 class RVOLSustainedFactor(Factor):
     """RVOL Sustained — 连续放量天数"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="RVOL_Sustained",
-            score_name="days",
-            score_range=(0, 30),
-            higher_is_stronger=True,
-            min_data_days=121,
-        )
+    meta = FactorMeta(
+        name="RVOL_Sustained",
+        score_name="days",
+        score_range=(0, 30),
+        higher_is_stronger=True,
+        min_data_days=121,
+    )
 
     def compute(
         self,
@@ -199,18 +189,38 @@ class RVOLSustainedFactor(Factor):
 
 # ── Crypto RS Rating B ───────────────────────────────────
 
+def _close_arrays(price_dict) -> Dict[str, np.ndarray]:
+    """
+    {sym: ndarray | DataFrame} → {sym: float64 收盘价数组}
+
+    CryptoAdapter.slice_to_date() 已返回 float64 ndarray 视图，此时原样透传；
+    DataFrame 用 to_numpy(dtype=float64)，列已是 float64 时不拷贝。
+    """
+    if all(
+        isinstance(data, np.ndarray) and data.dtype == np.float64
+        for data in price_dict.values()
+    ):
+        return price_dict
+
+    arr_dict = {}
+    for sym, data in price_dict.items():
+        if isinstance(data, pd.DataFrame):
+            arr_dict[sym] = data["close"].to_numpy(dtype=np.float64)
+        else:
+            arr_dict[sym] = np.asarray(data, dtype=np.float64)
+    return arr_dict
+
+
 class CryptoRSBFactor(Factor):
     """Crypto RS Rating Method B — 风险调整 Z-Score (7d/3d/1d)"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="Crypto_RS_B",
-            score_name="rs_rank",
-            score_range=(0, 99),
-            higher_is_stronger=True,
-            min_data_days=15,
-        )
+    meta = FactorMeta(
+        name="Crypto_RS_B",
+        score_name="rs_rank",
+        score_range=(0, 99),
+        higher_is_stronger=True,
+        min_data_days=15,
+    )
 
     def compute(
         self,
@@ -218,17 +228,8 @@ class CryptoRSBFactor(Factor):
         date: str,
     ) -> Dict[str, float]:
         from backtest.adapters.crypto_rs import compute_crypto_rs_b
-        import numpy as np
 
-        # price_dict 可能是 {sym: ndarray} 或 {sym: DataFrame}
-        arr_dict = {}
-        for sym, data in price_dict.items():
-            if isinstance(data, pd.DataFrame):
-                arr_dict[sym] = data["close"].values.astype(np.float64)
-            else:
-                arr_dict[sym] = np.asarray(data, dtype=np.float64)
-
-        result_df = compute_crypto_rs_b(arr_dict)
+        result_df = compute_crypto_rs_b(_close_arrays(price_dict))
         if result_df.empty:
             return {}
         return dict(zip(result_df["symbol"], result_df["rs_rank"].astype(float)))
@@ -239,15 +240,13 @@ class CryptoRSBFactor(Factor):
 class CryptoRSCFactor(Factor):
     """Crypto RS Rating Method C — Clenow 回归动量 (7d/3d/1d)"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="Crypto_RS_C",
-            score_name="rs_rank",
-            score_range=(0, 99),
-            higher_is_stronger=True,
-            min_data_days=15,
-        )
+    meta = FactorMeta(
+        name="Crypto_RS_C",
+        score_name="rs_rank",
+        score_range=(0, 99),
+        higher_is_stronger=True,
+        min_data_days=15,
+    )
 
     def compute(
         self,
@@ -255,16 +254,8 @@ class CryptoRSCFactor(Factor):
         date: str,
     ) -> Dict[str, float]:
         from backtest.adapters.crypto_rs import compute_crypto_rs_c
-        import numpy as np
-
-        arr_dict = {}
-        for sym, data in price_dict.items():
-            if isinstance(data, pd.DataFrame):
-                arr_dict[sym] = data["close"].values.astype(np.float64)
-            else:
-                arr_dict[sym] = np.asarray(data, dtype=np.float64)
 
-        result_df = compute_crypto_rs_c(arr_dict)
+        result_df = compute_crypto_rs_c(_close_arrays(price_dict))
         if result_df.empty:
             return {}
         return dict(zip(result_df["symbol"], result_df["rs_rank"].astype(float)))
@@ -275,15 +266,13 @@ class CryptoRSCFactor(Factor):
 class CryptoPMARPFactor(Factor):
     """Crypto PMARP — Price Moving Average Ratio Percentile (加密货币适配)"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="Crypto_PMARP",
-            score_name="current",
-            score_range=(0, 100),
-            higher_is_stronger=True,
-            min_data_days=170,
-        )
+    meta = FactorMeta(
+        name="Crypto_PMARP",
+        score_name="current",
+        score_range=(0, 100),
+        higher_is_stronger=True,
+        min_data_days=170,
+    )
 
     def compute(
         self,
@@ -291,7 +280,6 @@ class CryptoPMARPFactor(Factor):
         date: str,
     ) -> Dict[str, float]:
         from src.indicators.pmarp import analyze_pmarp
-        import numpy as np
 
         scores: Dict[str, float] = {}
         for symbol, data in price_dict.items():
@@ -313,15 +301,13 @@ class CryptoPMARPFactor(Factor):
 class MarketMomentumFactor(Factor):
     """Market Momentum — 物理学第一性原理资金动量 Z-Score"""
 
-    @property
-    def meta(self) -> FactorMeta:
-        return FactorMeta(
-            name="Market_Momentum",
-            score_name="zscore",
-            score_range=(-5, 5),
-            higher_is_stronger=True,
-            min_data_days=172,
-        )
+    meta = FactorMeta(
+        name="Market_Momentum",
+        score_name="zscore",
+        score_range=(-5, 5),
+        higher_is_stronger=True,
+        min_data_days=172,
+    )
 
     def compute(
         self,
@@ -354,9 +340,17 @@ ALL_FACTORS: Dict[str, Type[Factor]] = {
 }
 
 
+# 因子无状态 (compute 的输入全部来自参数)，每个名称只实例化一次
+_INSTANCE_CACHE: Dict[str, Factor] = {}
+
+
 def get_factor(name: str) -> Factor:
     """
-    工厂函数: 按名称创建 Factor 实例
+    工厂函数: 按名称获取 Factor 实例 (同名复用同一实例)
+
+    返回的实例在所有调用方之间共享，须视为只读: 不要在实例上设置
+    运行参数或其他状态，否则会带入之后的每次研究。需要可变实例时
+    直接实例化 ALL_FACTORS[name]()。
 
     Args:
         name: 因子名称 (如 "RS_Rating_B")
@@ -367,10 +361,14 @@ def get_factor(name: str) -> Factor:
     Raises:
         KeyError: 未知因子名称
     """
+    factor = _INSTANCE_CACHE.get(name)
+    if factor is not None:
+        return factor
     if name not in ALL_FACTORS:
         available = ", ".join(sorted(ALL_FACTORS.keys()))
         raise KeyError(f"未知因子: {name!r}。可用: {available}")
-    return ALL_FACTORS[name]()
+    factor = _INSTANCE_CACHE[name] = ALL_FACTORS[name]()
+    return factor
 
 
 def list_factors() -> list:
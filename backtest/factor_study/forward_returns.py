@@ -33,37 +33,43 @@ def build_return_matrix(
         {horizon: DataFrame[index=date, columns=symbol, values=forward_return]}
         forward_return = price[t+horizon] / price[t] - 1
     """
-    # 预处理: 为每只股票建立 date → close 的快速索引
-    close_maps: Dict[str, Dict[str, float]] = {}
-    date_index_maps: Dict[str, Dict[str, int]] = {}
-    sorted_dates_map: Dict[str, List[str]] = {}
-
-    for symbol, df in price_dict.items():
-        dates = df["date"].astype(str).tolist()
-        closes = df["close"].astype(float).tolist()
-        close_maps[symbol] = dict(zip(dates, closes))
-        date_index_maps[symbol] = {d: i for i, d in enumerate(dates)}
-        sorted_dates_map[symbol] = dates
-
     symbols = sorted(price_dict.keys())
+    comp_index = pd.Index(computation_dates)
+
+    # 预处理 (所有 horizon 共用):
+    # - 全部收盘价拼成一条 float64 数组，offsets[k] 为第 k 只股票的起点
+    # - positions[k, t] = 计算日期 t 在该股票自身日期序列中的行号 (-1 = 缺失)
+    # 前向收益按股票自身交易日序列偏移 horizon 行
+    n_dates = len(comp_index)
+    lengths = np.zeros(len(symbols), dtype=np.intp)
+    positions = np.full((len(symbols), n_dates), -1, dtype=np.intp)
+    close_parts: List[np.ndarray] = []
+    for k, symbol in enumerate(symbols):
+        df = price_dict[symbol]
+        close_parts.append(df["close"].to_numpy(dtype=np.float64))
+        lengths[k] = len(df)
+        positions[k] = _date_positions(df["date"].astype(str), comp_index)
+
+    # 末尾追加 NaN 哨兵: 无效位置统一 gather 下标 0，全部股票无数据时也合法
+    close_flat = np.concatenate([*close_parts, [np.nan]])
+    offsets = np.zeros(len(symbols), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+
+    found = positions >= 0
+    flat_start = np.where(found, positions + offsets[:, None], 0)
+    p0 = close_flat[flat_start]
+
+    index = pd.Index(list(computation_dates), name="date")
     result: Dict[int, pd.DataFrame] = {}
 
     for horizon in horizons:
-        matrix_data: Dict[str, List[float]] = {sym: [] for sym in symbols}
-        valid_dates: List[str] = []
-
-        for comp_date in computation_dates:
-            valid_dates.append(comp_date)
-            for sym in symbols:
-                fwd_ret = _forward_return(
-                    sym, comp_date, horizon,
-                    date_index_maps, sorted_dates_map, close_maps,
-                )
-                matrix_data[sym].append(fwd_ret)
-
-        df = pd.DataFrame(matrix_data, index=valid_dates)
-        df.index.name = "date"
-        result[horizon] = df
+        valid = found & (positions + horizon < lengths[:, None]) & (p0 != 0)
+        # 整矩阵 gather 后原地 divide / subtract (where=valid)，不生成掩码子数组
+        p1 = close_flat[np.where(valid, flat_start + horizon, 0)]
+        fwd = np.full(positions.shape, np.nan)
+        np.divide(p1, p0, out=fwd, where=valid)
+        np.subtract(fwd, 1.0, out=fwd, where=valid)
+        result[horizon] = pd.DataFrame(fwd.T, index=index, columns=symbols)
 
     return result
 
@@ -119,32 +125,11 @@ def build_excess_return_matrix(
     return raw
 
 
-def _forward_return(
-    symbol: str,
-    comp_date: str,
-    horizon: int,
-    date_index_maps: Dict[str, Dict[str, int]],
-    sorted_dates_map: Dict[str, List[str]],
-    close_maps: Dict[str, Dict[str, float]],
-) -> float:
-    """计算单只股票在指定日期的前向收益"""
-    idx_map = date_index_maps.get(symbol, {})
-    dates = sorted_dates_map.get(symbol, [])
-
-    if comp_date not in idx_map:
-        return np.nan
-
-    start_idx = idx_map[comp_date]
-    end_idx = start_idx + horizon
-
-    if end_idx >= len(dates):
-        return np.nan
-
-    end_date = dates[end_idx]
-    p0 = close_maps[symbol].get(comp_date)
-    p1 = close_maps[symbol].get(end_date)
-
-    if p0 is None or p1 is None or p0 == 0:
-        return np.nan
+def _date_positions(dates: pd.Series, comp_index: pd.Index) -> np.ndarray:
+    """计算日期在单只股票日期序列中的行号 (不存在为 -1；重复日期取最后一行)"""
+    date_index = pd.Index(dates)
+    if date_index.is_unique:
+        return date_index.get_indexer(comp_index)
 
-    return p1 / p0 - 1
+    idx_map = {d: i for i, d in enumerate(dates.tolist())}
+    return np.array([idx_map.get(d, -1) for d in comp_index], dtype=np.intp)
@@ -9,17 +9,29 @@ IC = Spearman Rank Correlation(factor_score, forward_return)
 - ICDecayCurve: 跨 horizon 的 IC 衰减曲线
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from itertools import compress
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.stats import spearmanr
+from scipy.stats import rankdata
+from scipy.stats import t as t_dist
 
-from backtest.factor_study.protocol import FactorMeta
+from backtest.factor_study.protocol import FactorMeta, SymbolHistory, score_arrays
+from backtest.parallel import resolve_n_jobs
 
 
-@dataclass
+# 因子分数历史: {symbol: [(date, score), ...]} 或 SoA {symbol: (dates, scores)}
+ScoreHistory = Dict[str, SymbolHistory]
+
+# 对齐分数缓存: {(日期元组, 标的元组): (T, N) float64 分数矩阵}
+_AlignedScoreCache = Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], np.ndarray]
+
+
+@dataclass(slots=True)
 class ICResult:
     """单个 horizon 的 IC 统计"""
     factor_name: str
@@ -31,11 +43,11 @@ class ICResult:
     n_ic_obs: int              # IC 观测数
     t_stat: float              # t = mean_ic * sqrt(n) / std_ic
     p_value: float             # 双尾 p-value (H0: mean_ic = 0)
-    quantile_returns: Dict[int, float]  # {1..5: mean_return}
-    top_bottom_spread: float   # Q5 - Q1
+    quantile_returns: Tuple[float, ...]  # 定长 (Q1..Qn 平均收益)
+    top_bottom_spread: float   # Qn - Q1
 
 
-@dataclass
+@dataclass(slots=True)
 class ICDecayCurve:
     """IC 衰减曲线 — 跨 horizon"""
     factor_name: str
@@ -45,36 +57,57 @@ class ICDecayCurve:
 
 def analyze_ic(
     factor_meta: FactorMeta,
-    score_history: Dict[str, List[Tuple[str, float]]],
+    score_history: ScoreHistory,
     return_matrices: Dict[int, pd.DataFrame],
     computation_dates: List[str],
     n_quantiles: int = 5,
+    score_matrix: Optional[pd.DataFrame] = None,
+    n_jobs: Optional[int] = 1,
 ) -> Tuple[List[ICResult], ICDecayCurve]:
     """
     计算因子的 IC 分析
 
     Args:
         factor_meta: 因子元信息
-        score_history: {symbol: [(date, score), ...]}
+        score_history: {symbol: [(date, score), ...]} 或 SoA {symbol: (dates, scores)}
         return_matrices: {horizon: DataFrame[date x symbol]}
         computation_dates: 计算日期列表
         n_quantiles: 分位数数量 (默认 5)
+        score_matrix: build_score_matrix() 的预构建结果 (日期可为 computation_dates
+            的超集)；None = 由 score_history 现场构建
+        n_jobs: 并行线程数 (按 horizon 分发)。1=串行 (默认), None/-1=全部 CPU 核。
+            排序 / 秩计算在 NumPy 内部释放 GIL，多核时各 horizon 可并行
 
     Returns:
         (ic_results_per_horizon, ic_decay_curve)
     """
     # 构建因子分数矩阵: DataFrame[date x symbol]
-    score_matrix = _build_score_matrix(score_history, computation_dates)
+    if score_matrix is None:
+        score_matrix = build_score_matrix(score_history, computation_dates)
 
     ic_results: List[ICResult] = []
     decay_horizons: List[int] = []
     decay_ics: List[float] = []
+    # 各 horizon 的收益矩阵通常同日期同列，对齐后的分数数组跨 horizon 复用
+    aligned_scores: _AlignedScoreCache = {}
 
-    for horizon, ret_df in sorted(return_matrices.items()):
-        result = _ic_for_horizon(
+    def run_horizon(item: Tuple[int, pd.DataFrame]) -> Optional[ICResult]:
+        horizon, ret_df = item
+        return _ic_for_horizon(
             factor_meta, score_matrix, ret_df,
             computation_dates, horizon, n_quantiles,
+            aligned_scores,
         )
+
+    items = sorted(return_matrices.items())
+    n_workers = resolve_n_jobs(n_jobs, len(items))
+    if n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(run_horizon, items))
+    else:
+        results = [run_horizon(item) for item in items]
+
+    for (horizon, _), result in zip(items, results):
         if result is not None:
             ic_results.append(result)
             decay_horizons.append(horizon)
@@ -89,21 +122,28 @@ def analyze_ic(
     return ic_results, decay_curve
 
 
-def _build_score_matrix(
-    score_history: Dict[str, List[Tuple[str, float]]],
+def build_score_matrix(
+    score_history: ScoreHistory,
     computation_dates: List[str],
 ) -> pd.DataFrame:
-    """将 score_history 转为 DataFrame[date x symbol]"""
-    symbols = sorted(score_history.keys())
-    data: Dict[str, Dict[str, float]] = {}
+    """
+    将 score_history 转为 DataFrame[date x symbol]
+
+    不在 computation_dates 中的记录丢弃；列顺序同 score_history。
+    按全量计算日期构建一次后可传给 analyze_ic(score_matrix=...) 跨 IS/OOS/基准复用。
+    """
+    date_index = pd.Index(computation_dates, name="date")
+    values = np.full((len(date_index), len(score_history)), np.nan)
 
-    for sym, history in score_history.items():
-        date_score = {d: s for d, s in history}
-        data[sym] = date_score
+    for col, history in enumerate(score_history.values()):
+        dates, scores = score_arrays(history)
+        if len(dates) == 0:
+            continue
+        rows = date_index.get_indexer(dates)
+        found = rows >= 0
+        values[rows[found], col] = scores[found]
 
-    df = pd.DataFrame(data, index=computation_dates)
-    df.index.name = "date"
-    return df
+    return pd.DataFrame(values, index=date_index, columns=list(score_history))
 
 
 def _ic_for_horizon(
@@ -113,39 +153,47 @@ def _ic_for_horizon(
     computation_dates: List[str],
     horizon: int,
     n_quantiles: int,
+    aligned_scores: Optional[_AlignedScoreCache] = None,
 ) -> ICResult:
-    """计算单个 horizon 的 IC"""
-    common_dates = [d for d in computation_dates
-                    if d in score_matrix.index and d in ret_df.index]
-    common_symbols = [s for s in score_matrix.columns if s in ret_df.columns]
+    """
+    计算单个 horizon 的 IC
+
+    aligned_scores: 可选缓存 {(dates, symbols): 对齐后的分数数组}，
+        跨 horizon 共享，相同对齐只 reindex / to_numpy 一次
+    """
+    # 整列 get_indexer 一次定位，替代逐元素 `in` 判断
+    date_found = (
+        (score_matrix.index.get_indexer(computation_dates) >= 0)
+        & (ret_df.index.get_indexer(computation_dates) >= 0)
+    )
+    common_dates = list(compress(computation_dates, date_found))
+    common_symbols = score_matrix.columns[
+        ret_df.columns.get_indexer(score_matrix.columns) >= 0
+    ].tolist()
 
     if len(common_dates) < 5 or len(common_symbols) < 5:
         return None
 
-    ic_series: List[float] = []
-
-    for date in common_dates:
-        scores = score_matrix.loc[date, common_symbols]
-        returns = ret_df.loc[date, common_symbols]
-
-        # 去掉 NaN
-        mask = scores.notna() & returns.notna()
-        s = scores[mask]
-        r = returns[mask]
-
-        if len(s) < 5:
-            continue
-
-        corr, _ = spearmanr(s.values, r.values)
-        if not np.isnan(corr):
-            ic_series.append(corr)
+    # 对齐成 (T, N) float64 矩阵，一次批量计算全部日期的截面 Spearman IC
+    key = (tuple(common_dates), tuple(common_symbols))
+    scores = aligned_scores.get(key) if aligned_scores is not None else None
+    if scores is None:
+        scores = score_matrix.reindex(
+            index=common_dates, columns=common_symbols,
+        ).to_numpy(dtype=np.float64)
+        if aligned_scores is not None:
+            aligned_scores[key] = scores
+    returns = ret_df.reindex(
+        index=common_dates, columns=common_symbols,
+    ).to_numpy(dtype=np.float64)
+
+    ic_rows = _spearman_rows(scores, returns, min_obs=5)
+    ic_series = ic_rows[~np.isnan(ic_rows)]
 
     if len(ic_series) < 3:
         return None
 
-    from scipy.stats import t as t_dist
-
-    ic_arr = np.array(ic_series)
+    ic_arr = ic_series
     n_obs = len(ic_arr)
     mean_ic = float(np.mean(ic_arr))
     std_ic = float(np.std(ic_arr, ddof=1))
@@ -160,17 +208,11 @@ def _ic_for_horizon(
         t_stat = 0.0
         p_val = 1.0
 
-    # 分位数收益
-    quantile_returns = _quantile_returns(
-        score_matrix, ret_df, common_dates, common_symbols,
-        n_quantiles, factor_meta.higher_is_stronger,
-    )
+    # 分位数收益 (复用 IC 已对齐的矩阵，不再重复 reindex)
+    quantile_returns = _quantile_returns_from_arrays(scores, returns, n_quantiles)
 
     # Top - Bottom spread
-    if n_quantiles in quantile_returns and 1 in quantile_returns:
-        spread = quantile_returns[n_quantiles] - quantile_returns[1]
-    else:
-        spread = 0.0
+    spread = quantile_returns[-1] - quantile_returns[0]
 
     return ICResult(
         factor_name=factor_meta.name,
@@ -187,48 +229,108 @@ def _ic_for_horizon(
     )
 
 
-def _quantile_returns(
-    score_matrix: pd.DataFrame,
-    ret_df: pd.DataFrame,
-    dates: List[str],
-    symbols: List[str],
-    n_quantiles: int,
-    higher_is_stronger: bool,
-) -> Dict[int, float]:
-    """计算各分位数的平均收益"""
-    quantile_sums: Dict[int, List[float]] = {q: [] for q in range(1, n_quantiles + 1)}
+def _spearman_rows(
+    scores: np.ndarray,
+    returns: np.ndarray,
+    min_obs: int = 5,
+) -> np.ndarray:
+    """
+    逐行 Spearman 秩相关 (批量版，等价于每行 scipy.stats.spearmanr)
 
-    for date in dates:
-        scores = score_matrix.loc[date, symbols]
-        returns = ret_df.loc[date, symbols]
+    每行只用 score / return 同时非 NaN 的样本，平均秩处理并列。
 
-        mask = scores.notna() & returns.notna()
-        s = scores[mask]
-        r = returns[mask]
+    Args:
+        scores: (T, N) 因子分数矩阵
+        returns: (T, N) 前向收益矩阵
+        min_obs: 每行最少有效样本数
 
-        if len(s) < n_quantiles:
-            continue
+    Returns:
+        (T,) IC 数组；样本不足或分数/收益为常数的行为 NaN
+    """
+    mask = ~(np.isnan(scores) | np.isnan(returns))
+    n = mask.sum(axis=1)
+
+    rank_s = rankdata(np.where(mask, scores, np.nan), axis=1, nan_policy="omit")
+    rank_r = rankdata(np.where(mask, returns, np.nan), axis=1, nan_policy="omit")
+
+    # 平均秩 (并列取均值) 的行均值恒为 (n + 1) / 2，无需再做 nansum；
+    # 原地去均值后无效格置 0，einsum 逐行点积不产生中间矩阵
+    mean_rank = ((n + 1) / 2.0)[:, None]
+    for ranks in (rank_s, rank_r):
+        np.subtract(ranks, mean_rank, out=ranks)
+        ranks[~mask] = 0.0
+
+    cov = np.einsum("ij,ij->i", rank_s, rank_r)
+    var_s = np.einsum("ij,ij->i", rank_s, rank_s)
+    var_r = np.einsum("ij,ij->i", rank_r, rank_r)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.sqrt(var_s * var_r)
+
+    corr[n < min_obs] = np.nan
+    return corr
 
-        # 按分数排名分组
-        try:
-            labels = pd.qcut(
-                s.rank(method="first"),
-                q=n_quantiles,
-                labels=range(1, n_quantiles + 1),
-            )
-        except ValueError:
+
+def _quantile_returns_from_arrays(
+    scores: np.ndarray,
+    returns: np.ndarray,
+    n_quantiles: int,
+) -> Tuple[float, ...]:
+    """
+    分位数平均收益 — 直接作用于已对齐的 (T, N) 分数/收益矩阵
+
+    Returns:
+        长度 n_quantiles 的 tuple，下标 q-1 为 Qq 的平均收益；无观测的分位数为 0.0
+    """
+    valid = ~(np.isnan(scores) | np.isnan(returns))
+    n_valid = valid.sum(axis=1)
+
+    # 整矩阵一次稳定排序: 无效样本置 NaN 排到行尾，
+    # 有效样本的排序位置即 rank(method="first") - 1
+    order = np.argsort(np.where(valid, scores, np.nan), axis=1, kind="stable")
+    sorted_rets = np.take_along_axis(returns, order, axis=1)
+    # 排序后每个分位桶是连续区间，桶内收益和 = 前缀和之差
+    # (行尾无效样本可能含 NaN，但区间只取到前 n 个位置，不受影响)
+    cum_rets = np.zeros((len(scores), scores.shape[1] + 1))
+    np.cumsum(sorted_rets, axis=1, out=cum_rets[:, 1:])
+
+    # (n_quantiles + 1) 累加器: 逐日组内均值的累加和 / 有效日期数 (下标 0 不用)
+    q_sum = np.zeros(n_quantiles + 1)
+    q_days = np.zeros(n_quantiles + 1, dtype=np.int64)
+
+    # 同一截面大小的行共用一份 qcut 切分，整组一次取区间和
+    for n in np.unique(n_valid[n_valid >= n_quantiles]):
+        bins = _rank_bins(int(n), n_quantiles)
+        if bins is None:
             continue
+        labels = np.arange(1, n_quantiles + 1)
+        starts = np.searchsorted(bins, labels, side="left")
+        ends = np.searchsorted(bins, labels, side="right")
+        hit = ends > starts
 
-        for q in range(1, n_quantiles + 1):
-            q_mask = labels == q
-            if q_mask.any():
-                quantile_sums[q].append(float(r[q_mask].mean()))
+        group = cum_rets[n_valid == n]
+        means = (group[:, ends[hit]] - group[:, starts[hit]]) / (ends - starts)[hit]
+        q_sum[labels[hit]] += means.sum(axis=0)
+        q_days[labels[hit]] += len(group)
 
-    result: Dict[int, float] = {}
-    for q, vals in quantile_sums.items():
-        if vals:
-            result[q] = float(np.mean(vals))
-        else:
-            result[q] = 0.0
+    result = np.zeros(n_quantiles)
+    np.divide(q_sum[1:], q_days[1:], out=result, where=q_days[1:] > 0)
+    return tuple(result.tolist())
 
-    return result
+
+@lru_cache(maxsize=None)
+def _rank_bins(n: int, n_quantiles: int) -> Optional[np.ndarray]:
+    """
+    名次 1..n 对应的分位桶 (1..n_quantiles)
+
+    rank(method="first") 后名次两两不同，分桶只取决于截面大小 n，
+    直接复用 pd.qcut 的切分规则。结果按 (n, n_quantiles) 进程内缓存，
+    跨因子 / horizon / IS-OOS 只算一次 (返回只读数组)。qcut 失败返回 None。
+    """
+    try:
+        bins = pd.qcut(
+            np.arange(1, n + 1), q=n_quantiles, labels=False,
+        ).astype(np.intp) + 1
+    except ValueError:
+        return None
+    bins.setflags(write=False)
+    return bins
@@ -3,18 +3,24 @@ Factor ABC — 通用因子接口定义
 
 任何因子只需实现 compute() 返回 {symbol: score} 即可接入框架。
 FactorMeta 描述因子的元信息（名称、分数范围、方向性等）。
+score_arrays() 把单只股票的分数历史统一成 (dates, scores) 数组。
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+# 单只股票分数历史: [(date, score), ...] 或 SoA (dates, scores)
+SymbolHistory = Union[List[Tuple[str, float]], Tuple[Sequence[str], np.ndarray]]
+
+
+@dataclass(frozen=True)
 class FactorMeta:
-    """因子元信息"""
+    """因子元信息 (不可变，作为类属性在实例间共享)"""
 
     name: str                       # "RS_Rating_B"
     score_name: str                 # "rs_rank"
@@ -33,7 +39,7 @@ class Factor(ABC):
     通用因子基类
 
     子类实现:
-    - meta: 返回 FactorMeta
+    - meta: FactorMeta 类属性 (类定义时构造一次，所有实例共享) 或 property
     - compute(): 接收 price_dict (已 slice 到 date)，返回 {symbol: score}
     """
 
@@ -63,3 +69,14 @@ class Factor(ABC):
 
     def __repr__(self) -> str:
         return f"<Factor {self.meta.name}>"
+
+
+def score_arrays(history: SymbolHistory) -> Tuple[Sequence[str], np.ndarray]:
+    """单只股票的分数历史 → (dates, float64 scores)；已是 SoA 时不拷贝"""
+    if isinstance(history, tuple):
+        dates, scores = history
+    elif history:
+        dates, scores = zip(*history)
+    else:
+        dates, scores = (), ()
+    return dates, np.asarray(scores, dtype=np.float64)
@@ -6,12 +6,17 @@ HTML: IC 衰减曲线 + 分位数柱状图 + 事件统计表 (Chart.js)
 CSV: 完整结果导出到 data/factor_study/
 """
 
+import csv
+import hashlib
+import json
 import logging
+import os
+import pickle
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-import pandas as pd
+import numpy as np
 
 from backtest.factor_study.runner import FactorStudyResults
 
@@ -50,6 +55,85 @@ logger = logging.getLogger(__name__)
 
 _PROJECT_ROOT = Path(__file__).parent.parent.parent
 _OUTPUT_DIR = _PROJECT_ROOT / "data" / "factor_study"
+_HTML_CACHE_DIR = _OUTPUT_DIR / "_cache"
+# 缓存上限: 超过条数或天数的旧条目在写入新条目时清理
+_HTML_CACHE_MAX_ENTRIES = 32
+_HTML_CACHE_MAX_AGE_DAYS = 30
+# 渲染器版本: 修改 HTML 模板 / 表格 / 图表渲染逻辑时递增，旧缓存随之失效
+_RENDER_VERSION = "1"
+# 缓存中的生成时间占位符，取用时替换为当前时间
+_GENERATED_AT_MARK = "<!--generated-at-->"
+
+# 因子名 / 信号标签 / 基准名写入 HTML 前统一转义
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# 表格行模板: 模块加载时定义一次，每行一次 format_map
+_IC_ROW_TMPL = (
+    '<tr><td style="text-align:left">{factor}</td>{bench_td}'
+    "<td>{ic.horizon}d</td>"
+    "<td{sig}>{ic.mean_ic:.4f}</td>"
+    "<td>{ic.std_ic:.4f}</td>"
+    "<td{sig}>{ic.ic_ir:.2f}</td>"
+    "<td>{ic.ic_hit_rate:.1%}</td>"
+    "<td>{ic.n_ic_obs}</td>"
+    "<td{sig}>{ic.t_stat:.2f}{star}</td>"
+    "<td>{ic.p_value:.4f}</td>"
+    "<td>{ic.top_bottom_spread:.4f}</td></tr>\n"
+)
+_EVENT_ROW_TMPL = (
+    '<tr><td style="text-align:left">{factor}</td>{bench_td}'
+    '<td style="text-align:left">{signal}</td>'
+    "<td>{ev.horizon}d</td>"
+    "<td>{ev.n_events}</td>"
+    "<td>{ev.n_effective}</td>"
+    "<td{sig}>{ev.mean_return:.4f}</td>"
+    "<td>{ev.median_return:.4f}</td>"
+    "<td>{ev.hit_rate:.1%}</td>"
+    "<td{sig}>{ev.t_stat:.2f}{star}</td>"
+    "<td>{ev.p_value:.4f}</td>"
+    "<td{sig}>{p_fdr:.4f}</td></tr>\n"
+)
+
+
+def _esc(text) -> str:
+    """HTML 文本转义 (& < >)"""
+    return str(text).translate(_HTML_ESCAPE)
+
+
+def _bench_td(bench: str, show: bool) -> str:
+    """多基准时的基准单元格；单基准为空串"""
+    return f'<td style="text-align:left">{_esc(bench)}</td>' if show else ""
+
+
+def _ic_row(ic, bench_td: str) -> str:
+    """IC 表的一行 (p < 0.05 高亮)"""
+    return _IC_ROW_TMPL.format_map({
+        "ic": ic,
+        "factor": _esc(ic.factor_name),
+        "bench_td": bench_td,
+        "sig": ' class="sig"' if ic.p_value < 0.05 else "",
+        "star": "**" if ic.p_value < 0.01 else ("*" if ic.p_value < 0.05 else ""),
+    })
+
+
+def _event_row(ev, p_fdr: float, bench_td: str) -> str:
+    """事件表的一行 (按 p-FDR 高亮)"""
+    return _EVENT_ROW_TMPL.format_map({
+        "ev": ev,
+        "p_fdr": p_fdr,
+        "factor": _esc(ev.factor_name),
+        "signal": _esc(ev.signal_label),
+        "bench_td": bench_td,
+        "sig": ' class="sig"' if p_fdr < 0.05 else "",
+        "star": "**" if p_fdr < 0.01 else ("*" if p_fdr < 0.05 else ""),
+    })
+
+
+def _js(value) -> str:
+    """Python 值 → 内嵌 <script> 的 JSON 字面量 (NaN → null，转义 "</")"""
+    if isinstance(value, (list, tuple)):
+        value = [None if isinstance(v, float) and v != v else v for v in value]
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
 
 
 def _bench_display(results: FactorStudyResults) -> str:
@@ -139,9 +223,12 @@ def _print_event_section(event_results, label):
     p_values = [ev.p_value for ev in event_results]
     p_fdr_values = _apply_bh_fdr(p_values)
 
-    indexed_events = list(zip(event_results, p_fdr_values))
-    indexed_events.sort(key=lambda x: abs(x[0].t_stat), reverse=True)
-    top10 = indexed_events[:10]
+    abs_t = np.abs(np.fromiter(
+        (ev.t_stat for ev in event_results), np.float64, len(event_results),
+    ))
+    top10 = [
+        (event_results[i], p_fdr_values[i]) for i in _top_k_by_abs(abs_t, 10)
+    ]
 
     print(f"  {'Signal':<30} {'H':>4} {'N':>6} {'Neff':>6} {'Mean':>8} "
           f"{'Hit%':>7} {'t-stat':>8} {'p-val':>8} {'p-FDR':>8}")
@@ -159,8 +246,22 @@ def _print_event_section(event_results, label):
 # CSV 导出
 # ══════════════════════════════════════════════════════════
 
+_IC_FIELDS = [
+    "factor", "benchmark", "horizon", "mean_ic", "std_ic", "ic_ir",
+    "ic_hit_rate", "n_ic_obs", "t_stat", "p_value", "top_bottom_spread",
+]
+_EVENT_FIELDS = [
+    "factor", "benchmark", "signal", "horizon", "n_events", "n_effective",
+    "mean_return", "median_return", "hit_rate", "t_stat", "p_value", "p_fdr",
+]
+
+
 def export_csv(results: FactorStudyResults) -> Path:
-    """导出完整结果到 CSV — 每个基准独立文件，FDR 口径正确"""
+    """导出完整结果到 CSV — 每个基准独立文件，FDR 口径正确
+
+    逐行流式写入 (csv.writer，列序由 _IC_FIELDS / _EVENT_FIELDS 固定)，
+    不构建中间 DataFrame。
+    """
     _OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     date_str = datetime.now().strftime("%Y%m%d")
     name = results.factor_name
@@ -170,124 +271,184 @@ def export_csv(results: FactorStudyResults) -> Path:
 
     # IC results
     if results.ic_results:
-        ic_rows = []
-        for ic in results.ic_results:
-            row = {
-                "factor": ic.factor_name,
-                "benchmark": bench,
-                "horizon": ic.horizon,
-                "mean_ic": ic.mean_ic,
-                "std_ic": ic.std_ic,
-                "ic_ir": ic.ic_ir,
-                "ic_hit_rate": ic.ic_hit_rate,
-                "n_ic_obs": ic.n_ic_obs,
-                "t_stat": ic.t_stat,
-                "p_value": ic.p_value,
-                "top_bottom_spread": ic.top_bottom_spread,
-            }
-            for q, ret in ic.quantile_returns.items():
-                row[f"Q{q}_return"] = ret
-            ic_rows.append(row)
-
-        ic_df = pd.DataFrame(ic_rows)
         ic_path = _OUTPUT_DIR / f"ic_{name}{bench_suffix}_{date_str}.csv"
-        ic_df.to_csv(ic_path, index=False)
+        n_q = _n_quantile_cols([results.ic_results])
+        _write_csv(
+            ic_path, _ic_fieldnames(n_q),
+            _ic_rows(results.ic_results, bench, n_q),
+        )
         logger.info(f"IC 结果已导出: {ic_path}")
 
     # Event results — FDR 在单个基准的完整假设族上校正
     if results.event_results:
-        p_values = [ev.p_value for ev in results.event_results]
-        p_fdr_values = _apply_bh_fdr(p_values)
-
-        ev_rows = []
-        for ev, p_fdr in zip(results.event_results, p_fdr_values):
-            ev_rows.append({
-                "factor": ev.factor_name,
-                "benchmark": bench,
-                "signal": ev.signal_label,
-                "horizon": ev.horizon,
-                "n_events": ev.n_events,
-                "n_effective": ev.n_effective,
-                "mean_return": ev.mean_return,
-                "median_return": ev.median_return,
-                "hit_rate": ev.hit_rate,
-                "t_stat": ev.t_stat,
-                "p_value": ev.p_value,
-                "p_fdr": p_fdr,
-            })
-
-        ev_df = pd.DataFrame(ev_rows)
         ev_path = _OUTPUT_DIR / f"events_{name}{bench_suffix}_{date_str}.csv"
-        ev_df.to_csv(ev_path, index=False)
+        _write_csv(ev_path, _EVENT_FIELDS, _event_rows(results.event_results, bench))
         logger.info(f"事件研究结果已导出: {ev_path}")
 
     # OOS IC results
     if results.oos_ic_results:
-        oos_ic_rows = []
-        for ic in results.oos_ic_results:
-            row = {
-                "factor": ic.factor_name,
-                "benchmark": bench,
-                "split": "OOS",
-                "horizon": ic.horizon,
-                "mean_ic": ic.mean_ic,
-                "std_ic": ic.std_ic,
-                "ic_ir": ic.ic_ir,
-                "ic_hit_rate": ic.ic_hit_rate,
-                "n_ic_obs": ic.n_ic_obs,
-                "t_stat": ic.t_stat,
-                "p_value": ic.p_value,
-                "top_bottom_spread": ic.top_bottom_spread,
-            }
-            for q, ret in ic.quantile_returns.items():
-                row[f"Q{q}_return"] = ret
-            oos_ic_rows.append(row)
-
-        oos_ic_df = pd.DataFrame(oos_ic_rows)
         oos_ic_path = _OUTPUT_DIR / f"ic_oos_{name}{bench_suffix}_{date_str}.csv"
-        oos_ic_df.to_csv(oos_ic_path, index=False)
+        n_q = _n_quantile_cols([results.oos_ic_results])
+        _write_csv(
+            oos_ic_path, _ic_fieldnames(n_q, split=True),
+            _ic_rows(results.oos_ic_results, bench, n_q, split="OOS"),
+        )
         logger.info(f"OOS IC 结果已导出: {oos_ic_path}")
 
     # OOS Event results
     if results.oos_event_results:
-        p_values = [ev.p_value for ev in results.oos_event_results]
-        p_fdr_values = _apply_bh_fdr(p_values)
-
-        oos_ev_rows = []
-        for ev, p_fdr in zip(results.oos_event_results, p_fdr_values):
-            oos_ev_rows.append({
-                "factor": ev.factor_name,
-                "benchmark": bench,
-                "split": "OOS",
-                "signal": ev.signal_label,
-                "horizon": ev.horizon,
-                "n_events": ev.n_events,
-                "n_effective": ev.n_effective,
-                "mean_return": ev.mean_return,
-                "median_return": ev.median_return,
-                "hit_rate": ev.hit_rate,
-                "t_stat": ev.t_stat,
-                "p_value": ev.p_value,
-                "p_fdr": p_fdr,
-            })
-
-        oos_ev_df = pd.DataFrame(oos_ev_rows)
         oos_ev_path = _OUTPUT_DIR / f"events_oos_{name}{bench_suffix}_{date_str}.csv"
-        oos_ev_df.to_csv(oos_ev_path, index=False)
+        _write_csv(
+            oos_ev_path, _with_split(_EVENT_FIELDS),
+            _event_rows(results.oos_event_results, bench, split="OOS"),
+        )
         logger.info(f"OOS 事件研究结果已导出: {oos_ev_path}")
 
     return _OUTPUT_DIR
 
 
+def _with_split(fields: List[str]) -> List[str]:
+    """在 benchmark 列后插入 split 列"""
+    i = fields.index("benchmark") + 1
+    return fields[:i] + ["split"] + fields[i:]
+
+
+def _n_quantile_cols(ic_groups) -> int:
+    """Qk_return 列数: 所有 IC 结果中最多的分位数个数"""
+    return max(
+        (len(ic.quantile_returns) for group in ic_groups for ic in group),
+        default=0,
+    )
+
+
+def _ic_fieldnames(n_quantiles: int, split: bool = False) -> List[str]:
+    """IC CSV 列: 固定列 + Q1..Qn_return 列"""
+    fields = _with_split(_IC_FIELDS) if split else list(_IC_FIELDS)
+    return fields + [f"Q{q}_return" for q in range(1, n_quantiles + 1)]
+
+
+def _ic_rows(
+    ic_results, bench: str, n_quantiles: int, split: Optional[str] = None,
+):
+    """逐行产出 IC 记录 (按 _ic_fieldnames 的列序；分位数不足的列为空串)"""
+    head = (bench, split) if split else (bench,)
+    for ic in ic_results:
+        q_rets = ic.quantile_returns
+        yield (
+            ic.factor_name, *head, ic.horizon, ic.mean_ic, ic.std_ic,
+            ic.ic_ir, ic.ic_hit_rate, ic.n_ic_obs, ic.t_stat, ic.p_value,
+            ic.top_bottom_spread, *q_rets, *[""] * (n_quantiles - len(q_rets)),
+        )
+
+
+def _event_rows(event_results, bench: str, split: Optional[str] = None):
+    """逐行产出事件研究记录 (FDR 在传入的完整假设族上校正)"""
+    head = (bench, split) if split else (bench,)
+    p_fdr_values = _apply_bh_fdr([ev.p_value for ev in event_results])
+    for ev, p_fdr in zip(event_results, p_fdr_values):
+        yield (
+            ev.factor_name, *head, ev.signal_label, ev.horizon, ev.n_events,
+            ev.n_effective, ev.mean_return, ev.median_return, ev.hit_rate,
+            ev.t_stat, ev.p_value, p_fdr,
+        )
+
+
+def _write_csv(path: Path, fieldnames: List[str], rows) -> None:
+    """流式写 CSV；NaN 写为空串 (与 DataFrame.to_csv 一致)
+
+    行是与 fieldnames 同序的 tuple，直接交给 csv.writer，
+    不为每行构建 dict、也不做逐行键校验。
+    """
+    with open(path, "w", newline="", encoding="utf-8") as fp:
+        writer = csv.writer(fp, lineterminator="\n")
+        writer.writerow(fieldnames)
+        for row in rows:
+            writer.writerow(["" if v != v else v for v in row])
+
+
 # ══════════════════════════════════════════════════════════
 # HTML 报告
 # ══════════════════════════════════════════════════════════
 
 def generate_html_report(
     all_results: List[FactorStudyResults],
+    use_cache: bool = False,
 ) -> str:
-    """生成 HTML 报告"""
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    """
+    生成 HTML 报告
+
+    Args:
+        all_results: 研究结果列表
+        use_cache: 开启后，分析结果与渲染器版本都相同时直接复用上次渲染的 HTML
+            (缓存在 data/factor_study/_cache，写入时清理旧条目)，
+            跳过表格 / 图表重建；生成时间在取用时填入。默认关闭
+    """
+    if not use_cache:
+        return _render_html_report(all_results).replace(
+            _GENERATED_AT_MARK, _generated_at(),
+        )
+
+    key = _html_cache_key(all_results)
+    cache_path = _HTML_CACHE_DIR / f"{key}.html"
+    if cache_path.exists():
+        logger.info(f"HTML 报告命中缓存: {cache_path}")
+        os.utime(cache_path)  # 刷新 mtime，清理时按最近使用保留
+        html = cache_path.read_text(encoding="utf-8")
+    else:
+        html = _render_html_report(all_results)
+
+        # 先写临时文件再原子替换，避免中断留下半截缓存
+        _HTML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(html, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+        _prune_html_cache()
+
+    return html.replace(_GENERATED_AT_MARK, _generated_at())
+
+
+def _generated_at() -> str:
+    """报告生成时间"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+def _html_cache_key(all_results: List[FactorStudyResults]) -> str:
+    """
+    HTML 缓存键: 渲染器版本 + 报告用到的分析结果
+
+    只取渲染会读到的字段 (因子 / 基准 / IS·OOS 的 IC 与事件结果 / IC 衰减 /
+    配置 / 日期划分)，不含 elapsed_seconds 等运行元信息。
+    """
+    payload = [
+        (
+            r.factor_name, r.benchmark_label, r.config,
+            r.ic_results, r.ic_decay, r.event_results,
+            r.oos_ic_results, r.oos_ic_decay, r.oos_event_results,
+            r.is_dates, r.oos_dates, r.oos_skipped,
+        )
+        for r in all_results
+    ]
+    return hashlib.blake2b(
+        pickle.dumps((_RENDER_VERSION, payload), protocol=pickle.HIGHEST_PROTOCOL),
+        digest_size=8,
+    ).hexdigest()
+
+
+def _prune_html_cache() -> None:
+    """删除超龄条目，并只保留最近使用的 _HTML_CACHE_MAX_ENTRIES 个"""
+    cutoff = datetime.now().timestamp() - _HTML_CACHE_MAX_AGE_DAYS * 86400
+    entries = sorted(
+        ((p.stat().st_mtime, p) for p in _HTML_CACHE_DIR.glob("*.html")),
+        reverse=True,
+    )
+    for i, (mtime, path) in enumerate(entries):
+        if i >= _HTML_CACHE_MAX_ENTRIES or mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+
+def _render_html_report(all_results: List[FactorStudyResults]) -> str:
+    """渲染 HTML 报告 (无缓存；生成时间留作占位符，由调用方填入)"""
+    now = _GENERATED_AT_MARK
     # 去重因子名
     factor_names = list(dict.fromkeys(r.factor_name for r in all_results))
     title = ", ".join(factor_names)
@@ -425,29 +586,14 @@ def _build_oos_section(all_results: List[FactorStudyResults]) -> str:
     has_multi_bench = len(set(r.benchmark_label for r in all_results)) > 1
 
     # 构建 OOS IC 表
-    oos_ic_rows = ""
+    oos_ic_rows: List[str] = []
     has_oos_ic = False
     for res in all_results:
         if res.oos_ic_results:
             has_oos_ic = True
-            bench = _bench_display(res)
+            bench_td = _bench_td(_bench_display(res), has_multi_bench)
             for ic in res.oos_ic_results:
-                sig_class = ' class="sig"' if ic.p_value < 0.05 else ""
-                star = "**" if ic.p_value < 0.01 else ("*" if ic.p_value < 0.05 else "")
-                bench_cell = f"<td style=\"text-align:left\">{bench}</td>" if has_multi_bench else ""
-                oos_ic_rows += f"""<tr>
-                    <td style="text-align:left">{ic.factor_name}</td>
-                    {bench_cell}
-                    <td>{ic.horizon}d</td>
-                    <td{sig_class}>{ic.mean_ic:.4f}</td>
-                    <td>{ic.std_ic:.4f}</td>
-                    <td{sig_class}>{ic.ic_ir:.2f}</td>
-                    <td>{ic.ic_hit_rate:.1%}</td>
-                    <td>{ic.n_ic_obs}</td>
-                    <td{sig_class}>{ic.t_stat:.2f}{star}</td>
-                    <td>{ic.p_value:.4f}</td>
-                    <td>{ic.top_bottom_spread:.4f}</td>
-                </tr>"""
+                oos_ic_rows.append(_ic_row(ic, bench_td))
 
     if not has_oos_ic:
         return ""
@@ -459,7 +605,7 @@ def _build_oos_section(all_results: List[FactorStudyResults]) -> str:
         <th>Std IC</th><th>IC_IR</th><th>Hit%</th><th>N</th>
         <th>t-stat</th><th>p-value</th><th>Q5-Q1</th>
     </tr></thead>
-    <tbody>{oos_ic_rows}</tbody>
+    <tbody>{"".join(oos_ic_rows)}</tbody>
 </table>"""
 
     # 构建 OOS 事件表
@@ -487,6 +633,41 @@ def _build_oos_section(all_results: List[FactorStudyResults]) -> str:
 """
 
 
+def _display_event_indices(events, p_fdr_values: List[float]) -> np.ndarray:
+    """
+    事件表展示行的下标: 显著 (p-FDR < 0.10 且 N ≥ 5) 的按 |t| 降序取前 30；
+    无显著信号时全部按 |t| 降序取前 20。
+
+    过滤与排序键一次性转成 NumPy 数组；|t| 相同保持原顺序。
+    """
+    n = len(events)
+    p_fdr = np.asarray(p_fdr_values, dtype=np.float64)
+    n_events = np.fromiter((ev.n_events for ev in events), np.int64, n)
+    abs_t = np.abs(np.fromiter((ev.t_stat for ev in events), np.float64, n))
+
+    candidates = np.flatnonzero((p_fdr < 0.10) & (n_events >= 5))
+    if len(candidates) == 0:
+        return _top_k_by_abs(abs_t, 20)
+    return candidates[_top_k_by_abs(abs_t[candidates], 30)]
+
+
+def _top_k_by_abs(abs_t: np.ndarray, k: int) -> np.ndarray:
+    """
+    |t| 最大的 k 个下标 (降序)，与 sorted(..., reverse=True)[:k] 结果一致
+
+    先用 np.partition 取第 k 大的值作门槛，只对不低于门槛的候选做稳定排序；
+    门槛处并列时保留下标较小者。
+    """
+    n = len(abs_t)
+    if n > k:
+        kth = np.partition(abs_t, n - k)[n - k]
+        candidates = np.flatnonzero(abs_t >= kth)
+    else:
+        candidates = np.arange(n)
+    order = np.argsort(-abs_t[candidates], kind="stable")[:k]
+    return candidates[order]
+
+
 def _build_event_table_from_list(events) -> str:
     """从事件列表构建 HTML 事件表 (带 FDR) — 向后兼容"""
     if not events:
@@ -494,32 +675,12 @@ def _build_event_table_from_list(events) -> str:
 
     p_values = [ev.p_value for ev in events]
     p_fdr_values = _apply_bh_fdr(p_values)
-    indexed = list(zip(events, p_fdr_values))
-
-    significant = [(ev, pf) for ev, pf in indexed
-                   if pf < 0.10 and ev.n_events >= 5]
-    significant.sort(key=lambda x: abs(x[0].t_stat), reverse=True)
-    display = significant[:30] if significant else sorted(
-        indexed, key=lambda x: abs(x[0].t_stat), reverse=True
-    )[:20]
-
-    rows = ""
-    for ev, p_fdr in display:
-        sig_class = ' class="sig"' if p_fdr < 0.05 else ""
-        star = "**" if p_fdr < 0.01 else ("*" if p_fdr < 0.05 else "")
-        rows += f"""<tr>
-            <td style="text-align:left">{ev.factor_name}</td>
-            <td style="text-align:left">{ev.signal_label}</td>
-            <td>{ev.horizon}d</td>
-            <td>{ev.n_events}</td>
-            <td>{ev.n_effective}</td>
-            <td{sig_class}>{ev.mean_return:.4f}</td>
-            <td>{ev.median_return:.4f}</td>
-            <td>{ev.hit_rate:.1%}</td>
-            <td{sig_class}>{ev.t_stat:.2f}{star}</td>
-            <td>{ev.p_value:.4f}</td>
-            <td{sig_class}>{p_fdr:.4f}</td>
-        </tr>"""
+    display = [
+        (events[i], p_fdr_values[i])
+        for i in _display_event_indices(events, p_fdr_values)
+    ]
+
+    rows = [_event_row(ev, p_fdr, "") for ev, p_fdr in display]
 
     return f"""<p style="color:#888;font-size:12px;">BH-FDR corrected ({len(events)} hypotheses)</p>
 <table>
@@ -528,7 +689,7 @@ def _build_event_table_from_list(events) -> str:
         <th>N</th><th>N_eff</th><th>Mean Ret</th><th>Median</th>
         <th>Hit%</th><th>t-stat</th><th>p-value</th><th>p-FDR</th>
     </tr></thead>
-    <tbody>{rows}</tbody>
+    <tbody>{"".join(rows)}</tbody>
 </table>"""
 
 
@@ -545,35 +706,16 @@ def _build_event_table_from_list_with_bench(
 
     p_values = [ev.p_value for ev in events]
     p_fdr_values = _apply_bh_fdr(p_values)
-    indexed = list(zip(events, benches, p_fdr_values))
-
-    significant = [(ev, b, pf) for ev, b, pf in indexed
-                   if pf < 0.10 and ev.n_events >= 5]
-    significant.sort(key=lambda x: abs(x[0].t_stat), reverse=True)
-    display = significant[:30] if significant else sorted(
-        indexed, key=lambda x: abs(x[0].t_stat), reverse=True
-    )[:20]
+    display = [
+        (events[i], benches[i], p_fdr_values[i])
+        for i in _display_event_indices(events, p_fdr_values)
+    ]
 
     bench_th = "<th>基准</th>" if has_multi_bench else ""
-    rows = ""
-    for ev, bench, p_fdr in display:
-        sig_class = ' class="sig"' if p_fdr < 0.05 else ""
-        star = "**" if p_fdr < 0.01 else ("*" if p_fdr < 0.05 else "")
-        bench_td = f'<td style="text-align:left">{bench}</td>' if has_multi_bench else ""
-        rows += f"""<tr>
-            <td style="text-align:left">{ev.factor_name}</td>
-            {bench_td}
-            <td style="text-align:left">{ev.signal_label}</td>
-            <td>{ev.horizon}d</td>
-            <td>{ev.n_events}</td>
-            <td>{ev.n_effective}</td>
-            <td{sig_class}>{ev.mean_return:.4f}</td>
-            <td>{ev.median_return:.4f}</td>
-            <td>{ev.hit_rate:.1%}</td>
-            <td{sig_class}>{ev.t_stat:.2f}{star}</td>
-            <td>{ev.p_value:.4f}</td>
-            <td{sig_class}>{p_fdr:.4f}</td>
-        </tr>"""
+    rows = [
+        _event_row(ev, p_fdr, _bench_td(bench, has_multi_bench))
+        for ev, bench, p_fdr in display
+    ]
 
     return f"""<p style="color:#888;font-size:12px;">BH-FDR corrected ({len(events)} hypotheses)</p>
 <table>
@@ -582,7 +724,7 @@ def _build_event_table_from_list_with_bench(
         <th>N</th><th>N_eff</th><th>Mean Ret</th><th>Median</th>
         <th>Hit%</th><th>t-stat</th><th>p-value</th><th>p-FDR</th>
     </tr></thead>
-    <tbody>{rows}</tbody>
+    <tbody>{"".join(rows)}</tbody>
 </table>"""
 
 
@@ -617,26 +759,11 @@ def _build_ic_table(all_results: List[FactorStudyResults]) -> str:
         ret_label = "Forward Return"
 
     bench_th = "<th>基准</th>" if has_multi_bench else ""
-    rows = ""
+    rows: List[str] = []
     for r in all_results:
-        bench = _bench_display(r)
+        bench_td = _bench_td(_bench_display(r), has_multi_bench)
         for ic in r.ic_results:
-            sig_class = ' class="sig"' if ic.p_value < 0.05 else ""
-            star = "**" if ic.p_value < 0.01 else ("*" if ic.p_value < 0.05 else "")
-            bench_td = f'<td style="text-align:left">{bench}</td>' if has_multi_bench else ""
-            rows += f"""<tr>
-                <td style="text-align:left">{ic.factor_name}</td>
-                {bench_td}
-                <td>{ic.horizon}d</td>
-                <td{sig_class}>{ic.mean_ic:.4f}</td>
-                <td>{ic.std_ic:.4f}</td>
-                <td{sig_class}>{ic.ic_ir:.2f}</td>
-                <td>{ic.ic_hit_rate:.1%}</td>
-                <td>{ic.n_ic_obs}</td>
-                <td{sig_class}>{ic.t_stat:.2f}{star}</td>
-                <td>{ic.p_value:.4f}</td>
-                <td>{ic.top_bottom_spread:.4f}</td>
-            </tr>"""
+            rows.append(_ic_row(ic, bench_td))
 
     return f"""<p style="color:#888;font-size:12px;">收益类型: {ret_label}</p>
 <table>
@@ -645,7 +772,7 @@ def _build_ic_table(all_results: List[FactorStudyResults]) -> str:
         <th>Std IC</th><th>IC_IR</th><th>Hit%</th><th>N</th>
         <th>t-stat</th><th>p-value</th><th>Q5-Q1</th>
     </tr></thead>
-    <tbody>{rows}</tbody>
+    <tbody>{"".join(rows)}</tbody>
 </table>"""
 
 
@@ -662,8 +789,8 @@ def _build_decay_chart(all_results: List[FactorStudyResults]) -> str:
             label = f"{r.ic_decay.factor_name} (vs {bench})" if bench else r.ic_decay.factor_name
             dash = dash_patterns[i % len(dash_patterns)]
             datasets.append(f"""{{
-                label: '{label}',
-                data: {r.ic_decay.mean_ics},
+                label: {_js(label)},
+                data: {_js(r.ic_decay.mean_ics)},
                 borderColor: '{color}',
                 borderDash: {dash},
                 borderWidth: 2,
@@ -673,7 +800,7 @@ def _build_decay_chart(all_results: List[FactorStudyResults]) -> str:
 
     labels = "[]"
     if all_results and all_results[0].ic_decay:
-        labels = str(all_results[0].ic_decay.horizons)
+        labels = _js(all_results[0].ic_decay.horizons)
 
     return f"""
 new Chart(document.getElementById('decayChart'), {{
@@ -707,24 +834,22 @@ def _build_quantile_chart(all_results: List[FactorStudyResults]) -> str:
         if not r.ic_results:
             continue
         longest = r.ic_results[-1]
-        if not longest.quantile_returns:
+        q_rets = longest.quantile_returns
+        if not q_rets:
             continue
 
-        data = []
         if not q_labels:
-            for q in sorted(longest.quantile_returns.keys()):
-                q_labels.append(f"Q{q}")
+            q_labels = [f"Q{q}" for q in range(1, len(q_rets) + 1)]
 
-        for q in sorted(longest.quantile_returns.keys()):
-            data.append(round(longest.quantile_returns[q], 6))
+        data = [round(ret, 6) for ret in q_rets]
 
         bench = _bench_display(r)
         label = f"{r.factor_name} (vs {bench})" if bench else r.factor_name
         color = colors[idx % len(colors)]
 
         datasets_js.append(f"""{{
-            label: '{label}',
-            data: {data},
+            label: {_js(label)},
+            data: {_js(data)},
             backgroundColor: '{color}',
         }}""")
 
@@ -741,7 +866,7 @@ def _build_quantile_chart(all_results: List[FactorStudyResults]) -> str:
 new Chart(document.getElementById('quantileChart'), {{
     type: 'bar',
     data: {{
-        labels: {q_labels},
+        labels: {_js(q_labels)},
         datasets: [{','.join(datasets_js)}]
     }},
     options: {{
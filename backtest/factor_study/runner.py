@@ -7,8 +7,8 @@ FactorStudyRunner — 编排器
 3. FOR each comp_date:
      sliced = adapter.slice_to_date(comp_date)
      FOR each factor:
-       scores[factor][symbol].append((date, score))
-4. FOR each benchmark:
+       scores[factor][symbol, date] = score
+4. FOR each factor (config.n_jobs > 1 时进程池并行), FOR each benchmark:
      return_matrices = build_return_matrix(...)
      Track 1: analyze_ic(scores, return_matrices)
      Track 2: event_study(events, return_matrices)
@@ -17,10 +17,12 @@ FactorStudyRunner — 编排器
 
 import logging
 import time
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from itertools import compress
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backtest.config import FREQ_DAYS, FactorStudyConfig
@@ -29,15 +31,23 @@ from backtest.factor_study.forward_returns import (
     build_excess_return_matrix,
     build_return_matrix,
 )
-from backtest.factor_study.ic_analysis import ICDecayCurve, ICResult, analyze_ic
+from backtest.factor_study.ic_analysis import (
+    ICDecayCurve,
+    ICResult,
+    analyze_ic,
+)
 from backtest.factor_study.protocol import Factor
-from backtest.factor_study.signals import SignalDefinition, detect_signals
+from backtest.factor_study.signals import (
+    SignalDefinition,
+    detect_signals_batch,
+)
 from backtest.factor_study.sweep import get_default_sweep
+from backtest.parallel import pool_context, resolve_n_jobs
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FactorStudyResults:
     """单个因子 × 单个基准的完整研究结果"""
     factor_name: str
@@ -103,18 +113,19 @@ class FactorStudyRunner:
 
         # Step 1: 加载数据 (一次)
         full_data = self._adapter.load_all()
-        all_dates = self._adapter.get_trading_dates()
+        all_dates = np.asarray(self._adapter.get_trading_dates(), dtype=str)
         logger.info(f"数据加载完成: {len(full_data)} symbols, {len(all_dates)} 交易日")
 
-        # 日期过滤
+        # 日期过滤 (日历升序，searchsorted 截取区间)
+        lo, hi = 0, len(all_dates)
         if self._config.start_date:
-            all_dates = [d for d in all_dates if d >= self._config.start_date]
+            lo = int(np.searchsorted(all_dates, self._config.start_date, side="left"))
         if self._config.end_date:
-            all_dates = [d for d in all_dates if d <= self._config.end_date]
+            hi = int(np.searchsorted(all_dates, self._config.end_date, side="right"))
 
-        # Step 2: 计算日期采样
+        # Step 2: 计算日期采样 (下游仍按 List[str] 使用)
         freq_days = FREQ_DAYS.get(self._config.computation_freq, 5)
-        computation_dates = all_dates[::freq_days]
+        computation_dates = all_dates[lo:hi:freq_days].tolist()
         logger.info(f"计算频率={self._config.computation_freq}, 计算日数={len(computation_dates)}")
 
         # Step 3: 构建多组 return_matrices
@@ -153,88 +164,150 @@ class FactorStudyRunner:
                 full_data, computation_dates, self._config.forward_horizons,
             )
 
-        # Step 4: 逐因子计算分数 (一次)，然后对每个基准分析
+        # Step 4: 按日期一次切片、全部因子共用，分数只算一次；然后逐因子对每个基准分析
+        factor_scores = self._compute_scores(
+            self._factors, full_data, computation_dates,
+        )
         all_results: List[FactorStudyResults] = []
 
-        for factor in self._factors:
-            t0 = time.time()
-            name = factor.meta.name
-            logger.info(f"开始因子研究: {name}")
+        # 分析阶段各因子互不依赖: n_jobs > 1 时按因子分发到进程池
+        n_workers = resolve_n_jobs(self._config.n_jobs, len(self._factors))
+        if n_workers > 1:
+            logger.info(f"因子分析并行: {len(self._factors)} 因子, 进程数={n_workers}")
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=pool_context(),
+                initializer=_init_worker,
+                initargs=(
+                    self._config, self._sweep_overrides,
+                    computation_dates, bench_return_matrices,
+                ),
+            ) as executor:
+                futures = [
+                    executor.submit(_study_factor_worker, factor, table, seconds)
+                    for factor, (table, seconds) in zip(self._factors, factor_scores)
+                ]
+                for future in futures:
+                    all_results.extend(future.result())
+        else:
+            for factor, (table, seconds) in zip(self._factors, factor_scores):
+                all_results.extend(self._study_factor(
+                    factor, table, seconds,
+                    computation_dates, bench_return_matrices,
+                ))
+
+        return all_results
 
-            # 因子分数只算一次
-            score_dict, symbols_seen = self._compute_scores(
-                factor, full_data, computation_dates,
+    def _study_factor(
+        self,
+        factor: Factor,
+        table: "_ScoreTable",
+        score_seconds: float,
+        computation_dates: List[str],
+        bench_return_matrices: Dict[str, Dict[int, pd.DataFrame]],
+    ) -> List[FactorStudyResults]:
+        """单个因子 × 全部基准的分析 (分数已算好)"""
+        t0 = time.time() - score_seconds
+        name = factor.meta.name
+        logger.info(f"开始因子研究: {name}")
+
+        # 分数矩阵 / SoA 历史跨基准 / IS / OOS 共享
+        score_arrays = table.to_arrays(computation_dates)
+        score_matrix = table.to_frame(computation_dates)
+        # 信号事件与基准无关: 每个信号定义只检测一次 (全部日期)，
+        # 各基准 / IS / OOS 再按日期过滤
+        sweep_events = self._detect_sweep_events(name, score_arrays)
+
+        # 对每个基准的 return_matrices 做分析
+        results: List[FactorStudyResults] = []
+        for bench_label, return_matrices in bench_return_matrices.items():
+            result = self._analyze_factor(
+                factor, score_arrays, table.n_symbols,
+                computation_dates, return_matrices,
+                bench_label, score_matrix, sweep_events,
             )
+            result.elapsed_seconds = time.time() - t0
+            results.append(result)
 
-            # 对每个基准的 return_matrices 做分析
-            for bench_label, return_matrices in bench_return_matrices.items():
-                result = self._analyze_factor(
-                    factor, score_dict, symbols_seen,
-                    computation_dates, return_matrices,
-                    bench_label,
-                )
-                result.elapsed_seconds = time.time() - t0
-                all_results.append(result)
-
-                bench_display = bench_label or "raw"
-                logger.info(
-                    f"完成 {name} (vs {bench_display}): "
-                    f"IC results={len(result.ic_results)}, "
-                    f"Event results={len(result.event_results)}, "
-                    f"耗时={result.elapsed_seconds:.1f}s"
-                )
+            bench_display = bench_label or "raw"
+            logger.info(
+                f"完成 {name} (vs {bench_display}): "
+                f"IC results={len(result.ic_results)}, "
+                f"Event results={len(result.event_results)}, "
+                f"耗时={result.elapsed_seconds:.1f}s"
+            )
 
-        return all_results
+        return results
 
     def _compute_scores(
         self,
-        factor: Factor,
+        factors: List[Factor],
         full_data: Dict,
         computation_dates: List[str],
-    ) -> Tuple[Dict[str, List[Tuple[str, float]]], set]:
-        """计算因子分数 (只算一次，跨基准共享)
+    ) -> List[Tuple["_ScoreTable", float]]:
+        """计算全部因子的分数 (只算一次，跨基准共享)
+
+        外层按日期、内层按因子: 每个计算日期只 slice_to_date 一次，
+        切片结果交给所有因子，而不是每个因子各自重走一遍日期循环。
 
         Returns:
-            (score_dict, symbols_seen)
+            与 factors 一一对应的 (分数表, 计算耗时秒数)
         """
-        name = factor.meta.name
-        score_history: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
-        symbols_seen = set()
+        tables = [
+            _ScoreTable(len(computation_dates), len(full_data)) for _ in factors
+        ]
+        seconds = [0.0] * len(factors)
 
         for i, comp_date in enumerate(computation_dates):
             sliced = self._adapter.slice_to_date(comp_date)
             if not sliced:
                 continue
 
-            scores = factor.compute(sliced, comp_date)
-
-            for sym, score in scores.items():
-                score_history[sym].append((comp_date, score))
-                symbols_seen.add(sym)
+            for k, factor in enumerate(factors):
+                t0 = time.time()
+                tables[k].add(i, factor.compute(sliced, comp_date))
+                seconds[k] += time.time() - t0
 
             if (i + 1) % 50 == 0:
                 logger.debug(
-                    f"  {name}: {i+1}/{len(computation_dates)} 日, "
-                    f"{len(scores)} symbols"
+                    f"  因子分数: {i+1}/{len(computation_dates)} 日, "
+                    f"{len(sliced)} symbols"
                 )
 
-        logger.info(
-            f"  因子分数计算完成: {len(score_history)} symbols × "
-            f"{len(computation_dates)} 日"
-        )
+        for factor, table in zip(factors, tables):
+            logger.info(
+                f"  {factor.meta.name} 因子分数计算完成: "
+                f"{table.n_symbols} symbols × {len(computation_dates)} 日"
+            )
 
-        return dict(score_history), symbols_seen
+        return list(zip(tables, seconds))
+
+    def _detect_sweep_events(
+        self,
+        name: str,
+        score_history: Dict,
+    ) -> List[Tuple[SignalDefinition, Dict[str, List[str]]]]:
+        """按参数扫描逐个信号定义检测事件 → [(signal_def, events), ...]"""
+        sweep = self._sweep_overrides.get(name) or get_default_sweep(name)
+        return list(zip(sweep, detect_signals_batch(score_history, sweep)))
 
     def _analyze_factor(
         self,
         factor: Factor,
         score_dict: Dict[str, List[Tuple[str, float]]],
-        symbols_seen: set,
+        n_symbols: int,
         computation_dates: List[str],
         return_matrices: Dict[int, pd.DataFrame],
         benchmark_label: str,
+        score_matrix: Optional[pd.DataFrame] = None,
+        sweep_events: Optional[
+            List[Tuple[SignalDefinition, Dict[str, List[str]]]]
+        ] = None,
     ) -> FactorStudyResults:
-        """对单个因子 × 单个基准做 IC + 事件研究 (含 IS/OOS 分割)"""
+        """对单个因子 × 单个基准做 IC + 事件研究 (含 IS/OOS 分割)
+
+        sweep_events: _detect_sweep_events() 的预计算结果；None = 现场检测
+        """
         name = factor.meta.name
 
         # IS/OOS 日期分割
@@ -283,7 +356,7 @@ class FactorStudyRunner:
             config=self._config,
             benchmark_label=benchmark_label,
             n_computation_dates=len(computation_dates),
-            n_symbols=len(symbols_seen),
+            n_symbols=n_symbols,
             is_dates=list(is_dates),
             oos_dates=list(oos_dates),
             oos_skipped=not has_oos,
@@ -292,18 +365,19 @@ class FactorStudyRunner:
         if not score_dict:
             return result
 
-        sweep = self._sweep_overrides.get(name) or get_default_sweep(name)
+        if sweep_events is None:
+            sweep_events = self._detect_sweep_events(name, score_dict)
 
         # ── In-Sample ─────────────────────────────────────
         result.ic_results, result.ic_decay = analyze_ic(
             factor.meta, score_dict, return_matrices,
             is_dates, self._config.n_quantiles,
+            score_matrix=score_matrix,
         )
 
         is_date_set = set(is_dates)
-        for signal_def in sweep:
-            events = detect_signals(score_dict, signal_def)
-            events = _filter_events(events, is_date_set)
+        for signal_def, all_events in sweep_events:
+            events = _filter_events(all_events, is_date_set)
             if not events:
                 continue
             evts = run_event_study(name, signal_def, events, return_matrices)
@@ -314,13 +388,13 @@ class FactorStudyRunner:
             result.oos_ic_results, result.oos_ic_decay = analyze_ic(
                 factor.meta, score_dict, return_matrices,
                 oos_dates, self._config.n_quantiles,
+                score_matrix=score_matrix,
             )
 
             oos_date_set = set(oos_dates)
             result.oos_event_results = []
-            for signal_def in sweep:
-                events = detect_signals(score_dict, signal_def)
-                events = _filter_events(events, oos_date_set)
+            for signal_def, all_events in sweep_events:
+                events = _filter_events(all_events, oos_date_set)
                 if not events:
                     continue
                 evts = run_event_study(
@@ -331,6 +405,107 @@ class FactorStudyRunner:
         return result
 
 
+# ── 进程池 worker ─────────────────────────────────────
+
+_WORKER_RUNNER: Optional[FactorStudyRunner] = None
+_WORKER_DATES: List[str] = []
+_WORKER_RETURNS: Dict[str, Dict[int, pd.DataFrame]] = {}
+
+
+def _init_worker(
+    config: FactorStudyConfig,
+    sweep_overrides: Dict[str, List[SignalDefinition]],
+    computation_dates: List[str],
+    bench_return_matrices: Dict[str, Dict[int, pd.DataFrame]],
+) -> None:
+    """worker 初始化: 每个进程只接收一次收益矩阵 / 日期 / 扫描配置"""
+    global _WORKER_RUNNER, _WORKER_DATES, _WORKER_RETURNS
+    _WORKER_RUNNER = FactorStudyRunner(config, adapter=None)
+    for factor_name, signals in sweep_overrides.items():
+        _WORKER_RUNNER.set_sweep(factor_name, signals)
+    _WORKER_DATES = computation_dates
+    _WORKER_RETURNS = bench_return_matrices
+
+
+def _study_factor_worker(
+    factor: Factor,
+    table: "_ScoreTable",
+    score_seconds: float,
+) -> List[FactorStudyResults]:
+    """worker 内执行单个因子 × 全部基准的分析"""
+    return _WORKER_RUNNER._study_factor(
+        factor, table, score_seconds, _WORKER_DATES, _WORKER_RETURNS,
+    )
+
+
+class _ScoreTable:
+    """
+    单个因子的分数表: (symbol × 计算日期) float64 矩阵 + 出现掩码
+
+    替代 {symbol: [(date, score), ...]} 的逐条元组追加；行按 symbol
+    首次出现顺序分配，容量不足时按倍数扩容。未出现的 (symbol, 日期) 不计入
+    SoA 历史 (与元组列表语义一致，不会被当作 NaN 分数插入序列)。
+    """
+
+    def __init__(self, n_dates: int, capacity: int):
+        capacity = max(capacity, 1)
+        self._values = np.full((capacity, n_dates), np.nan)
+        self._present = np.zeros((capacity, n_dates), dtype=bool)
+        self._rows: Dict[str, int] = {}
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._rows)
+
+    @property
+    def n_symbols(self) -> int:
+        """出现过的 symbol 数 (行数)"""
+        return len(self._rows)
+
+    def add(self, col: int, scores: Dict[str, float]) -> None:
+        """写入第 col 个计算日期的 {symbol: score}"""
+        if not scores:
+            return
+        rows = [self._row(sym) for sym in scores]
+        self._values[rows, col] = list(scores.values())
+        self._present[rows, col] = True
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            row = self._rows[symbol] = len(self._rows)
+            if row >= len(self._values):
+                grow = len(self._values)
+                self._values = np.vstack(
+                    [self._values, np.full_like(self._values[:grow], np.nan)],
+                )
+                self._present = np.vstack(
+                    [self._present, np.zeros_like(self._present[:grow])],
+                )
+        return row
+
+    def to_arrays(
+        self, dates: List[str],
+    ) -> Dict[str, Tuple[List[str], np.ndarray]]:
+        """{symbol: (出现日期, float64 分数)} — detect_signals / analyze_ic 的 SoA 输入"""
+        return {
+            sym: (
+                list(compress(dates, self._present[row])),
+                self._values[row, self._present[row]],
+            )
+            for sym, row in self._rows.items()
+        }
+
+    def to_frame(self, dates: List[str]) -> pd.DataFrame:
+        """DataFrame[date x symbol]，布局同 build_score_matrix()"""
+        n = len(self._rows)
+        return pd.DataFrame(
+            self._values[:n].T,
+            index=pd.Index(dates, name="date"),
+            columns=self.symbols,
+        )
+
+
 def _filter_score_history(
     score_history: Dict[str, List[Tuple[str, float]]],
     dates_set: set,
@@ -6,7 +6,12 @@ detect_signals() 接收因子分数历史，按 SignalDefinition 规则检测事
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Tuple
+from itertools import compress
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from backtest.factor_study.protocol import SymbolHistory, score_arrays
 
 
 class SignalType(Enum):
@@ -17,9 +22,9 @@ class SignalType(Enum):
     SUSTAINED = "sustained"       # 连续 N 期 score > X
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SignalDefinition:
-    """信号定义"""
+    """信号定义 (不可变，可作 dict / set 键)"""
     signal_type: SignalType
     threshold: float
     sustained_n: int = 1          # SUSTAINED 专用: 连续 N 期
@@ -32,81 +37,157 @@ class SignalDefinition:
 
 
 def detect_signals(
-    score_history: Dict[str, List[Tuple[str, float]]],
+    score_history: Dict[str, SymbolHistory],
     signal_def: SignalDefinition,
 ) -> Dict[str, List[str]]:
     """
     检测信号事件
 
     Args:
-        score_history: {symbol: [(date, score), ...]}
+        score_history: {symbol: [(date, score), ...]} 或 {symbol: (dates, scores)} SoA
             每只股票的因子分数时间序列，按日期正序
         signal_def: 信号定义
 
     Returns:
         {symbol: [event_date, ...]} — 触发信号的日期列表
     """
-    events: Dict[str, List[str]] = {}
+    return detect_signals_batch(score_history, [signal_def])[0]
+
+
+def detect_signals_batch(
+    score_history: Dict[str, SymbolHistory],
+    signal_defs: Sequence[SignalDefinition],
+) -> List[Dict[str, List[str]]]:
+    """
+    批量检测多个信号定义 (参数扫描用)
+
+    逐只股票一次性跑完全部信号定义，同一阈值的比较掩码
+    (score > X / score < X) 在 THRESHOLD / CROSS / SUSTAINED 之间共用。
+
+    阈值落在全部分数 [min, max] 之外、注定零事件的定义直接跳过
+    (结果仍占位为空 dict)。
+
+    Returns:
+        与 signal_defs 一一对应的 {symbol: [event_date, ...]} 列表
+    """
+    all_events: List[Dict[str, List[str]]] = [{} for _ in signal_defs]
 
+    arrays = []
+    lo, hi = np.inf, -np.inf
     for symbol, history in score_history.items():
-        if not history:
+        dates, scores = score_arrays(history)
+        if len(scores) == 0:
             continue
+        arrays.append((symbol, dates, scores))
+        finite = scores[~np.isnan(scores)]
+        if len(finite):
+            lo = min(lo, finite.min())
+            hi = max(hi, finite.max())
+
+    active = [
+        (events, signal_def)
+        for events, signal_def in zip(all_events, signal_defs)
+        if _can_trigger(signal_def, lo, hi)
+    ]
+    if not active:
+        return all_events
+
+    for symbol, dates, scores in arrays:
+        masks = _ThresholdMasks(scores)
+        for events, signal_def in active:
+            symbol_events = _detect_for_symbol(dates, masks, signal_def)
+            if symbol_events:
+                events[symbol] = symbol_events
+
+    return all_events
+
+
+def _can_trigger(signal_def: SignalDefinition, lo: float, hi: float) -> bool:
+    """
+    全局分数范围 [lo, hi] 内该信号是否可能触发
+
+    THRESHOLD / CROSS_UP / SUSTAINED 需要 score > X，X ≥ hi 时不可能；
+    CROSS_DOWN 需要 score < X，X ≤ lo 时不可能。
+    """
+    if signal_def.signal_type == SignalType.CROSS_DOWN:
+        return signal_def.threshold > lo
+    return signal_def.threshold < hi
+
+
+class _ThresholdMasks:
+    """单只股票的阈值比较掩码缓存 (按阈值懒计算，跨信号定义复用)"""
 
-        symbol_events = _detect_for_symbol(history, signal_def)
-        if symbol_events:
-            events[symbol] = symbol_events
+    def __init__(self, scores: np.ndarray):
+        self.scores = scores
+        self.is_nan = np.isnan(scores)
+        self._above: Dict[float, np.ndarray] = {}
+        self._below: Dict[float, np.ndarray] = {}
 
-    return events
+    def above(self, threshold: float) -> np.ndarray:
+        """score > threshold (NaN 为 False)"""
+        mask = self._above.get(threshold)
+        if mask is None:
+            mask = self._above[threshold] = self.scores > threshold
+        return mask
+
+    def below(self, threshold: float) -> np.ndarray:
+        """score < threshold (NaN 为 False)"""
+        mask = self._below.get(threshold)
+        if mask is None:
+            mask = self._below[threshold] = self.scores < threshold
+        return mask
 
 
 def _detect_for_symbol(
-    history: List[Tuple[str, float]],
+    dates: Sequence[str],
+    masks: _ThresholdMasks,
     signal_def: SignalDefinition,
 ) -> List[str]:
-    """单只股票的信号检测"""
+    """单只股票的信号检测 (布尔掩码向量化；NaN 比较为 False，与逐元素判断一致)"""
+    mask = _signal_mask(masks, signal_def)
+    if mask is None:
+        return []
+    return list(compress(dates, mask))
+
+
+def _signal_mask(
+    masks: _ThresholdMasks,
+    signal_def: SignalDefinition,
+) -> Optional[np.ndarray]:
+    """触发日期的布尔掩码 (与 scores 等长)；不支持的定义返回 None"""
     st = signal_def.signal_type
     threshold = signal_def.threshold
-    events: List[str] = []
+    n_dates = len(masks.scores)
 
     if st == SignalType.THRESHOLD:
-        for date, score in history:
-            if score > threshold:
-                events.append(date)
-
-    elif st == SignalType.CROSS_UP:
-        for i in range(1, len(history)):
-            prev_score = history[i - 1][1]
-            curr_score = history[i][1]
-            curr_date = history[i][0]
-            if prev_score <= threshold < curr_score:
-                events.append(curr_date)
-
-    elif st == SignalType.CROSS_DOWN:
-        for i in range(1, len(history)):
-            prev_score = history[i - 1][1]
-            curr_score = history[i][1]
-            curr_date = history[i][0]
-            if prev_score >= threshold > curr_score:
-                events.append(curr_date)
-
-    elif st == SignalType.SUSTAINED:
+        return masks.above(threshold)
+
+    if st == SignalType.CROSS_UP:
+        # 前期 ≤ X 即「非 NaN 且非 > X」
+        above = masks.above(threshold)
+        mask = np.zeros(n_dates, dtype=bool)
+        mask[1:] = ~(above[:-1] | masks.is_nan[:-1]) & above[1:]
+        return mask
+
+    if st == SignalType.CROSS_DOWN:
+        # 前期 ≥ X 即「非 NaN 且非 < X」
+        below = masks.below(threshold)
+        mask = np.zeros(n_dates, dtype=bool)
+        mask[1:] = ~(below[:-1] | masks.is_nan[:-1]) & below[1:]
+        return mask
+
+    if st == SignalType.SUSTAINED:
         n = signal_def.sustained_n
         if n < 1:
-            return events
-
-        # 滑动窗口: 连续 N 期 > threshold
-        # 只在第一天达标时触发，避免重复
-        consecutive = 0
-        triggered = False
-
-        for date, score in history:
-            if score > threshold:
-                consecutive += 1
-                if consecutive >= n and not triggered:
-                    events.append(date)
-                    triggered = True
-            else:
-                consecutive = 0
-                triggered = False
-
-    return events
+            return None
+
+        # 连续 N 期 > threshold，只在连续段第 N 天触发一次 (避免重复)
+        # 掩码首尾补 False 后的变化点两两成对 = 各连续段的 [起点, 终点)
+        above = masks.above(threshold)
+        edges = np.flatnonzero(np.diff(above, prepend=False, append=False))
+        starts, ends = edges[::2], edges[1::2]
+        mask = np.zeros(n_dates, dtype=bool)
+        mask[starts[ends - starts >= n] + (n - 1)] = True
+        return mask
+
+    return None
@@ -1,11 +1,12 @@
 """
 参数网格 — 每个因子的默认阈值 + 信号定义组合
 
-提供 get_default_sweep(factor_name) 返回 List[SignalDefinition]，
+提供 get_default_sweep(factor_name) 返回 Tuple[SignalDefinition, ...] (按因子名缓存)，
 以及支持自定义阈值覆盖。
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from backtest.factor_study.signals import SignalDefinition, SignalType
 
@@ -78,21 +79,25 @@ _DEFAULT_GRIDS: Dict[str, dict] = {
 }
 
 
-def get_default_sweep(factor_name: str) -> List[SignalDefinition]:
+@lru_cache(maxsize=64)
+def get_default_sweep(factor_name: str) -> Tuple[SignalDefinition, ...]:
     """
     获取因子的默认参数扫描列表
 
+    结果按因子名缓存；返回不可变 tuple，SignalDefinition 为 frozen，
+    多次调用共享同一份对象是安全的。
+
     Args:
         factor_name: 因子名称
 
     Returns:
-        SignalDefinition 列表
+        SignalDefinition tuple (未知因子返回空 tuple)
     """
     grid = _DEFAULT_GRIDS.get(factor_name)
     if grid is None:
-        return []
+        return ()
 
-    return _grid_to_signals(grid)
+    return tuple(_grid_to_signals(grid))
 
 
 def build_custom_sweep(
@@ -6,8 +6,9 @@ CAGR、Sharpe、Sortino、Calmar、MaxDD、年化波动率、
 Alpha、Beta、信息比率、跟踪误差、年化换手率、总交易成本、胜率
 """
 
+import math
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -15,6 +16,9 @@ import numpy as np
 TRADING_DAYS_PER_YEAR = 252  # 美股
 CALENDAR_DAYS_PER_YEAR = 365  # 币圈
 
+# 基准 NAV: [(date, nav), ...] 或 (dates, navs) 数组对
+BenchmarkNav = Union[List[Tuple[str, float]], Tuple[np.ndarray, np.ndarray]]
+
 
 @dataclass
 class BacktestMetrics:
@@ -46,7 +50,7 @@ class BacktestMetrics:
 
 def compute_metrics(
     nav_series: List[Tuple[str, float]],
-    benchmark_nav: Optional[List[Tuple[str, float]]] = None,
+    benchmark_nav: Optional[BenchmarkNav] = None,
     total_costs: float = 0.0,
     n_trades: int = 0,
     annual_turnover: float = 0.0,
@@ -57,7 +61,7 @@ def compute_metrics(
 
     Args:
         nav_series: [(date, nav), ...] 按日期排序
-        benchmark_nav: [(date, nav), ...] 基准净值序列 (可选)
+        benchmark_nav: [(date, nav), ...] 或 (dates, navs) 数组对 — 基准净值序列 (可选)
         total_costs: 总交易成本
         n_trades: 总交易笔数
         annual_turnover: 年化换手率
@@ -67,6 +71,31 @@ def compute_metrics(
         BacktestMetrics 数据类
     """
     navs = np.array([nav for _, nav in nav_series], dtype=np.float64)
+    return compute_metrics_from_navs(
+        navs,
+        benchmark_nav=benchmark_nav,
+        total_costs=total_costs,
+        n_trades=n_trades,
+        annual_turnover=annual_turnover,
+        days_per_year=days_per_year,
+    )
+
+
+def compute_metrics_from_navs(
+    navs: np.ndarray,
+    benchmark_nav: Optional[BenchmarkNav] = None,
+    total_costs: float = 0.0,
+    n_trades: int = 0,
+    annual_turnover: float = 0.0,
+    days_per_year: int = TRADING_DAYS_PER_YEAR,
+) -> BacktestMetrics:
+    """
+    compute_metrics 的数组入口: 直接接收 float64 NAV 数组
+
+    回测引擎 / 参数扫描已持有 NAV 数组，跳过 (date, nav) 元组拆包。
+    其余参数同 compute_metrics。
+    """
+    navs = np.asarray(navs, dtype=np.float64)
     n_days = len(navs)
 
     if n_days < 2:
@@ -83,8 +112,12 @@ def compute_metrics(
     else:
         cagr = 0.0
 
+    # ── 日收益统计 (std / 下行 std / 胜率 一次汇总) ──
+    daily_std, downside_std, win_rate = _return_stats(daily_returns)
+
     # ── 波动率 ─────────────────────────────────────
-    annual_vol = float(np.std(daily_returns, ddof=1) * np.sqrt(days_per_year))
+    sqrt_days = math.sqrt(days_per_year)
+    annual_vol = daily_std * sqrt_days
 
     # ── 最大回撤 ───────────────────────────────────
     max_dd, max_dd_duration = _max_drawdown(navs)
@@ -93,9 +126,8 @@ def compute_metrics(
     sharpe = cagr / annual_vol if annual_vol > 1e-10 else 0.0
 
     # ── Sortino ────────────────────────────────────
-    downside = daily_returns[daily_returns < 0]
-    if len(downside) > 1:
-        downside_vol = float(np.std(downside, ddof=1) * np.sqrt(days_per_year))
+    if downside_std is not None:
+        downside_vol = downside_std * sqrt_days
         sortino = cagr / downside_vol if downside_vol > 1e-10 else 0.0
     else:
         sortino = 0.0
@@ -103,15 +135,14 @@ def compute_metrics(
     # ── Calmar ─────────────────────────────────────
     calmar = cagr / abs(max_dd) if abs(max_dd) > 1e-10 else 0.0
 
-    # ── 胜率 ───────────────────────────────────────
-    win_rate = float(np.mean(daily_returns > 0)) if len(daily_returns) > 0 else 0.0
-
     # ── Alpha / Beta / IR / TE (需要基准) ──────────
     alpha, beta, ir, te = 0.0, 0.0, 0.0, 0.0
-    if benchmark_nav is not None and len(benchmark_nav) >= 2:
-        alpha, beta, ir, te = _relative_metrics(
-            daily_returns, benchmark_nav, days_per_year
-        )
+    if benchmark_nav is not None:
+        bm_navs = _benchmark_values(benchmark_nav)
+        if len(bm_navs) >= 2:
+            alpha, beta, ir, te = _relative_metrics(
+                daily_returns, bm_navs, days_per_year
+            )
 
     return BacktestMetrics(
         total_return=round(total_return, 6),
@@ -136,45 +167,86 @@ def compute_metrics(
 
 # ── 内部函数 ─────────────────────────────────────────
 
+def _benchmark_values(benchmark_nav: BenchmarkNav) -> np.ndarray:
+    """从两种基准 NAV 形式中取出 float64 净值数组"""
+    if isinstance(benchmark_nav, tuple):
+        return np.asarray(benchmark_nav[1], dtype=np.float64)
+    return np.array([nav for _, nav in benchmark_nav], dtype=np.float64)
+
+
+def _return_stats(
+    daily_returns: np.ndarray,
+) -> Tuple[float, Optional[float], float]:
+    """
+    日收益率的样本标准差、下行样本标准差、胜率
+
+    均值 / 离差平方和用 sum + dot 闭式计算，
+    下行部分只做一次 < 0 掩码，胜率用 count_nonzero 计数。
+
+    Returns:
+        (std, downside_std, win_rate) — 下行样本不足 2 个时 downside_std 为 None
+    """
+    n = len(daily_returns)
+    if n == 0:
+        return float("nan"), None, 0.0
+
+    std = _sample_std(daily_returns)
+    downside = daily_returns[daily_returns < 0]
+    downside_std = _sample_std(downside) if len(downside) > 1 else None
+    win_rate = float(np.count_nonzero(daily_returns > 0) / n)
+    return std, downside_std, win_rate
+
+
+def _sample_std(x: np.ndarray) -> float:
+    """ddof=1 样本标准差 (两遍: 均值 → 离差点积)；n < 2 为 NaN"""
+    n = len(x)
+    if n < 2:
+        return float("nan")
+    dev = x - x.sum() / n
+    return math.sqrt(np.dot(dev, dev) / (n - 1))
+
+
 def _max_drawdown(navs: np.ndarray) -> Tuple[float, int]:
     """
     计算最大回撤和持续天数
 
+    running peak = np.maximum.accumulate(navs)，回撤整列一次算出；
+    持续天数 = 最深回撤点 - 其之前最近一次创新高 (含持平) 的下标。
+
     Returns:
         (max_dd, duration) — max_dd 为负数
     """
-    peak = navs[0]
-    max_dd = 0.0
-    dd_start = 0
-    max_dd_duration = 0
-    current_dd_start = 0
+    navs = np.ascontiguousarray(navs, dtype=np.float64)
+    peak = np.maximum.accumulate(navs)
+    # 只分配 peak / dd 两个缓冲区，除法原地完成
+    dd = np.subtract(navs, peak)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(dd, peak, out=dd)
 
-    for i in range(len(navs)):
-        if navs[i] >= peak:
-            peak = navs[i]
-            current_dd_start = i
-        else:
-            dd = (navs[i] - peak) / peak
-            if dd < max_dd:
-                max_dd = dd
-                max_dd_duration = i - current_dd_start
+    i_low = int(np.argmin(dd))
+    max_dd = float(dd[i_low])
+    if not max_dd < 0:
+        return 0.0, 0
 
-    return max_dd, max_dd_duration
+    at_peak = navs[:i_low + 1] >= peak[:i_low + 1]
+    i_high = i_low - int(np.argmax(at_peak[::-1]))
+    return max_dd, i_low - i_high
 
 
 def _relative_metrics(
     strategy_returns: np.ndarray,
-    benchmark_nav: List[Tuple[str, float]],
+    bm_navs: np.ndarray,
     days_per_year: int,
 ) -> Tuple[float, float, float, float]:
     """
     计算相对基准的 Alpha, Beta, IR, TE
 
+    Args:
+        bm_navs: 基准净值数组 (已对齐回测日期范围)
+
     Returns:
         (alpha, beta, information_ratio, tracking_error)
     """
-    bm_navs = np.array([nav for _, nav in benchmark_nav], dtype=np.float64)
-
     if len(bm_navs) < 2:
         return 0.0, 0.0, 0.0, 0.0
 
@@ -188,20 +260,26 @@ def _relative_metrics(
     if len(sr) < 2:
         return 0.0, 0.0, 0.0, 0.0
 
-    # Beta = Cov(Rs, Rb) / Var(Rb)
-    cov_matrix = np.cov(sr, br)
-    var_bm = cov_matrix[1, 1]
-    beta = float(cov_matrix[0, 1] / var_bm) if var_bm > 1e-10 else 0.0
+    n = len(sr)
+    sr_mean = sr.sum() / n
+    br_mean = br.sum() / n
+
+    # Beta = Cov(Rs, Rb) / Var(Rb) — 离差点积直接得到 (ddof=1)，不构造 2×2 协方差矩阵
+    sr_dev = sr - sr_mean
+    br_dev = br - br_mean
+    var_bm = np.dot(br_dev, br_dev) / (n - 1)
+    cov_sb = np.dot(sr_dev, br_dev) / (n - 1)
+    beta = float(cov_sb / var_bm) if var_bm > 1e-10 else 0.0
 
     # Alpha = Rs_annual - Beta * Rb_annual (geometric annualization)
-    rs_annual = float((1 + np.mean(sr)) ** days_per_year - 1)
-    rb_annual = float((1 + np.mean(br)) ** days_per_year - 1)
+    rs_annual = float((1 + sr_mean) ** days_per_year - 1)
+    rb_annual = float((1 + br_mean) ** days_per_year - 1)
     alpha = rs_annual - beta * rb_annual
 
     # Tracking Error & Information Ratio
     active = sr - br
-    te = float(np.std(active, ddof=1) * np.sqrt(days_per_year))
-    ir = float(np.mean(active) * days_per_year / te) if te > 1e-10 else 0.0
+    te = _sample_std(active) * math.sqrt(days_per_year)
+    ir = float(active.sum() / n * days_per_year / te) if te > 1e-10 else 0.0
 
     return alpha, beta, ir, te
 
@@ -7,14 +7,19 @@ ParamOptimizer — 最优参数选择 + 稳健性分析 + Walk-Forward 验证
 """
 
 import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 from datetime import datetime
 
 from backtest.config import BacktestConfig, us_preset, crypto_preset
+from backtest.parallel import pool_context, resolve_n_jobs
 from backtest.sweep import ParameterSweep
 
 logger = logging.getLogger(__name__)
@@ -65,6 +70,48 @@ _NEIGHBOR_MAP = {
     "rs_method": ["B", "C"],
 }
 
+# 参与邻域比较的参数列
+_PARAM_COLS = ["rs_method", "top_n", "rebalance_freq", "sell_buffer"]
+
+
+def _ordinal_index(ordered: list) -> Dict:
+    """有序取值表 → {取值: 下标}"""
+    return {val: i for i, val in enumerate(ordered)}
+
+
+# 与 _NEIGHBOR_MAP 同构的 {取值: 下标} 表 (模块加载时构建一次)
+_NEIGHBOR_INDEX = {
+    param: (
+        {market: _ordinal_index(vals) for market, vals in ordered.items()}
+        if isinstance(ordered, dict)
+        else _ordinal_index(ordered)
+    )
+    for param, ordered in _NEIGHBOR_MAP.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _adjacent_values(market: str, param: str, current_val) -> tuple:
+    """
+    参数在有序取值表中的相邻值 (前一个 / 后一个)
+
+    只依赖模块常量 _NEIGHBOR_MAP / _NEIGHBOR_INDEX，按 (market, param, current_val) 缓存。
+    """
+    if param in ("rebalance_freq", "sell_buffer"):
+        ordered = _NEIGHBOR_MAP[param].get(market, [])
+        index = _NEIGHBOR_INDEX[param].get(market, {})
+    elif param in _NEIGHBOR_MAP:
+        ordered = _NEIGHBOR_MAP[param]
+        index = _NEIGHBOR_INDEX[param]
+    else:
+        return ()
+
+    idx = index.get(current_val)
+    if idx is None:
+        return ()
+
+    return tuple(ordered[max(idx - 1, 0):idx] + ordered[idx + 1:idx + 2])
+
 
 class ParamOptimizer:
     """两层优化: 稳健性选择 + Walk-Forward 验证"""
@@ -91,13 +138,20 @@ class ParamOptimizer:
         if sweep_df.empty or metric not in sweep_df.columns:
             return sweep_df
 
-        sorted_df = sweep_df.sort_values(metric, ascending=False).reset_index(drop=True)
-        top_candidates = sorted_df.head(top_k).copy()
+        # metric 降序的行号 (NaN 排最后，并列保持原顺序)；不重排整张 DataFrame，
+        # 只按行号取出 Top K 候选
+        values = sweep_df[metric].to_numpy(dtype=np.float64)
+        order = np.argsort(-values, kind="stable")
+        top_candidates = sweep_df.iloc[order[:top_k]].reset_index(drop=True)
+
+        param_cols = [c for c in _PARAM_COLS if c in sweep_df.columns]
+        lookup = self._neighbor_lookup(sweep_df, param_cols, values, order)
 
         robustness_scores = []
+        neighbor_counts = []
         for idx, row in top_candidates.iterrows():
             candidate_val = row[metric]
-            neighbor_vals = self._find_neighbor_values(row, sorted_df, metric)
+            neighbor_vals = self._find_neighbor_values(row, lookup, param_cols)
 
             if neighbor_vals:
                 neighbor_avg = sum(neighbor_vals) / len(neighbor_vals)
@@ -110,72 +164,56 @@ class ParamOptimizer:
                 score = candidate_val
 
             robustness_scores.append(score)
+            neighbor_counts.append(len(neighbor_vals))
 
         top_candidates["robustness_score"] = robustness_scores
-        top_candidates["neighbor_count"] = [
-            len(self._find_neighbor_values(row, sorted_df, metric))
-            for _, row in top_candidates.iterrows()
-        ]
+        top_candidates["neighbor_count"] = neighbor_counts
 
         return top_candidates.sort_values(
             "robustness_score", ascending=False
         ).reset_index(drop=True)
 
+    @staticmethod
+    def _neighbor_lookup(
+        full_df: pd.DataFrame,
+        param_cols: List[str],
+        values: np.ndarray,
+        order: np.ndarray,
+    ) -> Dict[tuple, float]:
+        """
+        参数组合 → metric 的哈希表 (同一组合多行时取 metric 最高的一行)
+
+        按 order (metric 降序) 倒序写入，排名靠前的行最后写入、覆盖重复组合。
+        """
+        if not param_cols:
+            return {}
+        keys = list(zip(*(full_df[c].tolist() for c in param_cols)))
+        vals = values.tolist()
+        return {keys[i]: vals[i] for i in order[::-1].tolist()}
+
     def _find_neighbor_values(
-        self, row: pd.Series, full_df: pd.DataFrame, metric: str
+        self, row: pd.Series, lookup: Dict[tuple, float], param_cols: List[str]
     ) -> List[float]:
         """
         查找参数空间中的邻居
 
-        邻居定义: 只有一个维度变化的组合
+        邻居定义: 只有一个维度变化的组合；逐个替换该维度的取值后查哈希表
         """
-        param_cols = ["rs_method", "top_n", "rebalance_freq", "sell_buffer"]
-        available_cols = [c for c in param_cols if c in row.index and c in full_df.columns]
-
+        key = [row[c] for c in param_cols]
         neighbor_vals = []
 
-        for col in available_cols:
-            current_val = row[col]
-            adjacent_vals = self._get_adjacent_values(col, current_val)
-
-            for adj_val in adjacent_vals:
-                # 构建邻居的筛选条件: 只有 col 不同
-                mask = pd.Series(True, index=full_df.index)
-                for c in available_cols:
-                    if c == col:
-                        mask &= full_df[c] == adj_val
-                    else:
-                        mask &= full_df[c] == row[c]
-
-                matches = full_df[mask]
-                if not matches.empty:
-                    neighbor_vals.append(float(matches.iloc[0][metric]))
+        for i, col in enumerate(param_cols):
+            for adj_val in self._get_adjacent_values(col, key[i]):
+                neighbor_key = tuple(key[:i] + [adj_val] + key[i + 1:])
+                val = lookup.get(neighbor_key)
+                if val is not None:
+                    neighbor_vals.append(val)
 
         return neighbor_vals
 
-    def _get_adjacent_values(self, param: str, current_val) -> list:
+    def _get_adjacent_values(self, param: str, current_val) -> tuple:
         """获取参数的相邻值"""
-        if param == "rebalance_freq":
-            ordered = _NEIGHBOR_MAP["rebalance_freq"].get(self.market, [])
-        elif param == "sell_buffer":
-            ordered = _NEIGHBOR_MAP["sell_buffer"].get(self.market, [])
-        elif param in _NEIGHBOR_MAP:
-            ordered = _NEIGHBOR_MAP[param]
-        else:
-            return []
-
-        try:
-            idx = ordered.index(current_val)
-        except ValueError:
-            return []
-
-        adjacent = []
-        if idx > 0:
-            adjacent.append(ordered[idx - 1])
-        if idx < len(ordered) - 1:
-            adjacent.append(ordered[idx + 1])
-
-        return adjacent
+        return _adjacent_values(self.market, param, current_val)
 
     # ═══ 第二层: Walk-Forward ═══════════════════════════
 
@@ -186,6 +224,7 @@ class ParamOptimizer:
         step_months: int = 12,
         metric: str = "sharpe_ratio",
         grid: Optional[dict] = None,
+        n_jobs: Optional[int] = 1,
     ) -> WalkForwardResult:
         """
         滚动窗口 Walk-Forward 验证
@@ -196,6 +235,9 @@ class ParamOptimizer:
             step_months: 步进月数
             metric: 优化目标指标
             grid: 自定义参数网格
+            n_jobs: 并行进程数 (按轮分发)。1=串行 (默认), None/-1=全部 CPU 核。
+                    并行时 Linux 上 adapter 经 fork 写时复制继承 (无需 pickle)；
+                    其他平台 adapter 须可 pickle，每个 worker 只接收一次
 
         Returns:
             WalkForwardResult
@@ -216,9 +258,8 @@ class ParamOptimizer:
         data_start = datetime.strptime(date_range[0][:10], "%Y-%m-%d")
         data_end = datetime.strptime(date_range[1][:10], "%Y-%m-%d")
 
-        # 生成窗口
-        rounds = []
-        round_num = 0
+        # 生成窗口 (各轮只共享只读的 adapter 数据，互不依赖)
+        specs = []
         window_start = data_start
 
         while True:
@@ -229,66 +270,39 @@ class ParamOptimizer:
             if test_end > data_end:
                 break
 
-            round_num += 1
-            logger.info(
-                f"Walk-Forward 第 {round_num} 轮: "
-                f"训练 {window_start.date()} → {train_end.date()} | "
-                f"测试 {test_start.date()} → {test_end.date()}"
-            )
-
-            # 训练: 在 train 窗口上扫描
-            sweep = ParameterSweep(self.market, grid=grid)
-            train_df = sweep.run(
-                start_date=str(window_start.date()),
-                end_date=str(train_end.date()),
-                adapter=self.adapter,
-            )
-
-            if train_df.empty:
-                logger.warning(f"第 {round_num} 轮训练无结果, 跳过")
-                window_start += relativedelta(months=step_months)
-                continue
-
-            # 稳健性排名
-            robust_df = self.rank_with_robustness(train_df, metric)
-            best_row = robust_df.iloc[0]
-
-            # 提取最优参数
-            param_cols = ["rs_method", "top_n", "rebalance_freq", "sell_buffer"]
-            best_params = {c: best_row[c] for c in param_cols if c in best_row.index}
-            in_sharpe = float(best_row.get("sharpe_ratio", 0))
-            in_cagr = float(best_row.get("cagr", 0))
-
-            # 测试: 用最优参数在 test 窗口跑
-            factory = crypto_preset if self.market == "crypto" else us_preset
-            test_config = factory(
-                start_date=str(test_start.date()),
-                end_date=str(test_end.date()),
-                **best_params,
-            )
-
-            from backtest.engine import BacktestEngine
-            test_engine = BacktestEngine(test_config, adapter=self.adapter)
-            test_metrics = test_engine.run()
-
-            wf_round = WalkForwardRound(
-                round_num=round_num,
+            specs.append(_WFRoundSpec(
+                round_num=len(specs) + 1,
                 train_start=str(window_start.date()),
                 train_end=str(train_end.date()),
                 test_start=str(test_start.date()),
                 test_end=str(test_end.date()),
-                best_config_label=test_config.label(),
-                best_params=best_params,
-                in_sample_sharpe=in_sharpe,
-                in_sample_cagr=in_cagr,
-                out_sample_sharpe=test_metrics.sharpe_ratio,
-                out_sample_cagr=test_metrics.cagr,
-                out_sample_max_dd=test_metrics.max_drawdown,
-            )
-            rounds.append(wf_round)
-
+            ))
             window_start += relativedelta(months=step_months)
 
+        n_workers = resolve_n_jobs(n_jobs, len(specs))
+        if n_workers > 1:
+            # 侧表在父进程建好，worker 继承后不再各自重建
+            if hasattr(self.adapter, "prepare"):
+                self.adapter.prepare()
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=pool_context(),
+                initializer=_init_wf_worker,
+                initargs=(self.market, self.adapter),
+            ) as executor:
+                results = list(executor.map(
+                    _run_wf_round_in_worker, specs,
+                    [metric] * len(specs), [grid] * len(specs),
+                ))
+        else:
+            # 相邻轮的训练/测试窗口大段重叠，RS 只取决于 (方法, 日期)，跨轮共享
+            rs_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+            results = [
+                _run_wf_round(self, spec, metric, grid, rs_cache) for spec in specs
+            ]
+
+        rounds = [r for r in results if r is not None]
+
         # 汇总
         return self._summarize_wf(rounds)
 
@@ -328,34 +342,23 @@ class ParamOptimizer:
             return 1.0
 
         params_list = [r.best_params for r in rounds]
-        all_keys = set()
-        for p in params_list:
-            all_keys.update(p.keys())
+        all_keys = set().union(*params_list)
 
         if not all_keys:
             return 1.0
 
-        match_count = 0
-        total_count = 0
-
-        for key in all_keys:
-            values = [p.get(key) for p in params_list]
-            # 统计最常见值的出现比例
-            from collections import Counter
-            counts = Counter(values)
-            most_common_count = counts.most_common(1)[0][1]
-            match_count += most_common_count
-            total_count += len(values)
-
-        return match_count / total_count if total_count > 0 else 0.0
+        # 每个参数维度统计最常见值的出现次数 (缺失记为 None)
+        match_count = sum(
+            Counter(p.get(key) for p in params_list).most_common(1)[0][1]
+            for key in all_keys
+        )
+        return match_count / (len(all_keys) * len(params_list))
 
     def _most_common_params(self, rounds: List[WalkForwardRound]) -> Optional[BacktestConfig]:
         """从多轮中找出最常见的参数组合"""
         if not rounds:
             return None
 
-        from collections import Counter
-
         # 对每个参数维度取最常见值
         param_keys = set()
         for r in rounds:
@@ -378,3 +381,107 @@ class ParamOptimizer:
         else:
             from backtest.adapters.us_stocks import USStocksAdapter
             return USStocksAdapter()
+
+
+# ── Walk-Forward 单轮 ───────────────────────────────────
+
+@dataclass
+class _WFRoundSpec:
+    """单轮 Walk-Forward 的窗口定义"""
+    round_num: int
+    train_start: str
+    train_end: str
+    test_start: str
+    test_end: str
+
+
+def _run_wf_round(
+    optimizer: ParamOptimizer,
+    spec: _WFRoundSpec,
+    metric: str,
+    grid: Optional[dict],
+    rs_cache: Dict[Tuple[str, str], pd.DataFrame],
+) -> Optional[WalkForwardRound]:
+    """
+    单轮: train 窗口扫描 → 稳健性选参 → test 窗口回测
+
+    rs_cache 为跨轮共享的 RS 缓存；训练无结果时返回 None (该轮跳过)。
+    """
+    from backtest.engine import BacktestEngine
+
+    logger.info(
+        f"Walk-Forward 第 {spec.round_num} 轮: "
+        f"训练 {spec.train_start} → {spec.train_end} | "
+        f"测试 {spec.test_start} → {spec.test_end}"
+    )
+
+    # 训练: 在 train 窗口上扫描
+    sweep = ParameterSweep(optimizer.market, grid=grid)
+    train_df = sweep.run(
+        start_date=spec.train_start,
+        end_date=spec.train_end,
+        adapter=optimizer.adapter,
+        rs_cache=rs_cache,
+    )
+
+    if train_df.empty:
+        logger.warning(f"第 {spec.round_num} 轮训练无结果, 跳过")
+        return None
+
+    # 稳健性排名
+    robust_df = optimizer.rank_with_robustness(train_df, metric)
+    best_row = robust_df.iloc[0]
+
+    # 提取最优参数
+    best_params = {c: best_row[c] for c in _PARAM_COLS if c in best_row.index}
+    in_sharpe = float(best_row.get("sharpe_ratio", 0))
+    in_cagr = float(best_row.get("cagr", 0))
+
+    # 测试: 用最优参数在 test 窗口跑
+    factory = crypto_preset if optimizer.market == "crypto" else us_preset
+    test_config = factory(
+        start_date=spec.test_start,
+        end_date=spec.test_end,
+        **best_params,
+    )
+
+    test_metrics = BacktestEngine(
+        test_config, adapter=optimizer.adapter, rs_cache=rs_cache,
+    ).run()
+
+    return WalkForwardRound(
+        round_num=spec.round_num,
+        train_start=spec.train_start,
+        train_end=spec.train_end,
+        test_start=spec.test_start,
+        test_end=spec.test_end,
+        best_config_label=test_config.label(),
+        best_params=best_params,
+        in_sample_sharpe=in_sharpe,
+        in_sample_cagr=in_cagr,
+        out_sample_sharpe=test_metrics.sharpe_ratio,
+        out_sample_cagr=test_metrics.cagr,
+        out_sample_max_dd=test_metrics.max_drawdown,
+    )
+
+
+# ── 进程池 worker ─────────────────────────────────────
+
+_WORKER_OPTIMIZER: Optional[ParamOptimizer] = None
+_WORKER_RS_CACHE: Dict[Tuple[str, str], pd.DataFrame] = {}
+
+
+def _init_wf_worker(market: str, adapter) -> None:
+    """worker 初始化: 每个进程只接收一次预加载的 adapter，并持有进程级 RS 缓存"""
+    global _WORKER_OPTIMIZER, _WORKER_RS_CACHE
+    _WORKER_OPTIMIZER = ParamOptimizer(market, adapter=adapter)
+    _WORKER_RS_CACHE = {}
+
+
+def _run_wf_round_in_worker(
+    spec: _WFRoundSpec,
+    metric: str,
+    grid: Optional[dict],
+) -> Optional[WalkForwardRound]:
+    """worker 内执行单轮 Walk-Forward"""
+    return _run_wf_round(_WORKER_OPTIMIZER, spec, metric, grid, _WORKER_RS_CACHE)
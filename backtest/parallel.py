@@ -0,0 +1,31 @@
+"""
+并行工具 — 参数扫描 / Walk-Forward / 因子研究共用
+
+n_jobs 解析与进程池启动方式，保证各处并行行为一致。
+"""
+
+import multiprocessing
+import os
+import sys
+from typing import Optional
+
+
+def resolve_n_jobs(n_jobs: Optional[int], total: int) -> int:
+    """n_jobs: 1=串行, None/-1=全部 CPU 核, >1=指定并行数 (不超过任务数)"""
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    return max(1, min(n_jobs, total))
+
+
+def pool_context():
+    """
+    进程池的启动方式 (传给 ProcessPoolExecutor 的 mp_context)
+
+    Linux 上显式用 fork: worker 以写时复制继承父进程已加载的数据
+    (行情面板 / 收益矩阵不经 pickle、不在每个进程各存一份)，也不受 Python 3.14
+    默认改为 forkserver 的影响。其他平台 (macOS fork 不安全) 用默认方式，
+    initializer 参数 pickle 一次。
+    """
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return None
@@ -12,7 +12,7 @@ from backtest.factor_study.forward_returns import (
     build_excess_return_matrix,
     build_return_matrix,
 )
-from backtest.metrics import compute_metrics
+from backtest.metrics import compute_metrics_from_navs
 from backtest.pipeline.primitives.pit_data import PitData
 from backtest.pipeline.report import build_report_html, build_report_markdown
 from backtest.pipeline.spec import StrategySpec
@@ -226,15 +226,15 @@ class EvaluationEngine:
         self,
         run: BacktestRunResult,
     ) -> Dict[str, float | int]:
-        nav_series = list(run.nav.itertuples(index=False, name=None)) if not run.nav.empty else []
-        benchmark_series = (
-            list(run.benchmark_nav.itertuples(index=False, name=None))
+        navs = run.nav["nav"].to_numpy(dtype=float) if not run.nav.empty else np.empty(0)
+        benchmark_arrays = (
+            (run.benchmark_nav["date"].to_numpy(), run.benchmark_nav["nav"].to_numpy(dtype=float))
             if not run.benchmark_nav.empty
             else None
         )
-        metrics = compute_metrics(
-            nav_series=nav_series,
-            benchmark_nav=benchmark_series,
+        metrics = compute_metrics_from_navs(
+            navs,
+            benchmark_nav=benchmark_arrays,
             total_costs=run.total_costs,
             n_trades=run.n_trades,
             annual_turnover=run.annual_turnover,
@@ -242,8 +242,8 @@ class EvaluationEngine:
         payload = asdict(metrics)
 
         benchmark_cagr = 0.0
-        if benchmark_series:
-            benchmark_cagr = compute_metrics(benchmark_series).cagr
+        if benchmark_arrays is not None:
+            benchmark_cagr = compute_metrics_from_navs(benchmark_arrays[1]).cagr
         payload["benchmark_cagr"] = benchmark_cagr
         payload["excess_cagr"] = payload["cagr"] - benchmark_cagr
         payload["ir"] = payload["information_ratio"]
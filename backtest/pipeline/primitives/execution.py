@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Dict, List
 
 import pandas as pd
@@ -111,7 +110,7 @@ class ExecutionEngine:
         nav_df = pd.DataFrame(
             [{"date": snap.date, "nav": snap.nav} for snap in portfolio.snapshots]
         )
-        trades_df = pd.DataFrame([asdict(trade) for trade in portfolio.trades])
+        trades_df = pd.DataFrame(portfolio.trade_columns())
         positions_daily_df = pd.DataFrame(positions_daily_rows)
         benchmark_nav = self._build_benchmark_nav(
             benchmark_symbol=benchmark_symbol,
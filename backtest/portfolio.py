@@ -7,6 +7,11 @@ PortfolioState — 持仓、现金、NAV 跟踪
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+_SIDES = ("BUY", "SELL")
+_INITIAL_TRADE_CAPACITY = 64
+
 
 @dataclass
 class Trade:
@@ -36,6 +41,8 @@ class PortfolioState:
     - 支持 fractional shares
     - 每笔交易自动扣除交易成本
     - 维护每日 NAV 快照序列
+    - 交易记录按列存储 (SoA): 数值列为预分配 NumPy 数组 (容量倍增)，
+      symbol / date 驻留为整数下标；trades 属性按需还原为 Trade 列表
     """
 
     def __init__(self, initial_capital: float, cost_rate: float = 0.0005):
@@ -46,8 +53,17 @@ class PortfolioState:
         # {symbol: shares} — 正数表示多头
         self.holdings: Dict[str, float] = {}
 
-        # 交易记录和快照
-        self.trades: List[Trade] = []
+        # 交易记录 (列式) 和快照
+        self._n_trades = 0
+        self._trade_side = np.empty(_INITIAL_TRADE_CAPACITY, dtype=np.int8)
+        self._trade_symbol = np.empty(_INITIAL_TRADE_CAPACITY, dtype=np.int32)
+        self._trade_date = np.empty(_INITIAL_TRADE_CAPACITY, dtype=np.int32)
+        self._trade_values = np.empty((_INITIAL_TRADE_CAPACITY, 4))  # shares/price/cost/notional
+        self._symbols: List[str] = []
+        self._symbol_idx: Dict[str, int] = {}
+        self._dates: List[str] = []
+        self._date_idx: Dict[str, int] = {}
+        self._trades_cache: Optional[List[Trade]] = None
         self.snapshots: List[Snapshot] = []
 
     # ── 交易操作 ───────────────────────────────────────
@@ -85,15 +101,7 @@ class PortfolioState:
         self.cash -= (net_amount + cost)
         self.holdings[symbol] = self.holdings.get(symbol, 0.0) + shares
 
-        self.trades.append(Trade(
-            date=date,
-            symbol=symbol,
-            side="BUY",
-            shares=shares,
-            price=price,
-            cost=cost,
-            notional=notional,
-        ))
+        self._record_trade(date, symbol, 0, shares, price, cost, notional)
 
         return shares
 
@@ -129,18 +137,49 @@ class PortfolioState:
         if self.holdings[symbol] < 1e-10:
             del self.holdings[symbol]
 
-        self.trades.append(Trade(
-            date=date,
-            symbol=symbol,
-            side="SELL",
-            shares=actual_shares,
-            price=price,
-            cost=cost,
-            notional=gross,
-        ))
+        self._record_trade(date, symbol, 1, actual_shares, price, cost, gross)
 
         return net
 
+    def _record_trade(
+        self,
+        date: str,
+        symbol: str,
+        side: int,
+        shares: float,
+        price: float,
+        cost: float,
+        notional: float,
+    ) -> None:
+        """追加一笔交易到列式缓冲区 (满了容量翻倍)"""
+        n = self._n_trades
+        if n == len(self._trade_side):
+            self._grow_trades(2 * n)
+
+        sym_i = self._symbol_idx.get(symbol)
+        if sym_i is None:
+            sym_i = self._symbol_idx[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        date_i = self._date_idx.get(date)
+        if date_i is None:
+            date_i = self._date_idx[date] = len(self._dates)
+            self._dates.append(date)
+
+        self._trade_side[n] = side
+        self._trade_symbol[n] = sym_i
+        self._trade_date[n] = date_i
+        self._trade_values[n] = (shares, price, cost, notional)
+        self._n_trades = n + 1
+        self._trades_cache = None
+
+    def _grow_trades(self, capacity: int) -> None:
+        n = self._n_trades
+        for name in ("_trade_side", "_trade_symbol", "_trade_date", "_trade_values"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
     def sell_all(self, symbol: str, price: float, date: str) -> float:
         """卖出某只股票的全部持仓"""
         shares = self.holdings.get(symbol, 0.0)
@@ -180,13 +219,40 @@ class PortfolioState:
 
     # ── 统计 ──────────────────────────────────────────
 
+    @property
+    def trades(self) -> List[Trade]:
+        """交易记录 (从列式缓冲区还原，未新增交易时复用上次结果)"""
+        if self._trades_cache is None:
+            self._trades_cache = [
+                Trade(date, symbol, side, shares, price, cost, notional)
+                for date, symbol, side, shares, price, cost, notional in zip(
+                    *self.trade_columns().values()
+                )
+            ]
+        return self._trades_cache
+
+    def trade_columns(self) -> Dict[str, list]:
+        """交易记录按列输出 ({Trade 字段名: 值列表})，可直接构造 DataFrame"""
+        n = self._n_trades
+        values = self._trade_values[:n]
+        columns = {
+            "date": [self._dates[i] for i in self._trade_date[:n].tolist()],
+            "symbol": [self._symbols[i] for i in self._trade_symbol[:n].tolist()],
+            "side": [_SIDES[i] for i in self._trade_side[:n].tolist()],
+            "shares": values[:, 0].tolist(),
+            "price": values[:, 1].tolist(),
+            "cost": values[:, 2].tolist(),
+            "notional": values[:, 3].tolist(),
+        }
+        return columns
+
     @property
     def total_trades(self) -> int:
-        return len(self.trades)
+        return self._n_trades
 
     @property
     def total_costs(self) -> float:
-        return sum(t.cost for t in self.trades)
+        return float(self._trade_values[:self._n_trades, 2].sum())
 
     @property
     def holding_symbols(self) -> List[str]:
@@ -195,3 +261,9 @@ class PortfolioState:
     def nav_series(self) -> List[Tuple[str, float]]:
         """返回 (date, nav) 序列"""
         return [(s.date, s.nav) for s in self.snapshots]
+
+    def nav_array(self) -> np.ndarray:
+        """NAV 序列 (float64 数组，与 snapshots 一一对应)"""
+        return np.fromiter(
+            (s.nav for s in self.snapshots), dtype=np.float64, count=len(self.snapshots),
+        )
@@ -8,9 +8,10 @@ Rebalancer — 换仓逻辑 + Hysteresis Buffer
 4. 不在当日 RS 结果中的 → 强制卖出
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -21,6 +22,8 @@ class RebalanceAction:
     to_buy: List[str]        # 需要买入的 symbols
     to_hold: List[str]       # 继续持有的 symbols
     target_count: int        # 目标持仓数
+    # compute() 顺带记录的目标 symbols 的 rs_rank，compute_weights 复用免再扫 rs_df
+    rs_ranks: Dict[str, float] = field(default_factory=dict, repr=False, compare=False)
 
 
 class Rebalancer:
@@ -60,32 +63,31 @@ class Rebalancer:
                 target_count=0,
             )
 
-        # 按 rs_rank 降序排列
-        ranked = rs_df.sort_values("rs_rank", ascending=False).reset_index(drop=True)
-        all_symbols = ranked["symbol"].tolist()
+        # 按 rs_rank 降序排列 (与 DataFrame.sort_values 的并列顺序一致)
+        ranks = rs_df["rs_rank"].to_numpy()
+        order = _descending_order(ranks)
+        all_symbols = rs_df["symbol"].to_numpy()[order].tolist()
 
         # Top N 集合 (强买入区)
-        top_n_symbols = set(all_symbols[:self.top_n])
+        top_symbols = all_symbols[:self.top_n]
 
         # 安全区 = Top(N + buffer)，在此范围内的现有持仓不卖
-        safe_zone_size = min(self.top_n + self.sell_buffer, len(all_symbols))
+        safe_zone_size = self.top_n + self.sell_buffer
         safe_zone = set(all_symbols[:safe_zone_size])
 
         # RS 中有数据的全部 symbols
         rs_universe = set(all_symbols)
 
-        # ── 决定卖出 ──
-        to_sell = []
-        for sym in current_holdings:
-            if sym not in rs_universe:
-                # 不在 RS 结果中 → 强制卖出 (退市/无数据)
-                to_sell.append(sym)
-            elif sym not in safe_zone:
-                # 排名跌出安全区 → 卖出
-                to_sell.append(sym)
+        # ── 决定卖出 (一次遍历) ──
+        # 不在 RS 结果中 (退市/无数据) 或排名跌出安全区 → 卖出
+        to_sell = [
+            sym for sym in current_holdings
+            if sym not in safe_zone or sym not in rs_universe
+        ]
 
         # ── 卖出后剩余持仓 ──
-        remaining = current_holdings - set(to_sell)
+        sold = set(to_sell)
+        remaining = current_holdings - sold
 
         # ── 计算需要新买入多少 ──
         slots_available = self.top_n - len(remaining)
@@ -93,8 +95,8 @@ class Rebalancer:
         # ── 从 Top N 中选择新买入 ──
         to_buy = []
         if slots_available > 0:
-            for sym in all_symbols[:self.top_n]:
-                if sym not in remaining and sym not in to_sell:
+            for sym in top_symbols:
+                if sym not in remaining and sym not in sold:
                     to_buy.append(sym)
                     if len(to_buy) >= slots_available:
                         break
@@ -106,6 +108,11 @@ class Rebalancer:
             to_buy=to_buy,
             to_hold=to_hold,
             target_count=len(to_hold) + len(to_buy),
+            # 目标持仓都落在安全区内，只需记录这一段的排名
+            rs_ranks=dict(zip(
+                all_symbols[:safe_zone_size],
+                ranks[order[:safe_zone_size]].tolist(),
+            )),
         )
 
     def compute_weights(
@@ -120,7 +127,8 @@ class Rebalancer:
 
         Args:
             action: RebalanceAction
-            rs_df: RS 排名数据
+            rs_df: RS 排名数据 (action 由 compute() 生成时 rs_weighted 直接用
+                action.rs_ranks，不再扫描 rs_df)
             weighting: "equal", "rs_weighted", 或 "inv_vol"
             volatilities: {symbol: annualized_vol} — inv_vol 模式需要
 
@@ -139,7 +147,9 @@ class Rebalancer:
             return self._inv_vol_weights(target_symbols, volatilities)
 
         # RS 加权: 用 rs_rank 作为权重
-        rs_map = dict(zip(rs_df["symbol"], rs_df["rs_rank"]))
+        rs_map = action.rs_ranks
+        if not all(sym in rs_map for sym in target_symbols):
+            rs_map = dict(zip(rs_df["symbol"], rs_df["rs_rank"]))
         raw_weights = {sym: max(rs_map.get(sym, 0), 1) for sym in target_symbols}
         total = sum(raw_weights.values())
         if total <= 0:
@@ -176,3 +186,19 @@ class Rebalancer:
         inv = {sym: 1.0 / v for sym, v in all_vols.items()}
         total = sum(inv.values())
         return {sym: w / total for sym, w in inv.items()}
+
+
+def _descending_order(ranks: np.ndarray) -> np.ndarray:
+    """
+    rs_rank 降序的下标 (NaN 排最后)
+
+    复刻 DataFrame.sort_values(ascending=False) 的排序步骤 (反转 → quicksort
+    argsort → 再反转)，并列名次的先后与原 pandas 实现完全一致，
+    但不构造排序后的 DataFrame。
+    """
+    if ranks.dtype == object:
+        ranks = ranks.astype(np.float64)
+    mask = np.isnan(ranks) if ranks.dtype.kind == "f" else np.zeros(len(ranks), bool)
+    idx = np.flatnonzero(~mask)[::-1]
+    order = idx[ranks[idx].argsort(kind="quicksort")][::-1]
+    return np.concatenate([order, np.flatnonzero(mask)])
@@ -2,12 +2,14 @@
 回测报告生成 — 文本 + HTML + CSV 导出
 """
 
+import json
 import logging
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backtest.config import BacktestConfig
@@ -19,6 +21,36 @@ _PROJECT_ROOT = Path(__file__).parent.parent
 _BACKTEST_DIR = _PROJECT_ROOT / "data" / "backtest"
 
 
+# 参数扫描排行榜: (列名, 缺失时默认值) 与单行模板，占位符顺序与列一致
+_SWEEP_ROW_COLUMNS = (
+    ("label", ""),
+    ("sharpe_ratio", 0),
+    ("cagr", 0),
+    ("max_drawdown", 0),
+    ("sortino_ratio", 0),
+    ("annual_turnover", 0),
+)
+_SWEEP_ROW_TMPL = """
+            <tr>
+                <td>{0}</td>
+                <td>{1:.4f}</td>
+                <td>{2:.2%}</td>
+                <td>{3:.2%}</td>
+                <td>{4:.4f}</td>
+                <td>{5:.2%}</td>
+            </tr>"""
+
+
+def _nav_values(series: List[Tuple[str, float]]) -> np.ndarray:
+    """[(date, nav), ...] → float64 净值数组"""
+    return np.fromiter((v for _, v in series), dtype=np.float64, count=len(series))
+
+
+def _js_array(values: list) -> str:
+    """列表 → JS 数组字面量 (json C 序列化；np.float64 也输出为纯数字)"""
+    return json.dumps(values, separators=(",", ":"))
+
+
 def print_metrics(
     metrics: BacktestMetrics,
     config: BacktestConfig,
@@ -123,20 +155,21 @@ def generate_html_report(
 
     # 净值数据
     nav_dates = [d for d, _ in nav_series]
-    nav_values = [round(v, 2) for _, v in nav_series]
+    nav_arr = np.round(_nav_values(nav_series), 2)
+    nav_values = nav_arr.tolist()
 
     bm_section = ""
     if benchmark_nav:
-        bm_dates = [d for d, _ in benchmark_nav]
-        bm_values = [round(v, 2) for _, v in benchmark_nav]
+        bm_arr = np.round(_nav_values(benchmark_nav), 2)
         # 归一化到同一起点
-        if bm_values and nav_values:
-            scale = nav_values[0] / bm_values[0] if bm_values[0] != 0 else 1
-            bm_values = [round(v * scale, 2) for v in bm_values]
+        if len(bm_arr) and len(nav_arr):
+            scale = nav_arr[0] / bm_arr[0] if bm_arr[0] != 0 else 1
+            np.round(bm_arr * scale, 2, out=bm_arr)
+        bm_values = bm_arr.tolist()
         bm_section = f"""
             {{
                 label: '{config.benchmark_symbol}',
-                data: {bm_values},
+                data: {_js_array(bm_values)},
                 borderColor: '#888',
                 borderWidth: 1.5,
                 pointRadius: 0,
@@ -147,17 +180,14 @@ def generate_html_report(
     sweep_html = ""
     if sweep_df is not None and not sweep_df.empty:
         top20 = sweep_df.head(20)
-        rows = ""
-        for _, row in top20.iterrows():
-            rows += f"""
-            <tr>
-                <td>{row.get('label', '')}</td>
-                <td>{row.get('sharpe_ratio', 0):.4f}</td>
-                <td>{row.get('cagr', 0):.2%}</td>
-                <td>{row.get('max_drawdown', 0):.2%}</td>
-                <td>{row.get('sortino_ratio', 0):.4f}</td>
-                <td>{row.get('annual_turnover', 0):.2%}</td>
-            </tr>"""
+        # 按列取值 (缺失列用默认值填满)，逐行套用模块级模板
+        columns = {
+            name: top20[name].tolist() if name in top20.columns else [default] * len(top20)
+            for name, default in _SWEEP_ROW_COLUMNS
+        }
+        rows = "".join(
+            _SWEEP_ROW_TMPL.format(*values) for values in zip(*columns.values())
+        )
         sweep_html = f"""
         <h2>参数扫描 Top 20</h2>
         <table>
@@ -262,11 +292,11 @@ def generate_html_report(
 new Chart(document.getElementById('navChart'), {{
     type: 'line',
     data: {{
-        labels: {nav_dates},
+        labels: {_js_array(nav_dates)},
         datasets: [
             {{
                 label: 'RS 动量策略',
-                data: {nav_values},
+                data: {_js_array(nav_values)},
                 borderColor: '#ffd700',
                 borderWidth: 2,
                 pointRadius: 0,
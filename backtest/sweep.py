@@ -2,12 +2,14 @@
 ParameterSweep — 参数扫描编排
 
 数据只加载一次，所有参数组合共享。
+n_jobs > 1 时各参数组合分发到进程池并行回测 (组合之间无共享状态)。
 """
 
 import logging
-from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
 from itertools import product
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -19,9 +21,34 @@ from backtest.config import (
     crypto_preset,
 )
 from backtest.engine import BacktestEngine
+from backtest.metrics import BacktestMetrics
+from backtest.parallel import pool_context, resolve_n_jobs
 
 logger = logging.getLogger(__name__)
 
+# 扫描结果中的指标列 (BacktestMetrics 字段顺序)
+_METRIC_FIELDS = tuple(f.name for f in fields(BacktestMetrics))
+
+
+# ── 进程池 worker ─────────────────────────────────────
+
+_WORKER_ADAPTER = None
+_WORKER_RS_CACHE: Dict[Tuple[str, str], pd.DataFrame] = {}
+
+
+def _init_worker(adapter) -> None:
+    """worker 初始化: 每个进程只接收一次预加载的 adapter，并持有进程级 RS 缓存"""
+    global _WORKER_ADAPTER, _WORKER_RS_CACHE
+    _WORKER_ADAPTER = adapter
+    _WORKER_RS_CACHE = {}
+
+
+def _run_config(config: BacktestConfig) -> BacktestMetrics:
+    """worker 内执行单组参数回测"""
+    return BacktestEngine(
+        config, adapter=_WORKER_ADAPTER, rs_cache=_WORKER_RS_CACHE,
+    ).run()
+
 
 class ParameterSweep:
     """
@@ -71,6 +98,8 @@ class ParameterSweep:
         end_date: Optional[str] = None,
         adapter=None,
         progress_callback=None,
+        n_jobs: Optional[int] = 1,
+        rs_cache: Optional[Dict[Tuple[str, str], pd.DataFrame]] = None,
     ) -> pd.DataFrame:
         """
         执行参数扫描
@@ -80,6 +109,12 @@ class ParameterSweep:
             end_date: 回测结束日期
             adapter: 预加载的数据适配器 (避免重复加载)
             progress_callback: 进度回调 fn(current, total, config)
+            n_jobs: 并行进程数。1=串行 (默认), None/-1=全部 CPU 核。
+                    并行时 Linux 上 adapter 经 fork 写时复制继承 (无需 pickle)；
+                    其他平台 adapter 须可 pickle，每个 worker 只接收一次
+            rs_cache: 串行时使用的 RS 缓存 {(rs_method, date): rs_df}。
+                    None = 本次扫描内新建；传入同一 dict 可跨多次扫描复用
+                    (Walk-Forward 相邻训练窗口大段重叠)
 
         Returns:
             DataFrame — 每行一组参数 + 完整绩效指标
@@ -95,35 +130,75 @@ class ParameterSweep:
         combos = list(product(*param_values))
         total = len(combos)
 
-        logger.info(f"参数扫描: {total} 组合, market={self.market}")
-
-        results = []
-        for i, combo in enumerate(combos):
+        n_workers = resolve_n_jobs(n_jobs, total)
+        logger.info(
+            f"参数扫描: {total} 组合, market={self.market}, 进程数={n_workers}"
+        )
+
+        # 各组合共用的固定参数 (覆盖项 + 日期) 与 preset 工厂只准备一次
+        fixed = dict(self._overrides)
+        if start_date:
+            fixed["start_date"] = start_date
+        if end_date:
+            fixed["end_date"] = end_date
+        factory = self._preset_factory()
+
+        jobs: List[Tuple[dict, BacktestConfig]] = []
+        for combo in combos:
             params = dict(zip(param_names, combo))
-            params.update(self._overrides)
-
-            if start_date:
-                params["start_date"] = start_date
-            if end_date:
-                params["end_date"] = end_date
-
-            config = self._make_config(params)
-
-            if progress_callback:
-                progress_callback(i + 1, total, config)
-
-            # 执行回测 (共享 adapter)
-            engine = BacktestEngine(config, adapter=adapter)
-            metrics = engine.run()
-
-            # 合并参数 + 指标
-            row = {**params, **asdict(metrics), "label": config.label()}
-            results.append(row)
-
-            if (i + 1) % 10 == 0:
-                logger.info(f"  进度: {i+1}/{total}")
-
-        df = pd.DataFrame(results)
+            params.update(fixed)
+            jobs.append((params, factory(**params)))
+
+        if n_workers > 1:
+            # 侧表在父进程建好，worker 继承后不再各自重建
+            if hasattr(adapter, "prepare"):
+                adapter.prepare()
+            executor = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=pool_context(),
+                initializer=_init_worker,
+                initargs=(adapter,),
+            )
+            # 连续的组合打包分发: 减少逐任务 IPC，且相邻组合的 RS 方法
+            # 往往相同，落在同一 worker 时进程级 RS 缓存命中更多
+            chunksize = max(1, total // (n_workers * 4))
+            metrics_iter = executor.map(
+                _run_config, [c for _, c in jobs], chunksize=chunksize,
+            )
+        else:
+            executor = None
+            # 执行回测 (共享 adapter + RS 缓存: 同一 (方法, 日期) 只算一次)
+            if rs_cache is None:
+                rs_cache = {}
+            metrics_iter = (
+                BacktestEngine(c, adapter=adapter, rs_cache=rs_cache).run()
+                for _, c in jobs
+            )
+
+        # 结果按列收集: 参数列 + 指标列 + label，每个组合按下标写入
+        param_cols = list(jobs[0][0]) if jobs else []
+        columns: Dict[str, list] = {
+            name: [None] * total for name in (*param_cols, *_METRIC_FIELDS, "label")
+        }
+        try:
+            for i, ((params, config), metrics) in enumerate(zip(jobs, metrics_iter)):
+                if progress_callback:
+                    progress_callback(i + 1, total, config)
+
+                # 合并参数 + 指标
+                for name in param_cols:
+                    columns[name][i] = params[name]
+                for name in _METRIC_FIELDS:
+                    columns[name][i] = getattr(metrics, name)
+                columns["label"][i] = config.label()
+
+                if (i + 1) % 10 == 0:
+                    logger.info(f"  进度: {i+1}/{total}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        df = pd.DataFrame(columns) if jobs else pd.DataFrame()
 
         # 排序: Sharpe 降序
         if "sharpe_ratio" in df.columns:
@@ -133,10 +208,9 @@ class ParameterSweep:
 
     # ── 内部方法 ──────────────────────────────────────
 
-    def _make_config(self, params: dict) -> BacktestConfig:
-        """从参数字典创建 BacktestConfig"""
-        factory = crypto_preset if self.market == "crypto" else us_preset
-        return factory(**params)
+    def _preset_factory(self):
+        """market 对应的 BacktestConfig preset 工厂"""
+        return crypto_preset if self.market == "crypto" else us_preset
 
     def _create_adapter(self):
         """根据 market 创建适配器"""
@@ -18,6 +18,57 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+# ── Per-exchange task text: (soros_task, marks_task), built once at import ──
+
+# 首轮: 各自亮出核心论点
+_OPENING_TASKS = (
+    (
+        "基于 `alpha_bet.md` 的核心赌注结构，陈述为什么**现在**必须行动：\n"
+        "- 反身性循环正在形成的具体证据\n"
+        "- 时间窗口为什么正在关闭（结构性，不是情绪性）\n"
+        "- 赌注结构如何覆盖 `alpha_red_team.md` 的主要攻击\n"
+        "- 等待的真实机会成本"
+    ),
+    (
+        "基于 `alpha_cycle.md` 的周期定位，反驳索罗斯的行动论：\n"
+        "- 当前钟摆分数是否真的支持行动？引用具体数据\n"
+        "- 历史上类似周期位置的行动结果\n"
+        "- 等待的 option value：市场正在免费给你什么期权？\n"
+        "- 索罗斯的「时间窗口」是真实紧迫还是 FOMO？"
+    ),
+)
+
+# 中间轮: 针对对方论点深化
+_MIDDLE_TASKS = (
+    (
+        "回应马克斯的周期担忧，深化你的论证：\n"
+        "- 承认哪些周期风险是真实的（不要回避）\n"
+        "- 解释为什么当前的非对称性足以覆盖这些风险\n"
+        "- 提出具体的风险管理方案（仓位结构、止损、分批建仓）"
+    ),
+    (
+        "回应索罗斯的风险管理方案，指出其不足：\n"
+        "- 仓位结构真的能管理尾部风险吗？\n"
+        "- 反身性是刀刃，也会向下反转——你如何区分信号与噪音？\n"
+        "- 在你的视角下，什么样的信号才能让你点头？"
+    ),
+)
+
+# 末轮: 最终陈词
+_CLOSING_TASKS = (
+    (
+        "最终陈词：用最简洁的语言给出你的核心论点和行动建议。\n"
+        "- 如果只能说一件事，是什么？\n"
+        "- 你愿意用多大仓位为这个判断下注？"
+    ),
+    (
+        "最终陈词：给出你的最终风险评估和立场。\n"
+        "- 索罗斯说服了你什么？哪些担忧仍然存在？\n"
+        "- 如果必须做出行动建议，你的答案是什么？"
+    ),
+)
+
+
 def generate_alpha_debate_prompt(
     symbol: str,
     research_dir_str: str,
@@ -56,51 +107,17 @@ def generate_alpha_debate_prompt(
     exchange_blocks = []
     for r in range(1, rounds + 1):
         if r == 1:
-            soros_task = (
-                "基于 `alpha_bet.md` 的核心赌注结构，陈述为什么**现在**必须行动：\n"
-                "- 反身性循环正在形成的具体证据\n"
-                "- 时间窗口为什么正在关闭（结构性，不是情绪性）\n"
-                "- 赌注结构如何覆盖 `alpha_red_team.md` 的主要攻击\n"
-                "- 等待的真实机会成本"
-            )
-            marks_task = (
-                "基于 `alpha_cycle.md` 的周期定位，反驳索罗斯的行动论：\n"
-                "- 当前钟摆分数是否真的支持行动？引用具体数据\n"
-                "- 历史上类似周期位置的行动结果\n"
-                "- 等待的 option value：市场正在免费给你什么期权？\n"
-                "- 索罗斯的「时间窗口」是真实紧迫还是 FOMO？"
-            )
+            soros_task, marks_task = _OPENING_TASKS
         elif r < rounds:
-            soros_task = (
-                "回应马克斯的周期担忧，深化你的论证：\n"
-                "- 承认哪些周期风险是真实的（不要回避）\n"
-                "- 解释为什么当前的非对称性足以覆盖这些风险\n"
-                "- 提出具体的风险管理方案（仓位结构、止损、分批建仓）"
-            )
-            marks_task = (
-                "回应索罗斯的风险管理方案，指出其不足：\n"
-                "- 仓位结构真的能管理尾部风险吗？\n"
-                "- 反身性是刀刃，也会向下反转——你如何区分信号与噪音？\n"
-                "- 在你的视角下，什么样的信号才能让你点头？"
-            )
+            soros_task, marks_task = _MIDDLE_TASKS
         else:
-            soros_task = (
-                "最终陈词：用最简洁的语言给出你的核心论点和行动建议。\n"
-                "- 如果只能说一件事，是什么？\n"
-                "- 你愿意用多大仓位为这个判断下注？"
-            )
-            marks_task = (
-                "最终陈词：给出你的最终风险评估和立场。\n"
-                "- 索罗斯说服了你什么？哪些担忧仍然存在？\n"
-                "- 如果必须做出行动建议，你的答案是什么？"
-            )
-
-        block = (
+            soros_task, marks_task = _CLOSING_TASKS
+
+        exchange_blocks.append(
             f"─── 交换 {r}/{rounds} ───\n\n"
             f"**索罗斯**（行动派）:\n{soros_task}\n\n"
             f"**马克斯**（耐心派）:\n{marks_task}"
         )
-        exchange_blocks.append(block)
 
     exchanges_text = "\n\n".join(exchange_blocks)
 
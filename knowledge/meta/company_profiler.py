@@ -38,22 +38,9 @@ _LENS_DEFAULTS = """\
 """
 
 
-def generate_profiler_prompt(data_context: str) -> str:
-    """Generate the complete profiler agent prompt.
+# ── Prompt scaffolding (static; assembled once at import) ────────────────
 
-    This is a *meta-prompt*: it instructs the LLM to read the company's
-    financial data and produce a structured company_profile.md that will
-    guide all downstream analysis agents.
-
-    Args:
-        data_context: The full text of data_context.md (financial data,
-            ratios, technicals, macro environment).
-
-    Returns:
-        Complete prompt string for the profiler agent.
-    """
-    safe_context = data_context.replace("</data_context>", "&lt;/data_context&gt;")
-    return f"""\
+_PROMPT_PREFIX = """\
 你是未来资本的**公司画像分析师**。你的任务是阅读公司的财务数据，判断其**原型和阶段**，然后为下游 5 个透镜分析师、综合研判和 Alpha 层提供个性化的分析指引。
 
 ## 你的输入
@@ -61,7 +48,9 @@ def generate_profiler_prompt(data_context: str) -> str:
 以下是公司的完整数据上下文（财务数据、比率、技术指标、宏观环境）：
 
 <data_context>
-{safe_context}
+"""
+
+_PROMPT_SUFFIX = f"""
 </data_context>
 
 ## 公司原型参考表
@@ -158,3 +147,21 @@ def generate_profiler_prompt(data_context: str) -> str:
 5. **不要重复原始数据** — data_context 已经提供了事实，你只需提供分类判断和分析指引
 6. **业务概览面向非专业读者** — 避免术语堆砌，用通俗语言解释商业模式，必要时英文括注
 """
+
+
+def generate_profiler_prompt(data_context: str) -> str:
+    """Generate the complete profiler agent prompt.
+
+    This is a *meta-prompt*: it instructs the LLM to read the company's
+    financial data and produce a structured company_profile.md that will
+    guide all downstream analysis agents.
+
+    Args:
+        data_context: The full text of data_context.md (financial data,
+            ratios, technicals, macro environment).
+
+    Returns:
+        Complete prompt string for the profiler agent.
+    """
+    safe_context = data_context.replace("</data_context>", "&lt;/data_context&gt;")
+    return _PROMPT_PREFIX + safe_context + _PROMPT_SUFFIX
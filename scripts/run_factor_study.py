@@ -68,6 +68,8 @@ def main():
                         help="美股 universe 切换 (pool=~130 / extended=~949 active post-A1 / extended_true=active+delisted overlay / 默认=all in db)")
     parser.add_argument("--mcap-threshold", type=float, default=None,
                         help="历史市值阈值美元 (e.g. 10e9)，每个 rebalance 日 PIT 过滤")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="因子分析并行进程数 (1=串行, -1=全部 CPU 核)")
     parser.add_argument("-v", "--verbose", action="store_true", help="详细日志")
 
     args = parser.parse_args()
@@ -117,6 +119,8 @@ def main():
         overrides["oos_fraction"] = 0.0
     if args.oos_start:
         overrides["oos_start_date"] = args.oos_start
+    if args.jobs != 1:
+        overrides["n_jobs"] = args.jobs
 
     if args.market == "crypto":
         config = crypto_factor_study(**overrides)
@@ -58,6 +58,22 @@ class TestCryptoRsB:
         df = compute_crypto_rs_b({})
         assert df.empty
 
+    def test_returns_match_scalar_formula(self):
+        """向量化结果与逐标的标量公式一致"""
+        prices = self._make_prices(n_symbols=8, n_days=40)
+        prices["SHORT"] = prices["SYM0USDT"][:10]  # 数据不足, 被过滤
+        df = compute_crypto_rs_b(prices).set_index("symbol")
+        assert "SHORT" not in df.index
+
+        for sym, close in prices.items():
+            if sym == "SHORT":
+                continue
+            end_idx = len(close) - 2  # skip_days=1
+            row = df.loc[sym]
+            assert row["ret_7d"] == pytest.approx(close[end_idx] / close[end_idx - 7] - 1)
+            assert row["ret_3d"] == pytest.approx(close[end_idx] / close[end_idx - 3] - 1)
+            assert row["ret_1d"] == pytest.approx(close[end_idx] / close[end_idx - 1] - 1)
+
 
 class TestCryptoRsC:
     """币圈 Method C 测试"""
@@ -82,6 +98,45 @@ class TestCryptoRsC:
         df = compute_crypto_rs_c({})
         assert df.empty
 
+    def test_clenow_matches_linregress(self):
+        """闭式 OLS 与 scipy linregress 一致"""
+        from scipy.stats import linregress
+
+        prices = self._make_prices(n_symbols=6)
+        df = compute_crypto_rs_c(prices).set_index("symbol")
+        for sym, close in prices.items():
+            tail = np.log(close[-7:])
+            slope, _, r_value, _, _ = linregress(np.arange(7), tail)
+            expected = np.clip(np.exp(slope) ** 365 - 1, -10, 100) * r_value ** 2
+            assert df.loc[sym, "clenow_7d"] == pytest.approx(expected)
+            assert df.loc[sym, "clenow_1d"] == 0.0  # 窗口 < 2
+
+    def test_flat_prices_zero_momentum(self):
+        prices = self._make_prices(n_symbols=3)
+        prices["FLAT"] = np.full(30, 5.0)
+        df = compute_crypto_rs_c(prices).set_index("symbol")
+        assert df.loc["FLAT", "clenow_7d"] == 0.0
+        assert df["composite"].notna().all()
+
+
+class TestFastRank:
+    """_fast_rank 与 scipy rankdata(method="average") 一致"""
+
+    @pytest.mark.parametrize("values", [
+        [0.3, -1.2, 2.5, 0.0, 1.1],
+        [1.0, 2.0, 2.0, 3.0],          # 并列 → 平均秩
+        [np.nan, 1.0, 2.0],            # NaN → 回退 rankdata
+        [7.0],
+    ])
+    def test_matches_rankdata(self, values):
+        from scipy.stats import rankdata
+        from backtest.adapters.crypto_rs import _fast_rank
+
+        x = np.array(values)
+        np.testing.assert_array_equal(
+            _fast_rank(x), rankdata(x, method="average"),
+        )
+
 
 # ── 适配器集成测试 (临时目录) ────────────────────────
 
@@ -129,6 +184,80 @@ class TestCryptoAdapter:
         sliced = adapter.slice_to_date(mid_date)
         for sym, arr in sliced.items():
             assert isinstance(arr, np.ndarray)
+            assert arr.dtype == np.float64
+            assert not arr.flags.writeable  # 缓存视图, 不可写
+
+    def test_trading_dates_cached_and_invalidated(self, temp_cache):
+        from backtest.adapters.crypto import CryptoAdapter
+        adapter = CryptoAdapter(cache_dir=temp_cache)
+        dates = adapter.get_trading_dates()
+        dates.append("2099-01-01")  # 返回副本, 不污染缓存
+        assert adapter.get_trading_dates()[-1] != "2099-01-01"
+
+        btc = adapter._price_cache["BTCUSDT"]
+        adapter._price_cache = {"BTCUSDT": btc.iloc[:20].reset_index(drop=True)}
+        assert adapter.get_trading_dates() == btc["date"].iloc[:20].tolist()
+
+    def test_slice_to_date_matches_mask(self, temp_cache):
+        """searchsorted 切片与逐行日期比较结果一致"""
+        from backtest.adapters.crypto import CryptoAdapter
+        adapter = CryptoAdapter(cache_dir=temp_cache)
+        data = adapter.load_all()
+        dates = adapter.get_trading_dates()
+        for cutoff in (dates[13], dates[14], dates[20], dates[-1], "2030-01-01"):
+            sliced = adapter.slice_to_date(cutoff)
+            for sym, df in data.items():
+                expected = df[df["date"] <= cutoff]["close"].to_numpy()
+                if len(expected) >= 15:
+                    np.testing.assert_array_equal(sliced[sym], expected)
+                else:
+                    assert sym not in sliced
+
+    def test_slice_indices_consistent_with_slices(self, temp_cache):
+        from backtest.adapters.crypto import CryptoAdapter
+        adapter = CryptoAdapter(cache_dir=temp_cache)
+        dates = adapter.get_trading_dates()
+        cutoff = dates[20]
+
+        ends = adapter.slice_indices(cutoff)
+        arrays = adapter.slice_to_date(cutoff)
+        frames = adapter.slice_to_date_df(cutoff)
+
+        assert set(ends) == set(arrays) == set(frames)
+        for sym, end in ends.items():
+            assert len(arrays[sym]) == len(frames[sym]) == end
+            assert frames[sym]["date"].iloc[-1] == cutoff
+            assert frames[sym].index.tolist() == list(range(end))
+        assert adapter.slice_indices(dates[10]) == {}  # 不足 15 行
+
+    def test_shared_calendars_are_bucketed(self, temp_cache):
+        from backtest.adapters.crypto import CryptoAdapter
+        adapter = CryptoAdapter(cache_dir=temp_cache)
+        adapter.load_all()
+        btc = adapter._price_cache["BTCUSDT"]
+        adapter._price_cache["NEWUSDT"] = btc.iloc[5:].reset_index(drop=True)
+
+        dates = adapter.get_trading_dates()
+        assert len(adapter._calendars) == 2  # 3 只同日历 + 1 只晚上市
+        assert adapter._calendar_of["BTCUSDT"] == adapter._calendar_of["ETHUSDT"]
+
+        ends = adapter.slice_indices(dates[20])
+        assert ends["BTCUSDT"] == 21
+        assert ends["NEWUSDT"] == 16
+        assert list(ends) == list(adapter._price_cache)  # 保持原始标的顺序
+
+    def test_master_calendar(self, temp_cache):
+        from backtest.adapters.crypto import CryptoAdapter
+        adapter = CryptoAdapter(cache_dir=temp_cache)
+        adapter.load_all()
+        btc = adapter._price_cache["BTCUSDT"]
+        adapter._price_cache["LATEUSDT"] = btc.iloc[5:].reset_index(drop=True)
+
+        union = adapter.get_trading_dates()
+        assert adapter.master_calendar("BTCUSDT").tolist() == union
+        assert adapter.master_calendar("MISSING").tolist() == union  # 取最长日历
+        # 基准晚上市, 覆盖不到首日 → 回退并集
+        assert adapter.master_calendar("LATEUSDT").tolist() == union
 
     def test_get_prices_at(self, temp_cache):
         from backtest.adapters.crypto import CryptoAdapter
@@ -140,6 +269,39 @@ class TestCryptoAdapter:
         for v in prices.values():
             assert v > 0
 
+        data = adapter.load_all()
+        for sym, v in prices.items():
+            assert v == data[sym]["close"].iloc[0]
+
+        prices.clear()  # 每次返回新字典
+        assert adapter.get_prices_at(dates[0])
+        assert adapter.get_prices_at("1999-01-01") == {}
+
+    def test_get_prices_at_per_calendar(self, temp_cache):
+        from backtest.adapters.crypto import CryptoAdapter
+        adapter = CryptoAdapter(cache_dir=temp_cache)
+        adapter.load_all()
+        btc = adapter._price_cache["BTCUSDT"]
+        adapter._price_cache["LATEUSDT"] = btc.iloc[5:].reset_index(drop=True)
+        dates = adapter.get_trading_dates()
+
+        assert "LATEUSDT" not in adapter.get_prices_at(dates[4])
+        assert adapter.get_prices_at(dates[5])["LATEUSDT"] == btc["close"].iloc[5]
+        # 日历之间的日期不命中任何标的
+        assert adapter.get_prices_at(dates[5] + "x") == {}
+
+    def test_benchmark_arrays(self, temp_cache):
+        from backtest.adapters.crypto import CryptoAdapter
+        adapter = CryptoAdapter(cache_dir=temp_cache)
+        dates, navs = adapter.get_benchmark_arrays("BTCUSDT")
+        assert navs.dtype == np.float64
+        assert list(zip(dates.tolist(), navs.tolist())) == \
+            adapter.get_benchmark_nav("BTCUSDT")
+
+        dates, navs = adapter.get_benchmark_arrays("MISSINGUSDT")
+        assert len(dates) == len(navs) == 0
+        assert adapter.get_benchmark_nav("MISSINGUSDT") == []
+
     def test_rs_function(self, temp_cache):
         from backtest.adapters.crypto import CryptoAdapter
         adapter = CryptoAdapter(cache_dir=temp_cache)
@@ -148,6 +310,48 @@ class TestCryptoAdapter:
         assert callable(fn_b)
         assert callable(fn_c)
 
+    def test_binance_layout_reads_needed_columns(self, tmp_path):
+        """open_time 毫秒时间戳 → date, 无关列不加载"""
+        from backtest.adapters.crypto import CryptoAdapter
+
+        cache_dir = tmp_path / "binance"
+        cache_dir.mkdir()
+        open_time = pd.date_range("2024-01-01", periods=20, freq="D").as_unit("ms")
+        pd.DataFrame({
+            "open_time": open_time.asi8,
+            "open": np.linspace(1, 2, 20),
+            "high": np.linspace(1, 2, 20),
+            "low": np.linspace(1, 2, 20),
+            "close": np.linspace(1, 2, 20),
+            "volume": np.arange(20),
+            "close_time": open_time.asi8 + 86_399_999,
+            "trades": np.arange(20),
+        }).to_csv(cache_dir / "BTCUSDT.csv", index=False)
+
+        df = CryptoAdapter(cache_dir=cache_dir).load_all()["BTCUSDT"]
+
+        assert df["date"].iloc[0] == "2024-01-01"
+        assert df["close"].dtype == np.float64
+        assert "trades" not in df.columns
+        assert "close_time" not in df.columns
+
+    def test_unsorted_csv_is_sorted(self, tmp_path):
+        from backtest.adapters.crypto import CryptoAdapter
+
+        cache_dir = tmp_path / "unsorted"
+        cache_dir.mkdir()
+        dates = pd.date_range("2024-01-01", periods=20).strftime("%Y-%m-%d")
+        pd.DataFrame({
+            "date": dates[::-1],
+            "close": np.arange(20, 0, -1, dtype=float),
+        }).to_csv(cache_dir / "ETHUSDT.csv", index=False)
+
+        df = CryptoAdapter(cache_dir=cache_dir).load_all()["ETHUSDT"]
+
+        assert df["date"].tolist() == list(dates)
+        assert df["close"].tolist() == list(np.arange(1, 21, dtype=float))
+        assert df.index.tolist() == list(range(20))
+
     @pytest.fixture
     def temp_cache_4h(self, tmp_path):
         cache_dir = tmp_path / "four_hour_klines"
@@ -187,3 +391,48 @@ class TestCryptoAdapter:
         sliced = adapter.slice_to_date_df(cutoff)
 
         assert sliced["BTCUSDT"]["date"].iloc[-1] <= cutoff
+
+    def test_slice_4h_date_only_cutoff_includes_midnight_bar(self, temp_cache_4h):
+        from backtest.adapters.crypto import CryptoAdapter
+
+        adapter = CryptoAdapter(cache_dir=temp_cache_4h, interval="4h")
+        adapter.load_all()
+
+        sliced = adapter.slice_to_date_df("2024-01-04")
+
+        assert sliced["BTCUSDT"]["date"].iloc[-1] == "2024-01-04 00:00:00"
+
+
+class TestUSStocksCalendar:
+    """USStocksAdapter 共享日历侧表 (不连 market.db，直接注入 _price_cache)"""
+
+    @pytest.fixture
+    def adapter(self):
+        from backtest.adapters.us_stocks import USStocksAdapter
+
+        adapter = USStocksAdapter(symbols=[])
+        dates = [d.strftime("%Y-%m-%d") for d in pd.bdate_range("2024-01-01", periods=100)]
+        rng = np.random.RandomState(7)
+        for sym in ["AAPL", "MSFT"]:
+            adapter._price_cache[sym] = pd.DataFrame({
+                "date": dates,
+                "close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 100))),
+            })
+        adapter._price_cache["LATE"] = adapter._price_cache["AAPL"].iloc[20:].reset_index(drop=True)
+        return adapter
+
+    def test_slice_indices_respects_min_rows(self, adapter):
+        dates = adapter.get_trading_dates()
+
+        ends = adapter.slice_indices(dates[79])
+        assert ends == {"AAPL": 80, "MSFT": 80}  # LATE 只有 60 行 < 70
+        assert adapter.slice_indices(dates[-1])["LATE"] == 80
+        assert len(adapter._calendars) == 2
+
+    def test_get_prices_at(self, adapter):
+        dates = adapter.get_trading_dates()
+        aapl = adapter._price_cache["AAPL"]
+
+        assert set(adapter.get_prices_at(dates[0])) == {"AAPL", "MSFT"}
+        assert adapter.get_prices_at(dates[30])["LATE"] == aapl["close"].iloc[30]
+        assert adapter.master_calendar("SPY").tolist() == dates
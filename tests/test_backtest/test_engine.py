@@ -185,18 +185,49 @@ class TestBacktestEngine:
 
         assert len(sliced_dates) > 0  # 确实调用了 slice
 
-    def test_build_rebalance_set(self):
-        """换仓日期集合构建"""
+    def test_rebalance_dates_follow_interval(self):
+        """换仓日 = trading_dates[::interval]，第一天总是 rebalance"""
         config = BacktestConfig(
             market="us_stocks", rs_method="B", top_n=3,
             rebalance_freq="M",  # 21 天
         )
         adapter = MockAdapter()
         engine = BacktestEngine(config, adapter=adapter)
+        assert engine._rebalance_interval() == 21
+
+        rebalanced = []
+        original = engine._rebalance
+
+        def tracking(date, prices):
+            rebalanced.append(date)
+            return original(date, prices)
+
+        engine._rebalance = tracking
+        engine.run()
+
         dates = adapter.get_trading_dates()
-        rb_set = engine._build_rebalance_set(dates)
-        assert len(rb_set) > 0
-        assert dates[0] in rb_set  # 第一天总是 rebalance
+        assert rebalanced == dates[::21]
+        assert rebalanced[0] == dates[0]
+
+    def test_daily_freq_rebalances_every_day(self):
+        config = BacktestConfig(
+            market="us_stocks", rs_method="B", top_n=3,
+            rebalance_freq="D",
+        )
+        adapter = MockAdapter()
+        engine = BacktestEngine(config, adapter=adapter)
+
+        rebalanced = []
+        original = engine._rebalance
+
+        def tracking(date, prices):
+            rebalanced.append(date)
+            return original(date, prices)
+
+        engine._rebalance = tracking
+        engine.run()
+
+        assert rebalanced == adapter.get_trading_dates()
 
     def test_date_filter(self):
         """日期过滤"""
@@ -283,6 +314,40 @@ class TestBacktestEngine:
         assert "inv_vol60" in label
         assert "regime200_cash" in label
 
+    def test_shared_rs_cache_reuses_results(self):
+        """共享 rs_cache: 同一 (方法, 日期) 只切片 + 计算一次，结果不变"""
+        adapter = MockAdapter()
+        calls = []
+        original_slice = adapter.slice_to_date
+
+        def counting_slice(date):
+            calls.append(date)
+            return original_slice(date)
+
+        adapter.slice_to_date = counting_slice
+        rs_cache = {}
+        results = []
+        for top_n in (2, 3):
+            config = BacktestConfig(
+                market="us_stocks", rs_method="B", top_n=top_n,
+                rebalance_freq="M", initial_capital=1_000_000,
+            )
+            engine = BacktestEngine(config, adapter=adapter, rs_cache=rs_cache)
+            results.append(engine.run())
+
+        n_rebalances = len(rs_cache)
+        assert n_rebalances > 0
+        assert len(calls) == n_rebalances  # 第二个引擎全部命中缓存
+
+        uncached = BacktestEngine(
+            BacktestConfig(
+                market="us_stocks", rs_method="B", top_n=3,
+                rebalance_freq="M", initial_capital=1_000_000,
+            ),
+            adapter=MockAdapter(),
+        ).run()
+        assert results[1].total_return == pytest.approx(uncached.total_return)
+
 
 class TestRegimeFilter:
     """Regime filter 测试"""
@@ -412,6 +477,24 @@ class TestRegimeFilter:
             f"drift positions were not re-levered"
         )
 
+    def test_check_regime_matches_rolling_mean(self):
+        """searchsorted 版 regime 判定与 pandas 截取 + 均线一致"""
+        adapter = MockAdapter()
+        config = BacktestConfig(
+            market="us_stocks", rs_method="B", top_n=3,
+            regime_symbol="SPY", regime_ma_period=20,
+        )
+        engine = BacktestEngine(config, adapter=adapter)
+        index = adapter.get_index_prices("SPY")
+
+        for date in list(index.index[::7]) + ["2022-12-31", "2099-01-01"]:
+            sliced = index[index.index <= date]
+            if len(sliced) < 20:
+                expected = True
+            else:
+                expected = sliced.iloc[-1] > sliced.iloc[-20:].mean()
+            assert engine._check_regime(date) == expected, date
+
     def test_regime_disabled_by_default(self):
         """不传 regime_symbol → 行为不变"""
         config = BacktestConfig(
@@ -4,7 +4,9 @@
 
 import pytest
 import numpy as np
-from backtest.metrics import compute_metrics, _max_drawdown, BacktestMetrics
+from backtest.metrics import (
+    compute_metrics, compute_metrics_from_navs, _max_drawdown, BacktestMetrics,
+)
 
 
 class TestMaxDrawdown:
@@ -28,6 +30,13 @@ class TestMaxDrawdown:
         dd, dur = _max_drawdown(navs)
         assert dd == 0.0
 
+    def test_duration_counts_from_latest_equal_peak(self):
+        # 110 在下标 1 和 3 两次出现，持续天数从最近一次 (下标 3) 算起
+        navs = np.array([100, 110, 105, 110, 88, 95])
+        dd, dur = _max_drawdown(navs)
+        assert dd == pytest.approx(-22 / 110)
+        assert dur == 1
+
 
 class TestComputeMetrics:
     """完整指标计算"""
@@ -87,6 +96,26 @@ class TestComputeMetrics:
         # 策略跑赢基准
         assert m.alpha > 0 or m.information_ratio > 0
 
+    def test_benchmark_array_pair_matches_tuples(self):
+        """(dates, navs) 数组对与 [(date, nav), ...] 结果一致"""
+        rng = np.random.RandomState(1)
+        strat_nav = self._make_nav(list(rng.normal(0.001, 0.01, 60)))
+        bench_nav = self._make_nav(list(rng.normal(0.0005, 0.01, 60)))
+        arrays = (
+            np.array([d for d, _ in bench_nav]),
+            np.array([v for _, v in bench_nav]),
+        )
+        assert compute_metrics(strat_nav, benchmark_nav=arrays) == \
+            compute_metrics(strat_nav, benchmark_nav=bench_nav)
+
+    def test_nav_array_entry_matches_series(self):
+        """compute_metrics_from_navs 与元组序列入口结果一致"""
+        rng = np.random.RandomState(2)
+        nav = self._make_nav(list(rng.normal(0.001, 0.01, 60)))
+        navs = np.array([v for _, v in nav])
+        assert compute_metrics_from_navs(navs, total_costs=12.5, n_trades=3) == \
+            compute_metrics(nav, total_costs=12.5, n_trades=3)
+
     def test_trade_stats(self):
         nav = self._make_nav([0.01] * 10)
         m = compute_metrics(nav, total_costs=500.0, n_trades=20, annual_turnover=2.5)
@@ -62,6 +62,24 @@ class TestRobustnessRanking:
         result = opt.rank_with_robustness(sweep_df, top_k=5)
         assert len(result) == 5
 
+    def test_duplicate_combos_use_best_row(self):
+        """同一参数组合多行时邻居取 metric 最高的一行，Top K 不重排原表"""
+        opt = ParamOptimizer("us_stocks")
+        base = {"rs_method": "B", "rebalance_freq": "M", "sell_buffer": 0}
+        sweep_df = pd.DataFrame([
+            {**base, "top_n": 10, "sharpe_ratio": 0.2},
+            {**base, "top_n": 5, "sharpe_ratio": 1.0},
+            {**base, "top_n": 10, "sharpe_ratio": 0.8},
+            {**base, "top_n": 15, "sharpe_ratio": float("nan")},
+        ])
+
+        result = opt.rank_with_robustness(sweep_df, top_k=1)
+
+        assert result["top_n"].tolist() == [5]
+        assert result["neighbor_count"].iloc[0] == 1
+        # 邻居 top_n=10 取 0.8 → 调和平均 2×1.0×0.8/1.8
+        assert result["robustness_score"].iloc[0] == pytest.approx(1.6 / 1.8)
+
     def test_robustness_penalizes_outliers(self):
         """
         如果一组参数的 Sharpe 很高但邻居很差，
@@ -138,3 +156,53 @@ class TestNeighborFinding:
         adj = opt._get_adjacent_values("sell_buffer", 3)
         assert 0 in adj
         assert 5 in adj
+
+    def test_adjacent_values_cached(self):
+        from backtest.optimizer import _adjacent_values
+
+        _adjacent_values.cache_clear()
+        ParamOptimizer("us_stocks")._get_adjacent_values("top_n", 10)
+        ParamOptimizer("us_stocks")._get_adjacent_values("top_n", 10)
+        assert _adjacent_values.cache_info().hits == 1
+        assert _adjacent_values("crypto", "unknown", 1) == ()
+
+
+class TestWalkForward:
+
+    _GRID = {
+        "rs_method": ["B"],
+        "top_n": [2, 3],
+        "rebalance_freq": ["M"],
+        "sell_buffer": [0],
+    }
+
+    def test_parallel_matches_serial(self):
+        from tests.test_backtest.test_engine import MockAdapter
+
+        opt = ParamOptimizer("us_stocks", adapter=MockAdapter())
+        kwargs = dict(train_months=4, test_months=2, step_months=2, grid=self._GRID)
+
+        serial = opt.walk_forward(**kwargs)
+        parallel = opt.walk_forward(n_jobs=2, **kwargs)
+
+        assert len(serial.rounds) == 2
+        assert [r.round_num for r in serial.rounds] == [1, 2]
+        assert parallel == serial
+
+    def test_param_consistency(self):
+        from backtest.optimizer import WalkForwardRound
+
+        def _round(params):
+            return WalkForwardRound(
+                1, "", "", "", "", "", params, 0.0, 0.0, 0.0, 0.0, 0.0,
+            )
+
+        rounds = [
+            _round({"top_n": 10, "rs_method": "B"}),
+            _round({"top_n": 10, "rs_method": "C"}),
+            _round({"top_n": 5}),                   # rs_method 缺失记为 None
+        ]
+        opt = ParamOptimizer("us_stocks")
+        # top_n: 10 出现 2/3; rs_method: 各值 1/3
+        assert opt._param_consistency(rounds) == pytest.approx(3 / 6)
+        assert opt._param_consistency(rounds[:1]) == 1.0
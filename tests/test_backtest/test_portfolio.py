@@ -91,6 +91,7 @@ class TestPortfolioState:
         series = p.nav_series()
         assert len(series) == 2
         assert series[0] == ("2024-01-01", 100_000)
+        assert p.nav_array().tolist() == [v for _, v in series]
 
     def test_fractional_shares(self):
         p = PortfolioState(100_000, cost_rate=0.0)
@@ -107,3 +108,19 @@ class TestPortfolioState:
         p.buy("AAPL", 5_000, 100.0, "2024-01-01")
         p.buy("AAPL", 5_000, 110.0, "2024-01-02")
         assert p.holdings["AAPL"] == pytest.approx(50 + 5_000 / 110.0)
+
+    def test_trade_log_grows_and_round_trips(self):
+        p = PortfolioState(1_000_000, cost_rate=0.001)
+        for i in range(100):  # 超过初始容量
+            sym = f"S{i % 7}"
+            p.buy(sym, 1_000, 10.0 + i, f"2024-01-{i % 28 + 1:02d}")
+            p.sell_all(sym, 11.0 + i, f"2024-02-{i % 28 + 1:02d}")
+
+        trades = p.trades
+        assert p.total_trades == len(trades) == 200
+        assert [t.side for t in trades[:2]] == ["BUY", "SELL"]
+        assert trades[-1].symbol == "S1"
+        assert trades[-1].date == "2024-02-16"
+        assert trades[-1].price == 110.0
+        assert p.total_costs == pytest.approx(sum(t.cost for t in trades))
+        assert p.trade_columns()["notional"] == [t.notional for t in trades]
@@ -81,6 +81,20 @@ class TestRebalancer:
         assert "E" in action.to_buy
 
 
+    def test_tie_order_matches_sort_values(self):
+        """大量并列名次 (含 NaN) 时顺序与 DataFrame.sort_values 一致"""
+        import numpy as np
+        from backtest.rebalancer import _descending_order
+
+        rng = np.random.default_rng(3)
+        ranks = rng.integers(0, 10, 200).astype(float)
+        ranks[::17] = np.nan
+        rs = _make_rs_df([(f"S{i}", r) for i, r in enumerate(ranks)])
+
+        expected = rs.sort_values("rs_rank", ascending=False)["symbol"].tolist()
+        got = rs["symbol"].to_numpy()[_descending_order(rs["rs_rank"].to_numpy())]
+        assert got.tolist() == expected
+
 class TestComputeWeights:
     """目标权重计算"""
 
@@ -101,6 +115,20 @@ class TestComputeWeights:
         assert weights["A"] > weights["B"]
         assert sum(weights.values()) == pytest.approx(1.0)
 
+    def test_rs_weighted_reuses_ranks_from_compute(self):
+        """compute() 生成的 action 带排名，compute_weights 不再依赖 rs_df"""
+        r = Rebalancer(top_n=2, sell_buffer=1)
+        rs = _make_rs_df([("A", 80), ("B", 20), ("C", 60), ("D", 10)])
+        action = r.compute(rs, {"B"})
+        assert action.rs_ranks == {"A": 80, "C": 60, "B": 20}
+
+        reused = r.compute_weights(action, _make_rs_df([]), "rs_weighted")
+        assert reused == r.compute_weights(
+            RebalanceAction(action.to_sell, action.to_buy, action.to_hold,
+                            action.target_count),
+            rs, "rs_weighted",
+        )
+
     def test_empty_action(self):
         r = Rebalancer(top_n=3)
         rs = _make_rs_df([])
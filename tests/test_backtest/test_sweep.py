@@ -0,0 +1,137 @@
+"""
+ParameterSweep 测试
+
+用 test_engine 的合成数据 MockAdapter 验证串行/并行扫描结果一致。
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.adapters.crypto import CryptoAdapter
+from backtest.parallel import resolve_n_jobs
+from backtest.sweep import ParameterSweep
+from tests.test_backtest.test_engine import MockAdapter
+
+_GRID = {
+    "rs_method": ["B"],
+    "top_n": [2, 3],
+    "rebalance_freq": ["M"],
+    "sell_buffer": [0, 1],
+}
+
+
+class TestParameterSweep:
+
+    def test_serial_run(self):
+        sweep = ParameterSweep("us_stocks", grid=dict(_GRID))
+        sweep.set_override(benchmark_symbol=None)
+        df = sweep.run(adapter=MockAdapter())
+        assert len(df) == sweep.total_combinations() == 4
+        assert df["sharpe_ratio"].is_monotonic_decreasing
+        assert df["label"].is_unique
+
+    def test_parallel_matches_serial(self):
+        sweep = ParameterSweep("us_stocks", grid=dict(_GRID))
+        sweep.set_override(benchmark_symbol=None)
+        adapter = MockAdapter()
+
+        seen = []
+        serial = sweep.run(adapter=adapter)
+        parallel = sweep.run(
+            adapter=adapter, n_jobs=2,
+            progress_callback=lambda i, n, cfg: seen.append(i),
+        )
+
+        assert seen == [1, 2, 3, 4]
+        pd.testing.assert_frame_equal(
+            serial.sort_values("label").reset_index(drop=True),
+            parallel.sort_values("label").reset_index(drop=True),
+        )
+
+    def test_shared_rs_cache_across_runs(self):
+        adapter = MockAdapter()
+        rs_func = adapter.get_rs_function("B")
+        calls = []
+        adapter.get_rs_function = lambda method: (
+            lambda sliced: calls.append(1) or rs_func(sliced)
+        )
+        sweep = ParameterSweep("us_stocks", grid=dict(_GRID))
+        sweep.set_override(benchmark_symbol=None)
+        cache = {}
+
+        first = sweep.run(adapter=adapter, rs_cache=cache)
+        n_first = len(calls)
+        second = sweep.run(adapter=adapter, rs_cache=cache)
+
+        assert n_first == len(cache) > 0
+        assert len(calls) == n_first          # 第二次扫描全部命中缓存
+        pd.testing.assert_frame_equal(first, second)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork 仅 Linux")
+    def test_parallel_workers_inherit_adapter_without_pickle(self):
+        class UnpicklableAdapter(MockAdapter):
+            def __getstate__(self):
+                raise AssertionError("adapter 不应被 pickle")
+
+        sweep = ParameterSweep("us_stocks", grid=dict(_GRID))
+        sweep.set_override(benchmark_symbol=None)
+
+        df = sweep.run(adapter=UnpicklableAdapter(), n_jobs=2)
+
+        assert len(df) == 4
+
+    def test_resolve_n_jobs(self):
+        assert resolve_n_jobs(1, 10) == 1
+        assert resolve_n_jobs(8, 3) == 3
+        assert resolve_n_jobs(-1, 1) == 1
+        assert resolve_n_jobs(None, 1000) >= 1
+
+
+class _TracingCryptoAdapter(CryptoAdapter):
+    """每次重建侧表时把当前 pid 追加到 trace 文件"""
+
+    def __init__(self, trace_path, **kwargs):
+        super().__init__(**kwargs)
+        self._trace_path = trace_path
+
+    def _ensure_arrays(self) -> None:
+        if self._price_cache and self._arrays_source is not self._price_cache:
+            with open(self._trace_path, "a") as f:
+                f.write(f"{os.getpid()}\n")
+        super()._ensure_arrays()
+
+
+class TestPreparedAdapter:
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        cache_dir = tmp_path / "daily"
+        cache_dir.mkdir()
+        rng = np.random.RandomState(3)
+        dates = [d.strftime("%Y-%m-%d") for d in pd.date_range("2024-01-01", periods=60)]
+        for i in range(6):
+            pd.DataFrame({
+                "date": dates,
+                "close": 100 * np.exp(np.cumsum(rng.normal(0.001 * i, 0.02, 60))),
+                "volume": rng.uniform(1e6, 1e7, 60),
+            }).to_csv(cache_dir / f"SYM{i}USDT.csv", index=False)
+        return cache_dir
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork 仅 Linux")
+    def test_parallel_workers_do_not_rebuild_sidecars(self, cache_dir, tmp_path):
+        trace = tmp_path / "rebuilds.txt"
+        adapter = _TracingCryptoAdapter(trace, cache_dir=cache_dir)
+        sweep = ParameterSweep("crypto", grid={
+            "rs_method": ["B"], "top_n": [2, 3], "rebalance_freq": ["W"],
+            "sell_buffer": [0, 1],
+        })
+        sweep.set_override(benchmark_symbol=None)
+
+        df = sweep.run(adapter=adapter, n_jobs=2)
+
+        assert len(df) == 4
+        assert trace.read_text().split() == [str(os.getpid())]
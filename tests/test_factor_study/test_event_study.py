@@ -94,6 +94,19 @@ class TestRunEventStudy:
         for r in results:
             assert r.n_events == 0
 
+    def test_nan_returns_dropped(self):
+        # 01-09 的 5d 收益为 NaN, 只有 01-01 计入
+        events = {"AAPL": ["2024-01-01", "2024-01-09", "2099-01-01"], "UNKNOWN": ["2024-01-01"]}
+        ret_matrices = _make_return_matrices()
+        sig = SignalDefinition(SignalType.THRESHOLD, 90)
+
+        results = run_event_study("Test", sig, events, ret_matrices)
+        r5 = [r for r in results if r.horizon == 5][0]
+
+        assert r5.n_events == 1
+        assert r5.n_effective == 1
+        assert abs(r5.mean_return - 0.05) < 1e-10
+
     def test_hit_rate_calculation(self):
         # 两个事件: 一个正收益, 一个负收益
         events = {"AAPL": ["2024-01-01", "2024-01-04"]}
@@ -214,3 +227,28 @@ class TestEventStudyResult:
             n_events=0,
         )
         assert r.n_effective == 0
+
+
+class TestTStat:
+    def test_matches_scipy_ttest(self):
+        from scipy.stats import ttest_1samp
+
+        events = {"AAPL": [f"2024-01-{d:02d}" for d in range(1, 9)]}
+        ret_matrices = _make_return_matrices()
+        sig = SignalDefinition(SignalType.THRESHOLD, 90)
+
+        r5 = [r for r in run_event_study("Test", sig, events, ret_matrices) if r.horizon == 5][0]
+        expected = ttest_1samp(ret_matrices[5]["AAPL"].iloc[:8].to_numpy(), 0.0)
+
+        assert r5.t_stat == pytest.approx(expected.statistic)
+        assert r5.p_value == pytest.approx(expected.pvalue)
+
+    def test_constant_cluster_means_no_t_test(self):
+        dates = [f"2024-01-{d:02d}" for d in range(1, 6)]
+        ret_matrices = {5: pd.DataFrame({"A": [0.01] * 5}, index=dates)}
+        sig = SignalDefinition(SignalType.THRESHOLD, 90)
+
+        r = run_event_study("Test", sig, {"A": dates}, ret_matrices)[0]
+
+        assert r.t_stat == 0.0
+        assert r.p_value == 1.0
@@ -110,3 +110,24 @@ class TestBuildReturnMatrix:
         result = build_return_matrix({}, ["2024-01-01"], [5])
         assert 5 in result
         assert result[5].empty
+
+    def test_horizon_counts_own_trading_days(self):
+        """前向窗口按股票自身交易日计数 (缺失日不占位)"""
+        price_dict = _make_price_dict()
+        gappy = price_dict["AAPL"].drop(index=[2, 3]).reset_index(drop=True)
+        price_dict = {"AAPL": gappy}
+
+        result = build_return_matrix(price_dict, ["2024-01-01"], [5])
+        ret = result[5].loc["2024-01-01", "AAPL"]
+
+        # 01-01 之后第 5 个自身交易日是 01-08 (跳过 01-03/01-04)
+        expected = 1.01 ** 7 - 1
+        assert abs(ret - expected) < 1e-10
+
+    def test_zero_price_gives_nan(self):
+        price_dict = _make_price_dict()
+        price_dict["MSFT"].loc[0, "close"] = 0.0
+
+        result = build_return_matrix(price_dict, ["2024-01-01"], [5])
+
+        assert np.isnan(result[5].loc["2024-01-01", "MSFT"])
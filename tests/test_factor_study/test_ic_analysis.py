@@ -87,7 +87,7 @@ class TestAnalyzeIC:
         ic_results, _ = analyze_ic(meta, scores, rets, dates, n_quantiles=5)
 
         for ic in ic_results:
-            assert ic.quantile_returns[5] > ic.quantile_returns[1]
+            assert ic.quantile_returns[-1] > ic.quantile_returns[0]
             assert ic.top_bottom_spread > 0
 
     def test_random_ic_near_zero(self):
@@ -117,6 +117,133 @@ class TestAnalyzeIC:
         assert len(ic_results) == 0
 
 
+class TestBuildScoreMatrix:
+    def test_layout_and_missing(self):
+        from backtest.factor_study.ic_analysis import build_score_matrix
+
+        history = {
+            "B": [("2024-01-02", 2.0), ("2099-01-01", 9.0)],  # 非计算日丢弃
+            "A": [("2024-01-01", 1.0), ("2024-01-03", 3.0)],
+            "C": [],
+        }
+        dates = ["2024-01-01", "2024-01-02", "2024-01-03"]
+        df = build_score_matrix(history, dates)
+
+        assert df.index.tolist() == dates
+        assert df.columns.tolist() == ["B", "A", "C"]
+        assert df.loc["2024-01-02", "B"] == 2.0
+        assert df.loc["2024-01-03", "A"] == 3.0
+        assert np.isnan(df.loc["2024-01-01", "B"])
+        assert df["C"].isna().all()
+
+    def test_soa_input_matches_tuples(self):
+        from backtest.factor_study.ic_analysis import build_score_matrix
+
+        _, scores, _, dates, _ = _make_random_data()
+        soa = {
+            sym: (np.array([d for d, _ in h]), np.array([v for _, v in h]))
+            for sym, h in scores.items()
+        }
+        pd.testing.assert_frame_equal(
+            build_score_matrix(soa, dates), build_score_matrix(scores, dates),
+        )
+
+    def test_prebuilt_matrix_reused_for_subset(self):
+        """全量分数矩阵传入子集日期的 analyze_ic，结果与现场构建一致"""
+        from backtest.factor_study.ic_analysis import build_score_matrix
+
+        meta, scores, rets, dates, _ = _make_random_data()
+        full = build_score_matrix(scores, dates)
+        subset = dates[:20]
+
+        expected, _ = analyze_ic(meta, scores, rets, subset)
+        reused, _ = analyze_ic(meta, scores, rets, subset, score_matrix=full)
+
+        assert [r.mean_ic for r in reused] == [r.mean_ic for r in expected]
+        assert [r.quantile_returns for r in reused] == [r.quantile_returns for r in expected]
+
+    def test_horizons_with_different_columns(self):
+        """各 horizon 列不同时不复用错位的分数数组"""
+        meta, scores, rets, dates, _ = _make_perfect_data()
+        rets = {5: rets[5], 10: rets[10].iloc[:, ::-1].iloc[:, :15]}
+
+        combined, _ = analyze_ic(meta, scores, rets, dates)
+        separate = [
+            analyze_ic(meta, scores, {h: df}, dates)[0][0]
+            for h, df in sorted(rets.items())
+        ]
+
+        assert [r.mean_ic for r in combined] == [r.mean_ic for r in separate]
+
+    def test_threaded_horizons_match_serial(self):
+        """n_jobs > 1 按 horizon 并行，结果与顺序与串行一致"""
+        meta, scores, rets, dates, horizons = _make_perfect_data()
+
+        serial, serial_decay = analyze_ic(meta, scores, rets, dates)
+        threaded, threaded_decay = analyze_ic(meta, scores, rets, dates, n_jobs=2)
+
+        assert [r.horizon for r in threaded] == horizons
+        assert [r.mean_ic for r in threaded] == [r.mean_ic for r in serial]
+        assert threaded_decay.mean_ics == serial_decay.mean_ics
+
+
+class TestSpearmanRows:
+    def test_matches_scipy_spearmanr(self):
+        from scipy.stats import spearmanr
+        from backtest.factor_study.ic_analysis import _spearman_rows
+
+        rng = np.random.RandomState(3)
+        scores = np.round(rng.normal(size=(12, 15)), 1)  # 含并列
+        returns = rng.normal(size=(12, 15))
+        scores[rng.rand(12, 15) < 0.2] = np.nan
+        returns[0, :12] = np.nan  # 有效样本 < 5
+        scores[1] = 1.0  # 常数 → NaN
+
+        out = _spearman_rows(scores, returns, min_obs=5)
+
+        assert np.isnan(out[0])
+        assert np.isnan(out[1])
+        for t in range(2, 12):
+            mask = ~(np.isnan(scores[t]) | np.isnan(returns[t]))
+            expected, _ = spearmanr(scores[t][mask], returns[t][mask])
+            assert out[t] == pytest.approx(expected)
+
+
+class TestQuantileReturns:
+    def test_matches_qcut_reference(self):
+        """与逐日 pd.qcut(rank(method="first")) 参考实现一致 (含并列/NaN)"""
+        from backtest.factor_study.ic_analysis import _quantile_returns_from_arrays
+
+        rng = np.random.RandomState(5)
+        dates = [f"2024-01-{d:02d}" for d in range(1, 13)]
+        symbols = [f"S{i}" for i in range(17)]
+        scores = pd.DataFrame(
+            np.round(rng.normal(size=(12, 17)), 1), index=dates, columns=symbols,
+        ).mask(rng.rand(12, 17) < 0.2)
+        rets = pd.DataFrame(rng.normal(size=(12, 17)), index=dates, columns=symbols)
+
+        expected = {q: [] for q in range(1, 6)}
+        for d in dates:
+            mask = scores.loc[d].notna() & rets.loc[d].notna()
+            s, r = scores.loc[d][mask], rets.loc[d][mask]
+            labels = pd.qcut(s.rank(method="first"), q=5, labels=range(1, 6))
+            for q in range(1, 6):
+                expected[q].append(r[labels == q].mean())
+
+        result = _quantile_returns_from_arrays(scores.to_numpy(), rets.to_numpy(), 5)
+        assert len(result) == 5
+        for q in range(1, 6):
+            assert result[q - 1] == pytest.approx(np.mean(expected[q]))
+
+    def test_rank_bins_cached_and_read_only(self):
+        from backtest.factor_study.ic_analysis import _rank_bins
+
+        bins = _rank_bins(12, 5)
+        assert _rank_bins(12, 5) is bins
+        assert not bins.flags.writeable
+        assert bins.tolist() == (pd.qcut(np.arange(1, 13), 5, labels=False) + 1).tolist()
+
+
 class TestICResult:
     def test_dataclass_fields(self):
         ic = ICResult(
@@ -129,7 +256,7 @@ class TestICResult:
             n_ic_obs=20,
             t_stat=2.50,
             p_value=0.021,
-            quantile_returns={1: -0.01, 2: 0.0, 3: 0.005, 4: 0.01, 5: 0.02},
+            quantile_returns=(-0.01, 0.0, 0.005, 0.01, 0.02),
             top_bottom_spread=0.03,
         )
         assert ic.factor_name == "Test"
@@ -138,3 +265,9 @@ class TestICResult:
         assert ic.n_ic_obs == 20
         assert ic.t_stat == 2.50
         assert ic.p_value == 0.021
+
+    def test_slots_no_instance_dict(self):
+        ic = ICResult("Test", 5, 0.0, 0.0, 0.0, 0.0, 0, 0.0, 1.0, (0.0,) * 5, 0.0)
+        assert not hasattr(ic, "__dict__")
+        with pytest.raises(AttributeError):
+            ic.extra = 1
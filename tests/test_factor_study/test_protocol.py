@@ -5,6 +5,7 @@ Factor ABC + FactorMeta 测试
 import pytest
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 from backtest.factor_study.protocol import Factor, FactorMeta
@@ -42,6 +43,11 @@ class TestFactorMeta:
         meta = FactorMeta("X", "x", (0, 1), True, min_data_days=200)
         assert meta.min_data_days == 200
 
+    def test_frozen(self):
+        meta = FactorMeta("X", "x", (0, 1), True)
+        with pytest.raises(AttributeError):
+            meta.name = "Y"
+
 
 # ── 测试 Factor ABC ──────────────────────────────────────
 
@@ -84,3 +90,61 @@ class TestFactorABC:
     def test_cannot_instantiate_abstract(self):
         with pytest.raises(TypeError):
             Factor()
+
+    def test_subclass_without_meta_rejected(self):
+        class NoMetaFactor(Factor):
+            def compute(self, price_dict, date):
+                return {}
+
+        with pytest.raises(TypeError, match="meta"):
+            NoMetaFactor()
+
+    def test_abstract_subclass_may_defer_meta(self):
+        class Intermediate(Factor):
+            pass
+
+        class Concrete(Intermediate):
+            meta = FactorMeta("Concrete", "c", (0, 1), True)
+
+            def compute(self, price_dict, date):
+                return {}
+
+        assert Concrete().meta.name == "Concrete"
+
+    def test_registered_factors_share_class_meta(self):
+        from backtest.factor_study.factors import ALL_FACTORS, get_factor
+
+        for name, cls in ALL_FACTORS.items():
+            factor = get_factor(name)
+            assert factor.meta is cls.meta
+            assert factor.meta.name == name
+
+    def test_get_factor_reuses_instance(self, monkeypatch):
+        from backtest.factor_study import factors
+        from backtest.factor_study.factors import get_factor
+
+        first = get_factor("RS_Rating_B")
+        assert get_factor("RS_Rating_B") is first
+
+        monkeypatch.setattr(factors, "_INSTANCE_CACHE", {})
+        assert get_factor("RS_Rating_B") is not first
+
+        with pytest.raises(KeyError):
+            get_factor("NoSuchFactor")
+
+    def test_crypto_rs_accepts_arrays_and_frames(self):
+        from backtest.factor_study.factors import CryptoRSBFactor, CryptoRSCFactor
+
+        rng = np.random.RandomState(0)
+        arrays = {
+            f"S{i}USDT": 100 * np.exp(np.cumsum(rng.normal(0, 0.03, 30)))
+            for i in range(6)
+        }
+        frames = {sym: pd.DataFrame({"close": arr}) for sym, arr in arrays.items()}
+        lists = {sym: arr.tolist() for sym, arr in arrays.items()}
+
+        for factor in (CryptoRSBFactor(), CryptoRSCFactor()):
+            expected = factor.compute(arrays, "2024-01-30")
+            assert len(expected) == 6
+            assert factor.compute(frames, "2024-01-30") == expected
+            assert factor.compute(lists, "2024-01-30") == expected
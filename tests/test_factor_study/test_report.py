@@ -0,0 +1,232 @@
+"""
+因子研究报告测试 — HTML 渲染 / 缓存
+"""
+
+import csv
+import os
+
+import numpy as np
+
+from backtest.config import FactorStudyConfig
+from backtest.factor_study import report
+from backtest.factor_study.event_study import EventStudyResult
+from backtest.factor_study.ic_analysis import ICDecayCurve, ICResult
+from backtest.factor_study.runner import FactorStudyResults
+
+
+# ── 合成结果 ─────────────────────────────────────────────
+
+def _make_results(n_events=40, bench=""):
+    config = FactorStudyConfig(market="us_stocks", forward_horizons=[5, 10])
+    ic_results = [
+        ICResult(
+            factor_name="TestFactor", horizon=h, mean_ic=0.05, std_ic=0.1,
+            ic_ir=0.5, ic_hit_rate=0.6, n_ic_obs=50, t_stat=3.5, p_value=0.001,
+            quantile_returns=tuple(0.001 * q for q in range(1, 6)),
+            top_bottom_spread=0.004,
+        )
+        for h in (5, 10)
+    ]
+    event_results = [
+        EventStudyResult(
+            factor_name="TestFactor", signal_label=f"threshold_{i}",
+            horizon=5, n_events=10 + i, n_effective=8, mean_return=0.01,
+            median_return=0.008, hit_rate=0.6, t_stat=float(i % 7 - 3),
+            p_value=0.001 * (i + 1),
+        )
+        for i in range(n_events)
+    ]
+    return FactorStudyResults(
+        factor_name="TestFactor",
+        config=config,
+        benchmark_label=bench,
+        ic_results=ic_results,
+        ic_decay=ICDecayCurve("TestFactor", [5, 10], [0.05, 0.03]),
+        event_results=event_results,
+        is_dates=["2024-01-01", "2024-06-30"],
+        n_computation_dates=2,
+        n_symbols=20,
+    )
+
+
+# ── 测试 ─────────────────────────────────────────────────
+
+class TestHtmlCache:
+    def test_identical_results_reuse_cached_html(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+        calls = []
+        render = report._render_html_report
+        monkeypatch.setattr(
+            report, "_render_html_report",
+            lambda results: calls.append(1) or render(results),
+        )
+
+        first = report.generate_html_report([_make_results()], use_cache=True)
+        second = report.generate_html_report([_make_results()], use_cache=True)
+
+        assert second == first
+        assert len(calls) == 1
+        assert len(list(tmp_path.glob("*.html"))) == 1
+
+    def test_changed_results_rerender(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+
+        report.generate_html_report([_make_results()], use_cache=True)
+        report.generate_html_report([_make_results(n_events=5)], use_cache=True)
+
+        assert len(list(tmp_path.glob("*.html"))) == 2
+
+    def test_elapsed_seconds_ignored_in_cache_key(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+        calls = []
+        render = report._render_html_report
+        monkeypatch.setattr(
+            report, "_render_html_report",
+            lambda results: calls.append(1) or render(results),
+        )
+        first, second = _make_results(), _make_results()
+        first.elapsed_seconds, second.elapsed_seconds = 1.5, 42.0
+
+        report.generate_html_report([first], use_cache=True)
+        report.generate_html_report([second], use_cache=True)
+
+        assert len(calls) == 1
+
+    def test_render_version_invalidates_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+
+        report.generate_html_report([_make_results()], use_cache=True)
+        monkeypatch.setattr(report, "_RENDER_VERSION", "next")
+        report.generate_html_report([_make_results()], use_cache=True)
+
+        assert len(list(tmp_path.glob("*.html"))) == 2
+
+    def test_generated_at_filled_on_serve(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+
+        monkeypatch.setattr(report, "_generated_at", lambda: "2024-01-01 09:00")
+        first = report.generate_html_report([_make_results()], use_cache=True)
+        monkeypatch.setattr(report, "_generated_at", lambda: "2024-01-02 10:30")
+        second = report.generate_html_report([_make_results()], use_cache=True)
+
+        assert "生成时间: 2024-01-01 09:00" in first
+        assert "生成时间: 2024-01-02 10:30" in second
+        assert report._GENERATED_AT_MARK not in second
+        assert report._GENERATED_AT_MARK in next(tmp_path.glob("*.html")).read_text(
+            encoding="utf-8"
+        )
+
+    def test_cache_pruned_to_max_entries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(report, "_HTML_CACHE_MAX_ENTRIES", 2)
+
+        for n in (3, 4, 5):
+            report.generate_html_report([_make_results(n_events=n)], use_cache=True)
+
+        assert len(list(tmp_path.glob("*.html"))) == 2
+
+    def test_stale_cache_entries_pruned(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+        stale = tmp_path / "stale.html"
+        stale.write_text("old", encoding="utf-8")
+        old = stale.stat().st_mtime - (report._HTML_CACHE_MAX_AGE_DAYS + 1) * 86400
+        os.utime(stale, (old, old))
+
+        report.generate_html_report([_make_results()], use_cache=True)
+
+        assert not stale.exists()
+        assert len(list(tmp_path.glob("*.html"))) == 1
+
+    def test_cache_off_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_HTML_CACHE_DIR", tmp_path)
+
+        html = report.generate_html_report([_make_results()])
+
+        assert "TestFactor" in html
+        assert not list(tmp_path.iterdir())
+
+
+class TestCsvExport:
+    def test_export_csv_streams_rows(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(report, "_OUTPUT_DIR", tmp_path)
+        results = _make_results(n_events=12, bench="QQQ")
+        results.ic_results[0].quantile_returns = (float("nan"), 0.2)
+
+        report.export_csv(results)
+
+        ic_file = next(tmp_path.glob("ic_TestFactor_QQQ_*.csv"))
+        with open(ic_file, newline="") as fp:
+            rows = list(csv.DictReader(fp))
+        assert len(rows) == 2
+        assert rows[0]["Q1_return"] == ""        # NaN → 空串
+        assert rows[0]["Q5_return"] == ""        # 分位数不足 → 空串
+        assert rows[1]["Q5_return"] == "0.005"
+
+        ev_file = next(tmp_path.glob("events_TestFactor_QQQ_*.csv"))
+        with open(ev_file, newline="") as fp:
+            ev_rows = list(csv.DictReader(fp))
+        assert len(ev_rows) == 12
+        assert ev_rows[0]["p_fdr"] != ""
+
+
+class TestEventTableSelection:
+    def test_matches_sorted_reference(self):
+        events = _make_results(n_events=60).event_results
+        p_fdr = report._apply_bh_fdr([ev.p_value for ev in events])
+
+        idx = report._display_event_indices(events, p_fdr)
+
+        significant = [
+            i for i in range(len(events))
+            if p_fdr[i] < 0.10 and events[i].n_events >= 5
+        ]
+        expected = sorted(
+            significant, key=lambda i: abs(events[i].t_stat), reverse=True,
+        )[:30]
+        assert idx.tolist() == expected
+
+    def test_falls_back_to_top20_by_t(self):
+        events = _make_results(n_events=40).event_results
+        p_fdr = [0.5] * len(events)
+
+        idx = report._display_event_indices(events, p_fdr)
+
+        expected = sorted(
+            range(len(events)), key=lambda i: abs(events[i].t_stat), reverse=True,
+        )[:20]
+        assert idx.tolist() == expected
+
+    def test_top_k_keeps_stable_tie_order(self):
+        abs_t = [1.0, 3.0, 2.0, 3.0, 2.0, 2.0, 0.5]
+        for k in (1, 2, 3, 4, 10):
+            expected = sorted(
+                range(len(abs_t)), key=lambda i: abs_t[i], reverse=True,
+            )[:k]
+            idx = report._top_k_by_abs(np.array(abs_t), k)
+            assert idx.tolist() == expected
+
+
+class TestHtmlEscaping:
+    def test_names_are_escaped(self):
+        results = _make_results(n_events=3, bench="QQQ")
+        results.ic_results[0].factor_name = "A<b>&c"
+        results.event_results[0].signal_label = "x<y"
+
+        html = report._render_html_report([results])
+
+        assert "A&lt;b&gt;&amp;c" in html
+        assert "x&lt;y" in html
+        assert "A<b>" not in html
+
+
+class TestChartData:
+    def test_decay_chart_emits_json(self):
+        results = _make_results()
+        results.factor_name = "It's"
+        results.ic_decay = ICDecayCurve("It's", [5, 10], [0.05, float("nan")])
+
+        js = report._build_decay_chart([results])
+
+        assert 'label: "It\'s"' in js
+        assert "data: [0.05, null]" in js
+        assert "labels: [5, 10]" in js
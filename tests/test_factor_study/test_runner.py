@@ -256,3 +256,90 @@ class TestFactorStudyRunner:
 
         results = runner.run()
         assert len(results) == 2
+
+    def test_slices_once_per_date_for_all_factors(self):
+        """多因子共用每个计算日期的切片，结果与单因子运行一致"""
+        config = FactorStudyConfig(
+            market="us_stocks",
+            computation_freq="W",
+            forward_horizons=[5],
+        )
+
+        class CountingAdapter(MockAdapter):
+            n_slices = 0
+
+            def slice_to_date(self, date: str):
+                CountingAdapter.n_slices += 1
+                return super().slice_to_date(date)
+
+        adapter = CountingAdapter()
+        runner = FactorStudyRunner(config, adapter)
+        runner.add_factor(RankFactor())
+        runner.add_factor(RankFactor())
+        results = runner.run()
+
+        n_dates = results[0].n_computation_dates
+        assert CountingAdapter.n_slices == n_dates
+
+        single = FactorStudyRunner(config, MockAdapter())
+        single.add_factor(RankFactor())
+        expected = single.run()[0]
+        for r in results:
+            assert [x.mean_ic for x in r.ic_results] == [
+                x.mean_ic for x in expected.ic_results
+            ]
+
+
+class TestScoreTable:
+    def test_grows_and_keeps_first_seen_order(self):
+        from backtest.factor_study.runner import _ScoreTable
+
+        dates = ["d1", "d2", "d3"]
+        table = _ScoreTable(len(dates), capacity=1)
+        table.add(0, {"B": 1.0, "A": 2.0})
+        table.add(2, {"C": 3.0, "A": float("nan")})
+
+        assert table.symbols == ["B", "A", "C"]
+
+        arrays = table.to_arrays(dates)
+        # 未出现的日期不进 SoA 历史；出现但为 NaN 的分数保留
+        assert arrays["B"][0] == ["d1"]
+        assert arrays["A"][0] == ["d1", "d3"]
+        assert np.isnan(arrays["A"][1][1])
+
+        frame = table.to_frame(dates)
+        assert frame.index.name == "date"
+        assert list(frame.columns) == ["B", "A", "C"]
+        assert frame.loc["d3", "C"] == 3.0
+        assert np.isnan(frame.loc["d2", "B"])
+
+
+class TestParallelFactors:
+    def test_process_pool_matches_serial(self):
+        """config.n_jobs > 1 按因子分发到进程池，结果与顺序同串行"""
+        sweep = [
+            SignalDefinition(SignalType.THRESHOLD, 70),
+            SignalDefinition(SignalType.CROSS_UP, 50),
+        ]
+        results = []
+        for n_jobs in (1, 2):
+            config = FactorStudyConfig(
+                market="us_stocks",
+                computation_freq="W",
+                forward_horizons=[5, 10],
+                benchmark_symbols=["SPY"],
+                n_jobs=n_jobs,
+            )
+            runner = FactorStudyRunner(config, MockAdapter())
+            runner.add_factor(RankFactor())
+            runner.add_factor(RankFactor())
+            runner.set_sweep("TestRank", sweep)
+            results.append(runner.run())
+
+        serial, parallel = results
+        assert len(parallel) == len(serial) == 2
+        for s, p in zip(serial, parallel):
+            assert p.factor_name == s.factor_name
+            assert p.benchmark_label == s.benchmark_label
+            assert p.ic_results == s.ic_results
+            assert p.event_results == s.event_results
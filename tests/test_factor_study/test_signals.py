@@ -8,7 +8,9 @@ from backtest.factor_study.signals import (
     SignalType,
     SignalDefinition,
     detect_signals,
+    detect_signals_batch,
 )
+from backtest.factor_study.protocol import score_arrays
 
 
 # ── 测试数据 ─────────────────────────────────────────────
@@ -33,6 +35,20 @@ class TestSignalDefinition:
         sd = SignalDefinition(SignalType.SUSTAINED, 70, sustained_n=5)
         assert sd.label() == "sustained_70x5"
 
+    def test_frozen_and_hashable(self):
+        sd = SignalDefinition(SignalType.THRESHOLD, 90)
+        with pytest.raises(AttributeError):
+            sd.threshold = 80
+        assert {sd: 1}[SignalDefinition(SignalType.THRESHOLD, 90)] == 1
+
+    def test_default_sweep_cached(self):
+        from backtest.factor_study.sweep import get_default_sweep
+
+        sweep = get_default_sweep("PMARP")
+        assert isinstance(sweep, tuple) and len(sweep) > 0
+        assert get_default_sweep("PMARP") is sweep
+        assert get_default_sweep("NoSuchFactor") == ()
+
 
 # ── THRESHOLD 信号 ───────────────────────────────────────
 
@@ -130,6 +146,25 @@ class TestSustainedSignal:
         events = detect_signals(history, sig)
         assert "AAPL" not in events
 
+    def test_oscillating_matches_streak_counter(self):
+        """分数围绕阈值震荡 (含 NaN) 时与逐日计数参考实现一致"""
+        import random
+
+        rng = random.Random(7)
+        scores = [rng.choice([70, 85, 90, float("nan")]) for _ in range(200)]
+        scores[-4:] = [85, 85, 85, 85]  # 连续段延伸到末尾
+        history = _make_history(scores)
+
+        for n in (1, 2, 3, 4):
+            expected, streak = [], 0
+            for d, score in history:
+                streak = streak + 1 if score > 80 else 0
+                if streak == n:
+                    expected.append(d)
+            sig = SignalDefinition(SignalType.SUSTAINED, 80, sustained_n=n)
+            events = detect_signals({"AAPL": history}, sig)
+            assert events.get("AAPL", []) == expected
+
 
 # ── 多股票测试 ───────────────────────────────────────────
 
@@ -143,3 +178,63 @@ class TestMultipleSymbols:
         events = detect_signals(history, sig)
         assert "AAPL" in events
         assert "MSFT" not in events
+
+
+# ── SoA 输入 ────────────────────────────────────────────
+
+class TestScoreArrays:
+    def test_soa_matches_tuples(self):
+        history = {
+            "AAPL": _make_history([50, 95, 96, 97, 40, 91]),
+            "MSFT": _make_history([float("nan"), 92, 93, 94]),
+            "EMPTY": [],
+        }
+        arrays = {sym: score_arrays(h) for sym, h in history.items()}
+
+        for sig in (
+            SignalDefinition(SignalType.THRESHOLD, 90),
+            SignalDefinition(SignalType.CROSS_UP, 90),
+            SignalDefinition(SignalType.CROSS_DOWN, 90),
+            SignalDefinition(SignalType.SUSTAINED, 90, sustained_n=3),
+        ):
+            assert detect_signals(arrays, sig) == detect_signals(history, sig)
+
+    def test_batch_matches_single(self):
+        history = {
+            "AAPL": _make_history([50, 95, 96, 97, 40, 91, 20]),
+            "MSFT": _make_history([95, float("nan"), 85, 93, 5, 94]),
+        }
+        # 同一阈值 90 被多个信号类型共用
+        sweep = [
+            SignalDefinition(SignalType.THRESHOLD, 90),
+            SignalDefinition(SignalType.CROSS_UP, 90),
+            SignalDefinition(SignalType.CROSS_DOWN, 90),
+            SignalDefinition(SignalType.SUSTAINED, 90, sustained_n=2),
+            SignalDefinition(SignalType.CROSS_DOWN, 10),
+        ]
+
+        batch = detect_signals_batch(history, sweep)
+
+        assert batch == [detect_signals(history, sig) for sig in sweep]
+
+    def test_out_of_range_thresholds_skipped(self, monkeypatch):
+        from backtest.factor_study import signals
+
+        calls = []
+        detect = signals._detect_for_symbol
+        monkeypatch.setattr(
+            signals, "_detect_for_symbol",
+            lambda d, m, sd: calls.append(sd) or detect(d, m, sd),
+        )
+        history = {"AAPL": _make_history([10, 50, 30]), "MSFT": _make_history([20, 40])}
+        defs = [
+            SignalDefinition(SignalType.THRESHOLD, 50),    # 无 score > 50
+            SignalDefinition(SignalType.CROSS_DOWN, 10),   # 无 score < 10
+            SignalDefinition(SignalType.CROSS_UP, 45),
+        ]
+
+        result = detect_signals_batch(history, defs)
+
+        assert result[:2] == [{}, {}]
+        assert result[2] == {"AAPL": ["2024-01-02"]}
+        assert {sd.threshold for sd in calls} == {45}
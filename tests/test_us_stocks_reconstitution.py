@@ -87,3 +87,21 @@ def test_no_filter_without_threshold():
     sliced = adapter.slice_to_date("2024-03-01")
     assert "A" in sliced
     assert "B" in sliced
+
+
+def test_load_prices_reverses_descending_store_output():
+    """market_store 降序输出 → 反转为升序, 不依赖排序"""
+    dates = pd.to_datetime([f"2024-01-{d:02d}" for d in range(2, 12)])
+    desc = pd.DataFrame({"date": dates[::-1], "close": range(10, 0, -1)})
+
+    class _Store:
+        def get_daily_prices_df(self, symbol):
+            return desc
+
+    adapter = USStocksAdapter(symbols=["X"])
+    with patch("backtest.adapters.us_stocks._get_market_store", return_value=_Store()):
+        df = adapter._load_prices("X")
+
+    assert df["date"].is_monotonic_increasing
+    assert df["close"].tolist() == list(range(1, 11))
+    assert df.index.tolist() == list(range(10))